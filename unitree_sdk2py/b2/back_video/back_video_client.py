@@ -20,4 +20,7 @@ class BackVideoClient(Client):
 
     # 1001
     def GetImageSample(self):
-        return self._CallBinary(ROBOT_BACK_VIDEO_API_ID_GETIMAGESAMPLE, [])
+        return self.GetImageSampleAsync().GetResult()
+
+    def GetImageSampleAsync(self):
+        return self._CallBinaryAsync(ROBOT_BACK_VIDEO_API_ID_GETIMAGESAMPLE, b"")
@@ -20,4 +20,7 @@ class FrontVideoClient(Client):
 
     # 1001
     def GetImageSample(self):
-        return self._CallBinary(ROBOT_FRONT_VIDEO_API_ID_GETIMAGESAMPLE, [])
+        return self.GetImageSampleAsync().GetResult()
+
+    def GetImageSampleAsync(self):
+        return self._CallBinaryAsync(ROBOT_FRONT_VIDEO_API_ID_GETIMAGESAMPLE, b"")
@@ -29,12 +29,18 @@ class RobotStateClient(Client):
         self._RegistApi(ROBOT_STATE_API_ID_REPORT_FREQ, 0)
         self._RegistApi(ROBOT_STATE_API_ID_SERVICE_LIST, 0)
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(ROBOT_STATE_API_ID_SERVICE_LIST, [ROBOT_STATE_API_ID_SERVICE_SWITCH])
+
     def ServiceList(self):
+        return self.ServiceListAsync().GetResult()
+
+    def ServiceListAsync(self):
         p = {}
         parameter = json.dumps(p)
+        return self._CallAsync(ROBOT_STATE_API_ID_SERVICE_LIST, parameter, self.__ParseServiceList)
 
-        code, data = self._Call(ROBOT_STATE_API_ID_SERVICE_LIST, parameter)
-
+    def __ParseServiceList(self, code: int, data: str):
         if code != 0:
             return code, None
 
@@ -52,33 +58,37 @@ class RobotStateClient(Client):
             
 
     def ServiceSwitch(self, name: str, switch: bool):
+        return self.ServiceSwitchAsync(name, switch).GetResult()[0]
+
+    def ServiceSwitchAsync(self, name: str, switch: bool):
         p = {}
         p["name"] = name
         p["switch"] = int(switch)
         parameter = json.dumps(p)
-        
-        code, data = self._Call(ROBOT_STATE_API_ID_SERVICE_SWITCH, parameter)
-        
+        return self._CallAsync(ROBOT_STATE_API_ID_SERVICE_SWITCH, parameter, self.__ParseServiceSwitch)
+
+    def __ParseServiceSwitch(self, code: int, data: str):
         if code != 0:
-            return code
+            return code, None
       
         d = json.loads(data)
 
         status = d["status"]
     
         if status == 5:
-            return ROBOT_STATE_ERR_SERVICE_PROTECTED
+            return ROBOT_STATE_ERR_SERVICE_PROTECTED, None
 
         if status != 0 and status != 1:
-            return ROBOT_STATE_ERR_SERVICE_SWITCH
+            return ROBOT_STATE_ERR_SERVICE_SWITCH, None
         
-        return code
+        return code, None
 
     def SetReportFreq(self, interval: int, duration: int):
+        return self.SetReportFreqAsync(interval, duration).GetResult()[0]
+
+    def SetReportFreqAsync(self, interval: int, duration: int):
         p = {}
         p["interval"] = interval
         p["duration"] = duration
         parameter = json.dumps(p)
-        
-        code, data = self._Call(ROBOT_STATE_API_ID_REPORT_FREQ, p)
-        return code
+        return self._CallAsync(ROBOT_STATE_API_ID_REPORT_FREQ, parameter)
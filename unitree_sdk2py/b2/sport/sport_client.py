@@ -1,6 +1,8 @@
 import json
 
 from ...rpc.client import Client
+from ...rpc.command_stream import CommandStream, COMMAND_STREAM_RATE, COMMAND_STREAM_TIMEOUT
+from ...rpc.param_codec import ParamTemplate
 from .sport_api import *
 
 """
@@ -9,6 +11,12 @@ from .sport_api import *
 SPORT_PATH_POINT_SIZE = 30
 
 
+"""
+" precompiled parameters of the streamed commands
+"""
+SPORT_PARAM_XYZ = ParamTemplate(("x", float), ("y", float), ("z", float))
+
+
 """
 " class PathPoint
 """
@@ -59,70 +67,90 @@ class SportClient(Client):
         self._RegistApi(ROBOT_SPORT_API_ID_FREEEULER, 0)
 
     def Damp(self):
+        return self.DampAsync().GetResult()[0]
+
+    def DampAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_DAMP, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_DAMP, parameter)
 
     def BalanceStand(self):
+        return self.BalanceStandAsync().GetResult()[0]
+
+    def BalanceStandAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_BALANCESTAND, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_BALANCESTAND, parameter)
 
     def StopMove(self):
+        return self.StopMoveAsync().GetResult()[0]
+
+    def StopMoveAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_STOPMOVE, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_STOPMOVE, parameter)
 
     def StandUp(self):
+        return self.StandUpAsync().GetResult()[0]
+
+    def StandUpAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_STANDUP, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_STANDUP, parameter)
 
     def StandDown(self):
+        return self.StandDownAsync().GetResult()[0]
+
+    def StandDownAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_STANDDOWN, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_STANDDOWN, parameter)
 
     def RecoveryStand(self):
+        return self.RecoveryStandAsync().GetResult()[0]
+
+    def RecoveryStandAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_RECOVERYSTAND, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_RECOVERYSTAND, parameter)
 
     def Move(self, vx: float, vy: float, vyaw: float):
-        p = {}
-        p["x"] = vx
-        p["y"] = vy
-        p["z"] = vyaw
-        parameter = json.dumps(p)
+        parameter = SPORT_PARAM_XYZ.Encode(vx, vy, vyaw)
         code = self._CallNoReply(ROBOT_SPORT_API_ID_MOVE, parameter)
         return code
 
+    # latest wins Move at a fixed rate for joysticks and planners, started. see CommandStream.
+    def MoveStream(self, rate: float = COMMAND_STREAM_RATE, timeout: float = COMMAND_STREAM_TIMEOUT):
+        stream = CommandStream(self.Move, rate, (0.0, 0.0, 0.0), timeout, name="move_stream")
+        stream.Start()
+        return stream
+
     def SwitchGait(self, t: int):
+        return self.SwitchGaitAsync(t).GetResult()[0]
+
+    def SwitchGaitAsync(self, t: int):
         p = {}
         p["data"] = t
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_SWITCHGAIT, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_SWITCHGAIT, parameter)
 
     def BodyHeight(self, height: float):
+        return self.BodyHeightAsync(height).GetResult()[0]
+
+    def BodyHeightAsync(self, height: float):
         p = {}
         p["data"] = height
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_BODYHEIGHT, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_BODYHEIGHT, parameter)
 
     def SpeedLevel(self, level: int):
+        return self.SpeedLevelAsync(level).GetResult()[0]
+
+    def SpeedLevelAsync(self, level: int):
         p = {}
         p["data"] = level
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_SPEEDLEVEL, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_SPEEDLEVEL, parameter)
 
     def TrajectoryFollow(self, path: list):
         l = len(path)
@@ -147,73 +175,93 @@ class SportClient(Client):
         return code
 
     def ContinuousGait(self, flag: int):
+        return self.ContinuousGaitAsync(flag).GetResult()[0]
+
+    def ContinuousGaitAsync(self, flag: int):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_CONTINUOUSGAIT, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_CONTINUOUSGAIT, parameter)
 
     def MoveToPos(self, x: float, y: float, yaw: float):
+        return self.MoveToPosAsync(x, y, yaw).GetResult()[0]
+
+    def MoveToPosAsync(self, x: float, y: float, yaw: float):
         p = {}
         p["x"] = x
         p["y"] = y
         p["yaw"] = yaw
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_MOVETOPOS, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_MOVETOPOS, parameter)
 
     def SwitchMoveMode(self, flag: bool):
+        return self.SwitchMoveModeAsync(flag).GetResult()[0]
+
+    def SwitchMoveModeAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_SWITCHMOVEMODE, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_SWITCHMOVEMODE, parameter)
     
     def VisionWalk(self, flag: bool):
+        return self.VisionWalkAsync(flag).GetResult()[0]
+
+    def VisionWalkAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_VISIONWALK, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_VISIONWALK, parameter)
     
     def HandStand(self, flag: int):
+        return self.HandStandAsync(flag).GetResult()[0]
+
+    def HandStandAsync(self, flag: int):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_HANDSTAND, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_HANDSTAND, parameter)
     
     def AutoRecoverySet(self, flag: int):
+        return self.AutoRecoverySetAsync(flag).GetResult()[0]
+
+    def AutoRecoverySetAsync(self, flag: int):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_AUTORECOVERY_SET, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_AUTORECOVERY_SET, parameter)
     
     def FreeWalk(self):
+        return self.FreeWalkAsync().GetResult()[0]
+
+    def FreeWalkAsync(self):
         p = {}
         p["data"] = True ## default
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_FREEWALK, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_FREEWALK, parameter)
     
     def ClassicWalk(self, flag: bool):
+        return self.ClassicWalkAsync(flag).GetResult()[0]
+
+    def ClassicWalkAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_CLASSICWALK, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_CLASSICWALK, parameter)
     
     def FastWalk(self, flag: bool):
+        return self.FastWalkAsync(flag).GetResult()[0]
+
+    def FastWalkAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_FASTWALK, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_FASTWALK, parameter)
     
     def FreeEuler(self, flag: bool):
+        return self.FreeEulerAsync(flag).GetResult()[0]
+
+    def FreeEulerAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_SPORT_API_ID_FREEEULER, parameter)
-        return code
+        return self._CallAsync(ROBOT_SPORT_API_ID_FREEEULER, parameter)
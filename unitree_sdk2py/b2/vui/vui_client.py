@@ -22,21 +22,32 @@ class VuiClient(Client):
         self._RegistApi(VUI_API_ID_SETBRIGHTNESS, 0)
         self._RegistApi(VUI_API_ID_GETBRIGHTNESS, 0)
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(VUI_API_ID_GETSWITCH, [VUI_API_ID_SETSWITCH])
+        self._RegistCacheInvalidation(VUI_API_ID_GETVOLUME, [VUI_API_ID_SETVOLUME])
+        self._RegistCacheInvalidation(VUI_API_ID_GETBRIGHTNESS, [VUI_API_ID_SETBRIGHTNESS])
+
     # 1001
     def SetSwitch(self, enable: int):
+        return self.SetSwitchAsync(enable).GetResult()[0]
+
+    def SetSwitchAsync(self, enable: int):
         p = {}
         p["enable"] = enable
         parameter = json.dumps(p)
 
-        code, data = self._Call(VUI_API_ID_SETSWITCH, parameter)
-        return code
+        return self._CallAsync(VUI_API_ID_SETSWITCH, parameter)
 
     # 1002
     def GetSwitch(self):
+        return self.GetSwitchAsync().GetResult()
+
+    def GetSwitchAsync(self):
         p = {}
         parameter = json.dumps(p)
+        return self._CallAsync(VUI_API_ID_GETSWITCH, parameter, self.__ParseSwitch)
 
-        code, data = self._Call(VUI_API_ID_GETSWITCH, parameter)
+    def __ParseSwitch(self, code: int, data: str):
         if code == 0:
             d = json.loads(data)
             return code, d["enable"]
@@ -45,19 +56,25 @@ class VuiClient(Client):
 
     # 1003
     def SetVolume(self, level: int):
+        return self.SetVolumeAsync(level).GetResult()[0]
+
+    def SetVolumeAsync(self, level: int):
         p = {}
         p["volume"] = level
         parameter = json.dumps(p)
 
-        code, data = self._Call(VUI_API_ID_SETVOLUME, parameter)
-        return code
+        return self._CallAsync(VUI_API_ID_SETVOLUME, parameter)
 
     # 1006
     def GetVolume(self):
+        return self.GetVolumeAsync().GetResult()
+
+    def GetVolumeAsync(self):
         p = {}
         parameter = json.dumps(p)
+        return self._CallAsync(VUI_API_ID_GETVOLUME, parameter, self.__ParseVolume)
 
-        code, data = self._Call(VUI_API_ID_GETVOLUME, parameter)
+    def __ParseVolume(self, code: int, data: str):
         if code == 0:
             d = json.loads(data)
             return code, d["volume"]
@@ -66,19 +83,25 @@ class VuiClient(Client):
 
     # 1005
     def SetBrightness(self, level: int):
+        return self.SetBrightnessAsync(level).GetResult()[0]
+
+    def SetBrightnessAsync(self, level: int):
         p = {}
         p["brightness"] = level
         parameter = json.dumps(p)
 
-        code, data = self._Call(VUI_API_ID_SETBRIGHTNESS, parameter)
-        return code
+        return self._CallAsync(VUI_API_ID_SETBRIGHTNESS, parameter)
 
     # 1006
     def GetBrightness(self):
+        return self.GetBrightnessAsync().GetResult()
+
+    def GetBrightnessAsync(self):
         p = {}
         parameter = json.dumps(p)
+        return self._CallAsync(VUI_API_ID_GETBRIGHTNESS, parameter, self.__ParseBrightness)
 
-        code, data = self._Call(VUI_API_ID_GETBRIGHTNESS, parameter)
+    def __ParseBrightness(self, code: int, data: str):
         if code == 0:
             d = json.loads(data)
             return code, d["brightness"]
@@ -0,0 +1,75 @@
+import json
+import time
+import argparse
+
+from ..rpc.param_codec import ParamTemplate, JsonDumps, JsonLoads, GetJsonBackend, SetJsonBackend
+
+"""
+" per call overhead of the rpc parameter encoding. compares the dict + json.dumps path the
+" clients used before with the precompiled templates and the selected json backend.
+"
+" usage: python -m unitree_sdk2py.bench.codec [--count 200000] [--backend json]
+"""
+
+MOVE = ParamTemplate(("x", float), ("y", float), ("z", float))
+VELOCITY = ParamTemplate(("velocity", [float, float, float]), ("duration", float))
+
+def Measure(func, count: int):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    return (time.perf_counter() - start) / count * 1e9
+
+def DictMove(i: int):
+    p = {}
+    p["x"] = 0.3
+    p["y"] = 0.0
+    p["z"] = 0.1 * i
+    return json.dumps(p)
+
+def TemplateMove(i: int):
+    return MOVE.Encode(0.3, 0.0, 0.1 * i)
+
+def BackendMove(i: int):
+    return JsonDumps({"x": 0.3, "y": 0.0, "z": 0.1 * i})
+
+def DictVelocity(i: int):
+    p = {}
+    p["velocity"] = [0.3, 0.0, 0.1 * i]
+    p["duration"] = 1.0
+    return json.dumps(p)
+
+def TemplateVelocity(i: int):
+    return VELOCITY.Encode(0.3, 0.0, 0.1 * i, 1.0)
+
+def BackendVelocity(i: int):
+    return JsonDumps({"velocity": [0.3, 0.0, 0.1 * i], "duration": 1.0})
+
+RESPONSE = json.dumps({"data": 1, "name": "loco", "list": list(range(16))})
+
+def StdlibLoads(i: int):
+    return json.loads(RESPONSE)
+
+def BackendLoads(i: int):
+    return JsonLoads(RESPONSE)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="rpc parameter codec per call overhead")
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--backend", type=str, default=None, help="json (the default), orjson or ujson")
+    args = parser.parse_args()
+
+    if args.backend is not None and not SetJsonBackend(args.backend):
+        raise SystemExit(1)
+
+    assert json.loads(TemplateMove(7)) == json.loads(DictMove(7))
+    assert json.loads(TemplateVelocity(7)) == json.loads(DictVelocity(7))
+
+    print("json backend:", GetJsonBackend())
+    print("{:<16} {:>14} {:>14} {:>14}".format("case", "json(ns)", "template(ns)", "backend(ns)"))
+    print("{:<16} {:>14.0f} {:>14.0f} {:>14.0f}".format("move", Measure(DictMove, args.count),
+                                                       Measure(TemplateMove, args.count), Measure(BackendMove, args.count)))
+    print("{:<16} {:>14.0f} {:>14.0f} {:>14.0f}".format("velocity", Measure(DictVelocity, args.count),
+                                                       Measure(TemplateVelocity, args.count), Measure(BackendVelocity, args.count)))
+    print("{:<16} {:>14.0f} {:>14} {:>14.0f}".format("response loads", Measure(StdlibLoads, args.count), "-",
+                                                    Measure(BackendLoads, args.count)))
@@ -0,0 +1,94 @@
+import time
+import argparse
+
+from ..core.channel import ChannelFactoryInitialize, ChannelPublisher, ChannelSubscriber
+from ..core.channel_config import ChannelConfig
+from ..core.channel_qos import CHANNEL_QOS_PROFILES
+from ..idl.std_msgs.msg.dds_ import String_
+
+"""
+" loopback latency benchmark of the channel qos profiles.
+" every profile runs a ping/pong pair in this process and reports the round trip time.
+"
+" usage: python -m unitree_sdk2py.bench.qos [--interface lo] [--count 2000] [--size 64]
+"""
+
+def Percentile(values: list, p: float):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))
+    return values[index]
+
+def RunProfile(profile: str, count: int, size: int, timeout: float):
+    pingName = "rt/bench/qos/" + profile + "/ping"
+    pongName = "rt/bench/qos/" + profile + "/pong"
+
+    pongPub = ChannelPublisher(pongName, String_, profile)
+    pongPub.Init()
+    pingSub = ChannelSubscriber(pingName, String_, profile)
+    pingSub.Init(lambda sample: pongPub.Write(sample))
+
+    pingPub = ChannelPublisher(pingName, String_, profile)
+    pingPub.Init()
+    pongSub = ChannelSubscriber(pongName, String_, profile)
+    pongSub.InitMailbox()
+
+    if not pingPub.WaitForMatched(1, 2.0) or not pongPub.WaitForMatched(1, 2.0):
+        print("[bench.qos] profile:", profile, "publication not matched")
+        return None
+
+    padding = "x" * size
+    latencies = []
+    lost = 0
+    seq = 0
+
+    for i in range(count):
+        sample = String_(str(i) + ":" + padding)
+        start = time.perf_counter()
+        pingPub.Write(sample)
+
+        while True:
+            item = pongSub.WaitNewer(seq, timeout)
+            if item is None:
+                lost += 1
+                break
+            seq = item[0]
+            if item[2].data.startswith(str(i) + ":"):
+                latencies.append((time.perf_counter() - start) * 1e6)
+                break
+
+    pingSub.Close()
+    pongSub.Close()
+    pingPub.Close()
+    pongPub.Close()
+
+    return latencies, lost
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="channel qos profile loopback latency")
+    parser.add_argument("--domain", type=int, default=0)
+    parser.add_argument("--interface", type=str, default="lo")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=64, help="payload bytes per sample")
+    parser.add_argument("--timeout", type=float, default=0.1, help="per sample timeout in seconds")
+    parser.add_argument("--profiles", type=str, default=",".join(CHANNEL_QOS_PROFILES.keys()))
+    args = parser.parse_args()
+
+    if args.interface == "lo":
+        ChannelFactoryInitialize(args.domain, config=ChannelConfig().SetLoopbackOnly())
+    else:
+        ChannelFactoryInitialize(args.domain, args.interface)
+
+    print("{:<10} {:>8} {:>6} {:>10} {:>10} {:>10} {:>10}".format(
+        "profile", "samples", "lost", "p50(us)", "p99(us)", "p999(us)", "max(us)"))
+
+    for profile in args.profiles.split(","):
+        result = RunProfile(profile, args.count, args.size, args.timeout)
+        if result is None:
+            continue
+        latencies, lost = result
+        print("{:<10} {:>8} {:>6} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+            profile, len(latencies), lost,
+            Percentile(latencies, 50), Percentile(latencies, 99), Percentile(latencies, 99.9),
+            max(latencies) if latencies else 0.0))
@@ -0,0 +1,212 @@
+import time
+import random
+import argparse
+import threading
+
+from ..core.channel import ChannelFactoryInitialize
+from ..core.channel_config import ChannelConfig
+from ..core.channel_inproc import CHANNEL_TRANSPORT_DDS, CHANNEL_TRANSPORT_INPROC
+from ..rpc.client import Client
+from ..rpc.server import Server
+from ..rpc.server_stub import SERVER_QUEUE_LEN, SERVER_PRIO_QUEUE_LEN
+from .qos import Percentile
+
+"""
+" rpc load generator. stands up an echo server in this process and drives it with closed loop
+" caller threads, or at a fixed total rate, over a local dds domain or the in-process transport.
+" reports throughput, latency percentiles per call kind and the server queue counters.
+"
+" usage: python -m unitree_sdk2py.bench.rpc [--transport inproc] [--concurrency 8] [--duration 5]
+"        [--size 64] [--binary-size 4096 --binary-ratio 0.2] [--prio-ratio 0.1] [--noreply-ratio 0.1]
+"""
+
+BENCH_SERVICE_NAME = "bench_rpc"
+
+BENCH_API_ID_ECHO = 1001
+BENCH_API_ID_ECHO_PRIO = 1002
+BENCH_API_ID_BINARY = 1003
+
+BENCH_KINDS = ["json", "prio", "binary", "noreply"]
+
+class BenchServer(Server):
+    def __init__(self, work: float):
+        super().__init__(BENCH_SERVICE_NAME)
+        self.__work = work
+
+    def Init(self):
+        self._RegistHandler(BENCH_API_ID_ECHO, self.Echo, False)
+        self._RegistHandler(BENCH_API_ID_ECHO_PRIO, self.Echo, False)
+        self._RegistBinaryHandler(BENCH_API_ID_BINARY, self.EchoBinary, False)
+
+    def Echo(self, parameter: str):
+        if self.__work > 0:
+            time.sleep(self.__work)
+        return 0, parameter
+
+    def EchoBinary(self, binary: bytes):
+        if self.__work > 0:
+            time.sleep(self.__work)
+        return 0, binary
+
+class BenchClient(Client):
+    def __init__(self):
+        super().__init__(BENCH_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistApi(BENCH_API_ID_ECHO, 0)
+        self._RegistApi(BENCH_API_ID_ECHO_PRIO, 1)
+        self._RegistApi(BENCH_API_ID_BINARY, 0)
+
+    def Echo(self, parameter: str):
+        return self._Call(BENCH_API_ID_ECHO, parameter)[0]
+
+    def EchoPrio(self, parameter: str):
+        return self._Call(BENCH_API_ID_ECHO_PRIO, parameter)[0]
+
+    def EchoBinary(self, binary: bytes):
+        return self._CallBinary(BENCH_API_ID_BINARY, binary)[0]
+
+    def EchoNoReply(self, parameter: str):
+        return self._CallNoReply(BENCH_API_ID_ECHO, parameter)
+
+def NewResult():
+    return {kind: {"latencies": [], "codes": {}} for kind in BENCH_KINDS}
+
+def RunWorker(client: BenchClient, args, deadline: float, interval: float, seed: int, result: dict):
+    rng = random.Random(seed)
+    parameter = '{"data": "' + "x" * args.size + '"}'
+    binary = bytes(args.binary_size)
+    due = time.monotonic()
+
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            break
+
+        if interval > 0:
+            if due > now:
+                time.sleep(due - now)
+            due += interval
+
+        r = rng.random()
+        start = time.perf_counter()
+        if r < args.noreply_ratio:
+            kind = "noreply"
+            code = client.EchoNoReply(parameter)
+        elif r < args.noreply_ratio + args.binary_ratio:
+            kind = "binary"
+            code = client.EchoBinary(binary)
+        elif r < args.noreply_ratio + args.binary_ratio + args.prio_ratio:
+            kind = "prio"
+            code = client.EchoPrio(parameter)
+        else:
+            kind = "json"
+            code = client.Echo(parameter)
+        latency = (time.perf_counter() - start) * 1e6
+
+        entry = result[kind]
+        if code == 0:
+            entry["latencies"].append(latency)
+        else:
+            entry["codes"][code] = entry["codes"].get(code, 0) + 1
+
+def Run(args):
+    server = BenchServer(args.work_us / 1e6)
+    server.Init()
+    server.SetQueuePolicy(args.queue_len, args.prio_queue_len)
+    server.Start(args.prio_ratio > 0, args.workers)
+
+    clients = []
+    for i in range(args.concurrency):
+        client = BenchClient()
+        client.Init()
+        client.SetTimeout(args.timeout)
+        clients.append(client)
+
+    if not clients[0].WaitReady(5.0):
+        print("[bench.rpc] service not matched")
+        return
+
+    # warm up the paths before measuring
+    for i in range(10):
+        clients[0].Echo("{}")
+    server.ResetApiStats()
+    before = server.GetQueueStats()
+
+    interval = args.concurrency / args.rate if args.rate > 0 else 0.0
+    results = [NewResult() for client in clients]
+    start = time.monotonic()
+    deadline = start + args.duration
+    threads = [threading.Thread(target=RunWorker, args=(client, args, deadline, interval, i, results[i]), daemon=True)
+               for i, client in enumerate(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    # let noreply requests still queued reach the server counters
+    time.sleep(min(1.0, args.timeout))
+    after = server.GetQueueStats()
+
+    print("transport: {}, concurrency: {}, workers: {}, duration: {:.1f}s".format(
+        args.transport, args.concurrency, args.workers, elapsed))
+    print("{:<8} {:>8} {:>7} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+        "kind", "calls", "errors", "rate(/s)", "p50(us)", "p99(us)", "p999(us)", "max(us)"))
+
+    total = 0
+    codes = {}
+    for kind in BENCH_KINDS:
+        latencies = [x for result in results for x in result[kind]["latencies"]]
+        errors = 0
+        for result in results:
+            for code, count in result[kind]["codes"].items():
+                codes[code] = codes.get(code, 0) + count
+                errors += count
+        calls = len(latencies) + errors
+        if calls == 0:
+            continue
+        total += calls
+        print("{:<8} {:>8} {:>7} {:>10.0f} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+            kind, calls, errors, calls / elapsed,
+            Percentile(latencies, 50), Percentile(latencies, 99), Percentile(latencies, 99.9),
+            max(latencies) if latencies else 0.0))
+
+    print("throughput: {:.0f} calls/s".format(total / elapsed))
+    if codes:
+        print("error codes:", codes)
+    print("server: queued {}, handled {}, rejected {}, expired {}".format(
+        *[after[key] - before[key] for key in ("queued", "handled", "rejected", "expired")]))
+
+    for client in clients:
+        client.Close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="rpc load generator")
+    parser.add_argument("--transport", type=str, default=CHANNEL_TRANSPORT_DDS,
+                        choices=[CHANNEL_TRANSPORT_DDS, CHANNEL_TRANSPORT_INPROC])
+    parser.add_argument("--domain", type=int, default=0)
+    parser.add_argument("--interface", type=str, default="lo")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=4, help="caller threads, one client each")
+    parser.add_argument("--rate", type=float, default=0.0, help="total calls per second, 0 runs closed loop")
+    parser.add_argument("--size", type=int, default=64, help="json parameter bytes")
+    parser.add_argument("--binary-size", type=int, default=0, help="binary payload bytes")
+    parser.add_argument("--binary-ratio", type=float, default=0.0)
+    parser.add_argument("--prio-ratio", type=float, default=0.0, help="share of calls on a priority api")
+    parser.add_argument("--noreply-ratio", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=1, help="server worker threads")
+    parser.add_argument("--work-us", type=float, default=0.0, help="handler time per request")
+    parser.add_argument("--queue-len", type=int, default=SERVER_QUEUE_LEN)
+    parser.add_argument("--prio-queue-len", type=int, default=SERVER_PRIO_QUEUE_LEN)
+    parser.add_argument("--timeout", type=float, default=1.0, help="client call timeout in seconds")
+    args = parser.parse_args()
+
+    if args.transport == CHANNEL_TRANSPORT_INPROC:
+        ChannelFactoryInitialize(args.domain, transport=CHANNEL_TRANSPORT_INPROC)
+    elif args.interface == "lo":
+        ChannelFactoryInitialize(args.domain, config=ChannelConfig().SetLoopbackOnly())
+    else:
+        ChannelFactoryInitialize(args.domain, args.interface)
+
+    Run(args)
@@ -22,11 +22,21 @@ class MotionSwitcherClient(Client):
         self._RegistApi(MOTION_SWITCHER_API_ID_SET_SILENT, 0)
         self._RegistApi(MOTION_SWITCHER_API_ID_GET_SILENT, 0)
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(MOTION_SWITCHER_API_ID_CHECK_MODE, [MOTION_SWITCHER_API_ID_SELECT_MODE,
+                                                                          MOTION_SWITCHER_API_ID_RELEASE_MODE])
+        self._RegistCacheInvalidation(MOTION_SWITCHER_API_ID_GET_SILENT, [MOTION_SWITCHER_API_ID_SET_SILENT])
+
     # 1001
     def CheckMode(self):
+        return self.CheckModeAsync().GetResult()
+
+    def CheckModeAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(MOTION_SWITCHER_API_ID_CHECK_MODE, parameter)
+        return self._CallAsync(MOTION_SWITCHER_API_ID_CHECK_MODE, parameter, self.__ParseMode)
+
+    def __ParseMode(self, code: int, data: str):
         if code == 0:
             return code, json.loads(data)
         else:
@@ -34,18 +44,22 @@ class MotionSwitcherClient(Client):
 
     # 1002
     def SelectMode(self, nameOrAlias):
+        code, data = self.SelectModeAsync(nameOrAlias).GetResult()
+        return code, None
+
+    def SelectModeAsync(self, nameOrAlias):
         p = {}
         p["name"] = nameOrAlias
         parameter = json.dumps(p)
-        code, data = self._Call(MOTION_SWITCHER_API_ID_SELECT_MODE, parameter)
-      
-        return code, None
+        return self._CallAsync(MOTION_SWITCHER_API_ID_SELECT_MODE, parameter)
 
     # 1003
     def ReleaseMode(self):
+        code, data = self.ReleaseModeAsync().GetResult()
+        return code, None
+
+    def ReleaseModeAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(MOTION_SWITCHER_API_ID_RELEASE_MODE, parameter)
-      
-        return code, None
+        return self._CallAsync(MOTION_SWITCHER_API_ID_RELEASE_MODE, parameter)
     
\ No newline at end of file
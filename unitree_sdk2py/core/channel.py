@@ -1,5 +1,7 @@
 import time
-from typing import Any, Callable
+from enum import Enum
+from typing import Any, Callable, Union
+import weakref
 import threading
 from threading import Thread, Event
 
@@ -9,21 +11,165 @@ from cyclonedds.pub import DataWriter
 from cyclonedds.sub import DataReader
 from cyclonedds.topic import Topic
 from cyclonedds.qos import Qos
-from cyclonedds.core import DDSException, Listener
+from cyclonedds.core import DDSException, Listener, SampleState, ViewState, InstanceState
 from cyclonedds.util import duration
 from cyclonedds.internal import dds_c_t, InvalidSample
 
 # for channel config
-from .channel_config import ChannelConfigAutoDetermine, ChannelConfigHasInterface
+from .channel_config import ChannelConfig, ChannelConfigAutoDetermine, ChannelConfigHasInterface
+from .channel_qos import GetChannelQos, ChannelQosKey
+from .channel_stats import ChannelStats
+from .channel_inproc import InprocTopic, CHANNEL_TRANSPORT_DDS, CHANNEL_TRANSPORT_INPROC
+
+try:
+    # raw cdr take/write, lets a channel filter samples or bring its own codec
+    from cyclonedds._clayer import ddspy_take, ddspy_write
+except ImportError:
+    ddspy_take = None
+    ddspy_write = None
+
+
+# the private calls change between releases (ddspy_take gained a state mask), so they are probed on
+# the invalid handle 0, which returns an error code without touching any reader or writer.
+# return the arguments ddspy_take expects between the reader and the sample count, None if unusable.
+def _ProbeRawTake():
+    if ddspy_take is None:
+        return None
+
+    mask = SampleState.Any | ViewState.Any | InstanceState.Any
+    for args in ((), (mask,)):
+        try:
+            ret = ddspy_take(0, *args, 1)
+        except TypeError:
+            continue
+        except Exception:
+            return None
+        return args if type(ret) == int else None
+    return None
+
+def _ProbeRawWrite():
+    if ddspy_write is None:
+        return False
+
+    try:
+        return type(ddspy_write(0, b"")) == int
+    except Exception:
+        return False
+
+RAW_TAKE_ARGS = _ProbeRawTake()
+RAW_WRITE = _ProbeRawWrite()
 
 # for singleton
 from ..utils.singleton import Singleton
 from ..utils.bqueue import BQueue
+from ..utils.mailbox import Mailbox
 
 
 """
-" class ChannelReader
+" Enum ChannelTakeMode
 """
+class ChannelTakeMode(Enum):
+    SINGLE = 0      # take one sample per wakeup, handler(sample)
+    DRAIN = 1       # take all available samples, handler(sample) for each
+    BATCH = 2       # take all available samples, handler([sample, ...])
+    LATEST = 3      # take all available samples, handler(newest sample)
+
+"""
+" default max samples taken per wakeup in drain/batch/latest mode
+"""
+CHANNEL_TAKE_MAX = 64
+
+
+"""
+" class MatchedStatus
+" matched remote endpoint count of a reader or writer, updated from the dds listener.
+"""
+class MatchedStatus:
+    def __init__(self):
+        self.__count = 0
+        self.__condition = threading.Condition()
+
+    def Set(self, count: int):
+        with self.__condition:
+            self.__count = count
+            self.__condition.notify_all()
+
+    def Get(self):
+        return self.__count
+
+    def Wait(self, count: int = 1, timeout: float = None):
+        if self.__count >= count:
+            return True
+
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__count >= count, timeout)
+
+
+"""
+" class SharedReader
+" one DataReader per topic in the process. samples are deserialized once
+" and fanned out to every attached channel reader.
+"""
+class SharedReader:
+    def __init__(self, participant: DomainParticipant, topic: Topic, qos: Qos = None):
+        self.__topic = topic
+        self.__qos = qos
+        self.__sinks = ()
+        self.__takeMax = 1
+        self.__lock = threading.Lock()
+        self.__matched = MatchedStatus()
+        self.__reader = DataReader(participant, topic, qos, Listener(on_data_available=self.__OnDataAvailable,
+                                                                     on_subscription_matched=self.__OnSubscriptionMatched))
+
+    def GetMatchedStatus(self):
+        return self.__matched
+
+    def Attach(self, sink: Callable, takeMax: int = 1):
+        with self.__lock:
+            self.__sinks = self.__sinks + (sink,)
+            self.__takeMax = max(self.__takeMax, takeMax)
+
+    def Detach(self, sink: Callable):
+        with self.__lock:
+            self.__sinks = tuple(s for s in self.__sinks if s != sink)
+            return len(self.__sinks)
+
+    def Close(self):
+        if self.__reader is not None:
+            del self.__reader
+            self.__reader = None
+
+    def __OnSubscriptionMatched(self, reader: DataReader, status: dds_c_t.subscription_matched_status):
+        self.__matched.Set(status.current_count)
+
+    # always take, samples arriving while no sink is attached are discarded instead of
+    # reaching the next subscriber late. takes until the reader is empty.
+    def __OnDataAvailable(self, reader: DataReader):
+        while True:
+            samples = []
+            try:
+                samples = reader.take(self.__takeMax)
+            except DDSException as e:
+                print("[SharedReader] catch DDSException error. msg:", e.msg)
+                return
+            except:
+                print("[SharedReader] take sample error")
+                return
+
+            count = len(samples)
+            if count == 0:
+                return
+
+            samples = [sample for sample in samples if not isinstance(sample, InvalidSample)]
+            for sink in self.__sinks:
+                try:
+                    sink(samples, count - len(samples))
+                except Exception as e:
+                    print("[SharedReader] sample handler error. msg:", e)
+
+            if count < self.__takeMax:
+                return
+
 
 """
 " class Channel
@@ -34,28 +180,84 @@ class Channel:
     " internal class __Reader
     """
     class __Reader:
-        def __init__(self):
+        def __init__(self, stats: ChannelStats):
+            self.__stats = stats
             self.__reader = None
             self.__handler = None
             self.__queue = None
             self.__queueEnable = False
             self.__threadEvent = None
             self.__threadReader = None
+            self.__takeMode = ChannelTakeMode.SINGLE
+            self.__takeMax = 1
+            self.__mailbox = None
+            self.__sharedKey = None
+            self.__inprocTopic = None
+            self.__inprocQueue = None
+            self.__matched = MatchedStatus()
+            self.__rawFilter = None
+            self.__deserialize = None
         
-        def Init(self, participant: DomainParticipant, topic: Topic, qos: Qos = None, handler: Callable = None, queueLen: int = 0):
+        def Init(self, participant: DomainParticipant, topic: Topic, qos: Qos = None, handler: Callable = None, queueLen: int = 0,
+                 takeMode: ChannelTakeMode = ChannelTakeMode.SINGLE, takeMax: int = CHANNEL_TAKE_MAX, mailbox: bool = False,
+                 sharedName: str = None, rawFilter: Callable = None, deserializer: Callable = None):
+            if mailbox:
+                # keep latest sample only, no handler thread and no queue
+                self.__mailbox = Mailbox()
+                handler = self.__mailbox.Put
+                queueLen = 0
+                takeMode = ChannelTakeMode.LATEST
+
             if handler is None:
-                self.__reader = DataReader(participant, topic, qos)
+                if isinstance(topic, InprocTopic):
+                    # polling reader keeps the latest sample, like a keep-last-1 DataReader
+                    self.__inprocQueue = BQueue(1)
+                    self.__inprocTopic = topic
+                    topic.Attach(self.__OnInprocSamples, self.__matched.Set)
+                else:
+                    self.__reader = DataReader(participant, topic, qos, Listener(on_subscription_matched=self.__OnSubscriptionMatched))
             else:
                 self.__handler = handler
+                self.__takeMode = takeMode
+                self.__takeMax = 1 if takeMode == ChannelTakeMode.SINGLE else max(1, takeMax)
                 if queueLen > 0:
                     self.__queueEnable = True
                     self.__queue = BQueue(queueLen)
                     self.__threadEvent = Event()
                     self.__threadReader = Thread(target=self.__ChannelReaderThreadFunc, name="ch_reader", daemon=True)
                     self.__threadReader.start()
-                self.__reader = DataReader(participant, topic, qos, Listener(on_data_available=self.__OnDataAvailable))
+
+                if isinstance(topic, InprocTopic):
+                    self.__inprocTopic = topic
+                    topic.Attach(self.__OnSamples, self.__matched.Set)
+                elif (rawFilter is not None or deserializer is not None) and RAW_TAKE_ARGS is not None:
+                    # rawFilter(data) sees the serialized sample, rejected samples are never deserialized.
+                    # deserializer(data) replaces the generated decoding of the type.
+                    self.__rawFilter = rawFilter
+                    self.__deserialize = topic.data_type.deserialize if deserializer is None else deserializer
+                    self.__reader = DataReader(participant, topic, qos, Listener(on_data_available=self.__OnRawDataAvailable,
+                                                                                 on_subscription_matched=self.__OnSubscriptionMatched))
+                elif sharedName is None:
+                    self.__reader = DataReader(participant, topic, qos, Listener(on_data_available=self.__OnDataAvailable,
+                                                                                 on_subscription_matched=self.__OnSubscriptionMatched))
+                else:
+                    # attach to the process wide reader of this topic
+                    self.__sharedKey = ChannelFactory()._AttachSharedReader(sharedName, topic, qos, self.__OnSamples, self.__takeMax)
+                    self.__matched = ChannelFactory()._GetSharedReader(self.__sharedKey).GetMatchedStatus()
+
+        def WaitForMatched(self, count: int = 1, timeout: float = None):
+            return self.__matched.Wait(count, timeout)
+
+        def GetMatchedCount(self):
+            return self.__matched.Get()
 
         def Read(self, timeout: float = None):
+            if self.__inprocQueue is not None:
+                sample = self.__inprocQueue.Get(timeout)
+                if sample is not None:
+                    self.__stats.OnReceive([sample])
+                return sample
+
             sample = None
             try:
                 if timeout is None:
@@ -69,120 +271,359 @@ class Channel:
             except:
                 print("[Reader] take sample error")
 
+            if sample is not None:
+                self.__stats.OnReceive([sample])
+
             return sample
 
+        def Latest(self):
+            if self.__mailbox is None:
+                print("[Reader] mailbox is not enabled")
+                return None
+            return self.__mailbox.Latest()
+
+        def WaitNewer(self, seq: int = 0, timeout: float = None):
+            if self.__mailbox is None:
+                print("[Reader] mailbox is not enabled")
+                return None
+            return self.__mailbox.WaitNewer(seq, timeout)
+
         def Close(self):
             if self.__reader is not None:
                 del self.__reader
 
+            if self.__sharedKey is not None:
+                ChannelFactory()._DetachSharedReader(self.__sharedKey, self.__OnSamples)
+                self.__sharedKey = None
+                # the shared status belongs to the shared reader
+                self.__matched = MatchedStatus()
+            else:
+                self.__matched.Set(0)
+
+            if self.__inprocTopic is not None:
+                if self.__inprocQueue is None:
+                    self.__inprocTopic.Detach(self.__OnSamples)
+                else:
+                    self.__inprocTopic.Detach(self.__OnInprocSamples)
+                    self.__inprocQueue.Interrupt()
+                self.__inprocTopic = None
+
+            if self.__mailbox is not None:
+                self.__mailbox.Close()
+
             if self.__queueEnable:
                 self.__threadEvent.set()
                 self.__queue.Interrupt()
                 self.__queue.Clear()
                 self.__threadReader.join()
 
+        # the listener fires again only for samples arriving after the take, so the drain modes
+        # take until the reader is empty. a batch handler gets at most takeMax samples per call.
         def __OnDataAvailable(self, reader: DataReader):
+            self.__Drain(self.__Take, reader)
+
+        def __OnRawDataAvailable(self, reader: DataReader):
+            self.__Drain(self.__TakeRaw, reader)
+
+        def __Drain(self, take: Callable, reader: DataReader):
+            pending = []
+            pendingInvalid = 0
+            while True:
+                result = take(reader)
+                if result is None:
+                    break
+
+                samples, invalid, count = result
+                if self.__takeMode == ChannelTakeMode.BATCH:
+                    self.__Deliver(samples, invalid)
+                else:
+                    pending.extend(samples)
+                    pendingInvalid += invalid
+
+                if self.__takeMode == ChannelTakeMode.SINGLE or count < self.__takeMax:
+                    break
+
+            if pending or pendingInvalid:
+                self.__Deliver(pending, pendingInvalid)
+
+        def __Deliver(self, samples: list, invalid: int):
+            if samples:
+                self.__OnSamples(samples, invalid)
+            elif invalid > 0:
+                self.__stats.OnInvalid(invalid)
+
+        # return (samples, invalid, taken count), None when nothing was taken
+        def __Take(self, reader: DataReader):
             samples = []
             try:
-                samples = reader.take(1)
+                samples = reader.take(self.__takeMax)
             except DDSException as e:
                 print("[Reader] catch DDSException error. msg:", e.msg)
-                return
+                return None
             except TimeoutError as e:
                 print("[Reader] take sample timeout")
-                return
+                return None
             except:
                 print("[Reader] take sample error")
-                return
+                return None
 
-            if samples is None:
-                return
+            if not samples:
+                return None
+
+            # check invalid sample
+            count = len(samples)
+            samples = [sample for sample in samples if not isinstance(sample, InvalidSample)]
+            return samples, count - len(samples), count
 
-            # check invalid sample        
-            sample = samples[0]
-            if isinstance(sample, InvalidSample):
+        def __TakeRaw(self, reader: DataReader):
+            try:
+                samples = ddspy_take(reader._ref, *RAW_TAKE_ARGS, self.__takeMax)
+            except DDSException as e:
+                print("[Reader] catch DDSException error. msg:", e.msg)
+                return None
+            except Exception as e:
+                print("[Reader] take sample error. msg:", e)
+                return None
+
+            if type(samples) == int:
+                print("[Reader] take sample error. code:", samples)
+                return None
+
+            if not samples:
+                return None
+
+            accepted = []
+            invalid = 0
+            filtered = 0
+            for data, info in samples:
+                if not info.valid_data:
+                    invalid += 1
+                    continue
+
+                # a malformed frame costs only itself, not the rest of the taken batch
+                try:
+                    if self.__rawFilter is not None and not self.__rawFilter(data):
+                        filtered += 1
+                        continue
+                    sample = self.__deserialize(data)
+                    sample.sample_info = info
+                except Exception as e:
+                    print("[Reader] decode sample error. msg:", e)
+                    invalid += 1
+                    continue
+                accepted.append(sample)
+
+            if filtered > 0:
+                self.__stats.OnFilter(filtered)
+
+            return accepted, invalid, len(samples)
+
+        def __OnSubscriptionMatched(self, reader: DataReader, status: dds_c_t.subscription_matched_status):
+            self.__matched.Set(status.current_count)
+
+        def __OnInprocSamples(self, samples: list, invalid: int = 0):
+            self.__inprocQueue.Put(samples[-1], True)
+
+        def __OnSamples(self, samples: list, invalid: int = 0):
+            self.__stats.OnReceive(samples, invalid)
+            if not samples:
                 return
 
             # do sample
+            if self.__takeMode == ChannelTakeMode.BATCH:
+                self.__Dispatch(samples)
+            elif self.__takeMode == ChannelTakeMode.LATEST:
+                if len(samples) > 1:
+                    self.__stats.OnReplace(len(samples) - 1)
+                self.__Dispatch(samples[-1])
+            else:
+                for sample in samples:
+                    self.__Dispatch(sample)
+
+        def __Dispatch(self, x: Any):
             if self.__queueEnable:
-                self.__queue.Put(sample)
+                # latest mode replaces the oldest queued sample, counted as replaced rather than dropped
+                if self.__takeMode == ChannelTakeMode.LATEST:
+                    if not self.__queue.Put(x, True):
+                        self.__stats.OnReplace()
+                elif not self.__queue.Put(x):
+                    self.__stats.OnDrop()
             else:
-                self.__handler(sample)
+                self.__Handle(x)
+
+        def __Handle(self, x: Any):
+            start = time.perf_counter()
+            self.__handler(x)
+            self.__stats.OnHandler(time.perf_counter() - start)
 
         def __ChannelReaderThreadFunc(self):
             while not self.__threadEvent.is_set():
-                sample = self.__queue.Get()
-                if sample is not None:
-                    self.__handler(sample)
+                x = self.__queue.Get()
+                if x is not None:
+                    self.__Handle(x)
 
     """
     " internal class __Writer
     """
     class __Writer:
-        def __init__(self):
+        def __init__(self, stats: ChannelStats):
+            self.__stats = stats
             self.__writer = None
-            self.__publication_matched_count = 0
+            self.__inprocTopic = None
+            self.__matched = MatchedStatus()
+            self.__serializer = None
         
-        def Init(self, participant: DomainParticipant, topic: Topic, qos: Qos = None):
-            self.__writer = DataWriter(participant, topic, qos, Listener(on_publication_matched=self.__OnPublicationMatched))
-            time.sleep(0.2)
+        # serializer(sample) returns the encoded sample, replacing the generated encoding of the type
+        def Init(self, participant: DomainParticipant, topic: Topic, qos: Qos = None, serializer: Callable = None):
+            if RAW_WRITE:
+                self.__serializer = serializer
+
+            if isinstance(topic, InprocTopic):
+                self.__inprocTopic = topic
+                topic.AttachWriter(self.__matched.Set)
+            else:
+                self.__writer = DataWriter(participant, topic, qos, Listener(on_publication_matched=self.__OnPublicationMatched))
 
-        def Write(self, sample: Any, timeout: float = None):
-            waitsec = 0.0 if timeout is None else timeout
+        def WaitForMatched(self, count: int = 1, timeout: float = None):
+            return self.__matched.Wait(count, timeout)
 
-            # check publication_matched_count
-            while waitsec > 0.0 and self.__publication_matched_count == 0:
-                time.sleep(0.1)
-                waitsec = waitsec - 0.1
-            #   print(time.time())
+        def GetMatchedCount(self):
+            return self.__matched.Get()
 
-            # check waitsec
-            if timeout is not None and waitsec <= 0.0:
-                return False
+        def Write(self, sample: Any, timeout: float = None):
+            # wait publication matched only when there is no reader yet
+            if timeout is not None and self.__matched.Get() == 0:
+                if not self.WaitForMatched(1, timeout):
+                    self.__stats.OnWrite(sample, False)
+                    return False
 
             try:
-                self.__writer.write(sample)
+                if self.__inprocTopic is not None:
+                    self.__inprocTopic.Publish(sample)
+                elif self.__serializer is None:
+                    self.__writer.write(sample)
+                else:
+                    ret = ddspy_write(self.__writer._ref, self.__serializer(sample))
+                    if ret < 0:
+                        raise DDSException(ret, "write sample error")
             except DDSException as e:
                 print("[Writer] catch DDSException error. msg:", e.msg)
+                self.__stats.OnWrite(sample, False)
                 return False
             except Exception as e:
-                print("[Writer] write sample error. msg:", e.args())
+                print("[Writer] write sample error. msg:", e.args)
+                self.__stats.OnWrite(sample, False)
                 return False
 
+            self.__stats.OnWrite(sample, True)
             return True
         
         def Close(self):
             if self.__writer is not None:
                 del self.__writer
+
+            if self.__inprocTopic is not None:
+                self.__inprocTopic.DetachWriter(self.__matched.Set)
+                self.__inprocTopic = None
+
+            self.__matched.Set(0)
         
         def __OnPublicationMatched(self, writer: DataWriter, status: dds_c_t.publication_matched_status):
-            self.__publication_matched_count = status.current_count
+            self.__matched.Set(status.current_count)
 
 
     # channel __init__
-    def __init__(self, participant: DomainParticipant, name: str, type: Any, qos: Qos = None):
-        self.__reader = self.__Reader()
-        self.__writer = self.__Writer()
+    def __init__(self, participant: DomainParticipant, name: str, type: Any, qos: Qos = None, topic: Topic = None,
+                 endpointQos: Union[str, Qos] = None, registered: bool = False):
+        self.__stats = ChannelStats(name)
+        self.__reader = self.__Reader(self.__stats)
+        self.__writer = self.__Writer(self.__stats)
+        self.__name = name
+        self.__type = type
         self.__participant = participant
-        self.__topic = Topic(self.__participant, name, type, qos)
-
-    def SetWriter(self, qos: Qos = None):
-        self.__writer.Init(self.__participant, self.__topic, qos)
-
-    def SetReader(self, qos: Qos = None, handler: Callable = None, queueLen: int = 0):
-        self.__reader.Init(self.__participant, self.__topic, qos, handler, queueLen)
+        # a channel of ChannelFactory takes its topic from the registry when a reader or writer opens,
+        # the topic stays registered while one of them is open
+        self.__registered = registered
+        if registered:
+            self.__topic = None
+        else:
+            self.__topic = Topic(self.__participant, name, type, qos) if topic is None else topic
+        self.__readerOpen = False
+        self.__writerOpen = False
+        # default qos (or profile name) for the reader and writer of this channel
+        self.__endpointQos = GetChannelQos(endpointQos)
+
+    def GetName(self):
+        return self.__name
+
+    def GetStats(self):
+        return self.__stats
+
+    def SetWriter(self, qos: Union[str, Qos] = None, serializer: Callable = None):
+        qos = self.__endpointQos if qos is None else GetChannelQos(qos)
+        if not self.__writerOpen:
+            self.__writerOpen = True
+            self.__AcquireTopic()
+        self.__writer.Init(self.__participant, self.__topic, qos, serializer)
+
+    def SetReader(self, qos: Union[str, Qos] = None, handler: Callable = None, queueLen: int = 0,
+                  takeMode: ChannelTakeMode = ChannelTakeMode.SINGLE, takeMax: int = CHANNEL_TAKE_MAX, mailbox: bool = False,
+                  shared: bool = None, rawFilter: Callable = None, deserializer: Callable = None):
+        # handler/mailbox readers share one DataReader per topic unless disabled, filtered or decoded differently
+        if shared is None:
+            shared = ChannelFactory().IsReaderShared() and rawFilter is None and deserializer is None
+        sharedName = self.__name if shared else None
+        qos = self.__endpointQos if qos is None else GetChannelQos(qos)
+        if not self.__readerOpen:
+            self.__readerOpen = True
+            self.__AcquireTopic()
+        self.__reader.Init(self.__participant, self.__topic, qos, handler, queueLen, takeMode, takeMax, mailbox, sharedName,
+                           rawFilter, deserializer)
         
     def Write(self, sample: Any, timeout: float = None):
         return self.__writer.Write(sample, timeout)
 
+    def WaitForMatched(self, count: int = 1, timeout: float = None):
+        return self.__writer.WaitForMatched(count, timeout)
+
+    def GetMatchedCount(self):
+        return self.__writer.GetMatchedCount()
+
+    # reader side: wait until at least count writers are matched
+    def WaitForReaderMatched(self, count: int = 1, timeout: float = None):
+        return self.__reader.WaitForMatched(count, timeout)
+
+    def GetReaderMatchedCount(self):
+        return self.__reader.GetMatchedCount()
+
     def Read(self, timeout: float = None):
         return self.__reader.Read(timeout)
 
+    def Latest(self):
+        return self.__reader.Latest()
+
+    def WaitNewer(self, seq: int = 0, timeout: float = None):
+        return self.__reader.WaitNewer(seq, timeout)
+
     def CloseReader(self):
         self.__reader.Close()
+        if self.__readerOpen:
+            self.__readerOpen = False
+            self.__ReleaseTopic()
 
     def CloseWriter(self):
         self.__writer.Close()
+        if self.__writerOpen:
+            self.__writerOpen = False
+            self.__ReleaseTopic()
+
+    def __AcquireTopic(self):
+        if self.__registered:
+            self.__topic = ChannelFactory()._AcquireTopic(self.__name, self.__type)
+
+    def __ReleaseTopic(self):
+        if self.__registered:
+            ChannelFactory()._ReleaseTopic(self.__name, self.__topic)
 
 
 """
@@ -192,6 +633,13 @@ class ChannelFactory(Singleton):
     __domain = None
     __participant = None
     __qos = None
+    __shareReader = False
+    __transport = CHANNEL_TRANSPORT_DDS
+
+    __topics = {}
+    __sharedReaders = {}
+    __channels = weakref.WeakSet()
+    __registry_lock = threading.Lock()
 
     __initialized = False
     __init_lock = threading.Lock()
@@ -199,17 +647,32 @@ class ChannelFactory(Singleton):
     def __init__(self):
         super().__init__()
 
-    def Init(self, id: int, networkInterface: str = None, qos: Qos = None):
+    # shareReader: handler subscribers of a topic share one DataReader and its listener thread,
+    # so a slow handler delays the others. off by default.
+    def Init(self, id: int, networkInterface: str = None, qos: Qos = None, shareReader: bool = False,
+             channelConfig: ChannelConfig = None, transport: str = CHANNEL_TRANSPORT_DDS):
         if self.__class__.__initialized:
             return True
         
         with self.__class__.__init_lock:
             if self.__class__.__initialized:
                 return True
+
+            if transport == CHANNEL_TRANSPORT_INPROC:
+                # no dds domain, publishers hand samples straight to subscribers of this process
+                self.__class__.__transport = transport
+                self.__class__.__shareReader = shareReader
+                self.__class__.__initialized = True
+                return True
+            elif transport != CHANNEL_TRANSPORT_DDS:
+                print("[ChannelFactory] unknown transport:", transport)
+                return False
             
             config = None
             # choose config
-            if networkInterface is None:
+            if channelConfig is not None:
+                config = channelConfig.ToXml(networkInterface)
+            elif networkInterface is None:
                 config = ChannelConfigAutoDetermine
             else:
                 config = ChannelConfigHasInterface.replace('$__IF_NAME__$', networkInterface)
@@ -233,30 +696,121 @@ class ChannelFactory(Singleton):
                 return False
 
             self.__class__.__qos = qos
+            self.__class__.__shareReader = shareReader
             self.__class__.__initialized = True
             return True
 
-    def CreateChannel(self, name: str, type: Any):
-        return Channel(self.__class__.__participant, name, type, self.__class__.__qos)
+    def IsReaderShared(self):
+        return self.__class__.__shareReader
+
+    def GetParticipant(self):
+        return self.__class__.__participant
+
+    def GetTransport(self):
+        return self.__class__.__transport
+
+    # qos: None, a Qos object or a profile name in CHANNEL_QOS_PROFILES ("control", "rpc", "bulk")
+    def CreateChannel(self, name: str, type: Any, qos: Union[str, Qos] = None):
+        channel = Channel(self.__class__.__participant, name, type, self.__class__.__qos, None, qos, True)
+        with self.__class__.__registry_lock:
+            self.__GetTopicEntry(name, type)
+            self.__class__.__channels.add(channel)
+        return channel
+
+    # snapshot of the runtime statistics of every live channel
+    def Stats(self):
+        with self.__class__.__registry_lock:
+            channels = list(self.__class__.__channels)
+        return [channel.GetStats().Snapshot() for channel in channels]
 
-    def CreateSendChannel(self, name: str, type: Any):
-        channel = self.CreateChannel(name, type)
-        channel.SetWriter(None)
+    # count sample bytes in Stats(). costs one extra serialization per sample.
+    def SetStatsCountBytes(self, enable: bool):
+        ChannelStats.countBytes = enable
+
+    def CreateSendChannel(self, name: str, type: Any, qos: Union[str, Qos] = None, serializer: Callable = None):
+        channel = self.CreateChannel(name, type, qos)
+        channel.SetWriter(None, serializer)
         return channel
 
-    def CreateRecvChannel(self, name: str, type: Any, handler: Callable = None, queueLen: int = 0):
-        channel = self.CreateChannel(name, type)
-        channel.SetReader(None, handler, queueLen)
+    def CreateRecvChannel(self, name: str, type: Any, handler: Callable = None, queueLen: int = 0,
+                          takeMode: ChannelTakeMode = ChannelTakeMode.SINGLE, takeMax: int = CHANNEL_TAKE_MAX,
+                          qos: Union[str, Qos] = None, rawFilter: Callable = None, deserializer: Callable = None):
+        channel = self.CreateChannel(name, type, qos)
+        channel.SetReader(None, handler, queueLen, takeMode, takeMax, False, None, rawFilter, deserializer)
         return channel
 
+    # shared readers are keyed by topic name and qos value, so different qos get their own reader
+    def _AttachSharedReader(self, name: str, topic: Topic, qos: Qos, sink: Callable, takeMax: int):
+        key = (name, ChannelQosKey(qos))
+        with self.__class__.__registry_lock:
+            reader = self.__class__.__sharedReaders.get(key)
+            if reader is None:
+                reader = SharedReader(self.__class__.__participant, topic, qos)
+                self.__class__.__sharedReaders[key] = reader
+            reader.Attach(sink, takeMax)
+            return key
+
+    def _GetSharedReader(self, key: tuple):
+        with self.__class__.__registry_lock:
+            return self.__class__.__sharedReaders.get(key)
+
+    def _DetachSharedReader(self, key: tuple, sink: Callable):
+        with self.__class__.__registry_lock:
+            reader = self.__class__.__sharedReaders.get(key)
+            if reader is None:
+                return
+            if reader.Detach(sink) == 0:
+                self.__class__.__sharedReaders.pop(key)
+                reader.Close()
+
+    # a topic name has one type in the domain, asking for another type raises. return the registered
+    # topic, or a new one that is not registered when no reader or writer of the name is open.
+    def GetTopic(self, name: str, type: Any):
+        with self.__class__.__registry_lock:
+            entry = self.__GetTopicEntry(name, type)
+        return self.__CreateTopic(name, type) if entry is None else entry[1]
+
+    # count an open reader or writer of the topic, registering the topic with the first. return the topic.
+    def _AcquireTopic(self, name: str, type: Any):
+        with self.__class__.__registry_lock:
+            entry = self.__GetTopicEntry(name, type)
+            if entry is None:
+                entry = [type, self.__CreateTopic(name, type), 0]
+                self.__class__.__topics[name] = entry
+            entry[2] += 1
+            return entry[1]
+
+    # the topic is dropped from the registry when its last reader or writer closes
+    def _ReleaseTopic(self, name: str, topic: Any):
+        with self.__class__.__registry_lock:
+            entry = self.__class__.__topics.get(name)
+            if entry is None or entry[1] is not topic:
+                return
+            entry[2] -= 1
+            if entry[2] <= 0:
+                self.__class__.__topics.pop(name)
+
+    # entry is [type, topic, open endpoint count] or None, call with the registry lock held
+    def __GetTopicEntry(self, name: str, type: Any):
+        entry = self.__class__.__topics.get(name)
+        if entry is not None and entry[0] is not type:
+            raise Exception("topic type mismatch. name: {}, type: {}, requested: {}".format(
+                name, entry[0].__name__, type.__name__))
+        return entry
+
+    def __CreateTopic(self, name: str, type: Any):
+        if self.__class__.__transport == CHANNEL_TRANSPORT_INPROC:
+            return InprocTopic(name, type)
+        return Topic(self.__class__.__participant, name, type, self.__class__.__qos)
+
 
 """
 " class ChannelPublisher
 """
 class ChannelPublisher:
-    def __init__(self, name: str, type: Any):
+    def __init__(self, name: str, type: Any, qos: Union[str, Qos] = None):
         factory = ChannelFactory()
-        self.__channel = factory.CreateChannel(name, type)
+        self.__channel = factory.CreateChannel(name, type, qos)
         self.__inited = False
 
     def Init(self):
@@ -271,20 +825,32 @@ class ChannelPublisher:
     def Write(self, sample: Any, timeout: float = None):
         return self.__channel.Write(sample, timeout)
 
+    # wait until at least count readers are matched. return False on timeout.
+    def WaitForMatched(self, count: int = 1, timeout: float = None):
+        return self.__channel.WaitForMatched(count, timeout)
+
+    def GetMatchedCount(self):
+        return self.__channel.GetMatchedCount()
+
 """
 " class ChannelSubscriber
 """
 class ChannelSubscriber:
-    def __init__(self, name: str, type: Any):
+    def __init__(self, name: str, type: Any, qos: Union[str, Qos] = None):
         factory = ChannelFactory()
-        self.__channel = factory.CreateChannel(name, type)
+        self.__channel = factory.CreateChannel(name, type, qos)
         self.__inited = False
 
-    def Init(self, handler: Callable = None, queueLen: int = 0):
+    def Init(self, handler: Callable = None, queueLen: int = 0,
+             takeMode: ChannelTakeMode = ChannelTakeMode.SINGLE, takeMax: int = CHANNEL_TAKE_MAX, mailbox: bool = False):
         if not self.__inited:
-            self.__channel.SetReader(None, handler, queueLen)
+            self.__channel.SetReader(None, handler, queueLen, takeMode, takeMax, mailbox)
             self.__inited = True
 
+    # mailbox mode: sub.Init(mailbox=True), then poll Latest() or block on WaitNewer()
+    def InitMailbox(self):
+        self.Init(None, 0, ChannelTakeMode.LATEST, CHANNEL_TAKE_MAX, True)
+
     def Close(self):
         self.__channel.CloseReader()
         self.__inited = False
@@ -292,10 +858,26 @@ class ChannelSubscriber:
     def Read(self, timeout: int = None):
         return self.__channel.Read(timeout)
 
+    # wait until at least count writers are matched. return False on timeout.
+    def WaitForMatched(self, count: int = 1, timeout: float = None):
+        return self.__channel.WaitForReaderMatched(count, timeout)
+
+    def GetMatchedCount(self):
+        return self.__channel.GetReaderMatchedCount()
+
+    # return (seq, stamp, sample) of the latest sample, seq is 0 if nothing arrived yet.
+    def Latest(self):
+        return self.__channel.Latest()
+
+    # block until a sample newer than seq arrives. return (seq, stamp, sample) or None on timeout.
+    def WaitNewer(self, seq: int = 0, timeout: float = None):
+        return self.__channel.WaitNewer(seq, timeout)
+
 """
 " function ChannelFactoryInitialize. used to intialize channel everenment.
 """
-def ChannelFactoryInitialize(id: int = 0, networkInterface: str = None):
+def ChannelFactoryInitialize(id: int = 0, networkInterface: str = None, config: ChannelConfig = None,
+                             transport: str = CHANNEL_TRANSPORT_DDS, shareReader: bool = False):
     factory = ChannelFactory()
-    if not factory.Init(id, networkInterface):
+    if not factory.Init(id, networkInterface, None, shareReader, config, transport):
         raise Exception("channel factory init error.")
@@ -0,0 +1,167 @@
+import asyncio
+
+from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Union
+
+from cyclonedds.qos import Qos
+
+from .channel import ChannelPublisher, ChannelSubscriber, ChannelTakeMode
+
+"""
+" Enum ChannelOverflowPolicy
+"""
+class ChannelOverflowPolicy(Enum):
+    DROP_OLDEST = 0
+    DROP_NEWEST = 1
+
+
+"""
+" class AsyncChannelSubscriber
+" samples are taken on the dds listener thread and handed to the event loop
+" in batches through loop.call_soon_threadsafe.
+"
+" usage:
+"     sub = AsyncChannelSubscriber("rt/lowstate", LowState_)
+"     sub.Init()
+"     async for sample in sub:
+"         ...
+"""
+class AsyncChannelSubscriber:
+    def __init__(self, name: str, type: Any, qos: Union[str, Qos] = None, queueLen: int = 10,
+                 overflowPolicy: ChannelOverflowPolicy = ChannelOverflowPolicy.DROP_OLDEST):
+        self.__subscriber = ChannelSubscriber(name, type, qos)
+        self.__queue = deque()
+        self.__queueLen = max(1, queueLen)
+        self.__overflowPolicy = overflowPolicy
+        self.__loop = None
+        self.__waiters = set()
+        self.__dropped = 0
+        self.__closed = False
+
+    # loop defaults to the running loop, so call Init from a coroutine or pass the loop
+    def Init(self, loop: asyncio.AbstractEventLoop = None):
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError("[AsyncChannelSubscriber] no running event loop, call Init from a coroutine or pass loop")
+        self.__loop = loop
+        self.__closed = False
+        self.__subscriber.Init(self.__OnSamples, 0, ChannelTakeMode.BATCH)
+
+    # any thread. the waiting readers are woken on the event loop thread.
+    def Close(self):
+        self.__subscriber.Close()
+        self.__closed = True
+        if self.__loop is None:
+            return
+        try:
+            self.__loop.call_soon_threadsafe(self.__Wakeup)
+        except RuntimeError:
+            # event loop closed
+            pass
+
+    # timeout bounds the whole call, a reader woken without winning a sample waits only the rest of it
+    async def Read(self, timeout: float = None):
+        if self.__loop is None:
+            raise RuntimeError("[AsyncChannelSubscriber] not initialized, call Init first")
+
+        deadline = None if timeout is None else self.__loop.time() + timeout
+        while not self.__queue:
+            if self.__closed:
+                return None
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - self.__loop.time()
+                if remaining <= 0:
+                    return None
+
+            waiter = self.__loop.create_future()
+            self.__waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                self.__waiters.discard(waiter)
+
+        return self.__queue.popleft()
+
+    def Size(self):
+        return len(self.__queue)
+
+    def GetDropped(self):
+        return self.__dropped
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        sample = await self.Read()
+        if sample is None:
+            raise StopAsyncIteration
+        return sample
+
+    # dds listener thread
+    def __OnSamples(self, samples: list):
+        try:
+            self.__loop.call_soon_threadsafe(self.__Push, samples)
+        except RuntimeError:
+            # event loop closed
+            pass
+
+    # event loop thread
+    def __Push(self, samples: list):
+        for sample in samples:
+            if len(self.__queue) >= self.__queueLen:
+                self.__dropped += 1
+                if self.__overflowPolicy == ChannelOverflowPolicy.DROP_NEWEST:
+                    continue
+                self.__queue.popleft()
+            self.__queue.append(sample)
+
+        self.__Wakeup()
+
+    # event loop thread. every reader wakes and checks the queue, those that find it empty wait again
+    def __Wakeup(self):
+        for waiter in self.__waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+"""
+" class AsyncChannelPublisher
+" a reliable write blocks while the writer history is full, so writes run on one
+" writer thread, which also keeps them in the order they were awaited.
+"""
+class AsyncChannelPublisher:
+    def __init__(self, name: str, type: Any, qos: Union[str, Qos] = None):
+        self.__publisher = ChannelPublisher(name, type, qos)
+        self.__executor = None
+
+    def Init(self):
+        self.__publisher.Init()
+        self.__executor = ThreadPoolExecutor(1, "async_channel_writer")
+
+    def Close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        self.__publisher.Close()
+
+    async def WaitForMatched(self, count: int = 1, timeout: float = None):
+        if self.__publisher.GetMatchedCount() >= count:
+            return True
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__publisher.WaitForMatched, count, timeout)
+
+    async def Write(self, sample: Any, timeout: float = None):
+        # only the first match is awaited, the write itself runs on the writer thread
+        if timeout is not None and self.__publisher.GetMatchedCount() == 0:
+            if not await self.WaitForMatched(1, timeout):
+                return False
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, self.__publisher.Write, sample)
@@ -1,25 +1,108 @@
-ChannelConfigHasInterface = '''<?xml version="1.0" encoding="UTF-8" ?>
-    <CycloneDDS>
-        <Domain Id="any">
-            <General>
-                <Interfaces>
-                    <NetworkInterface name="$__IF_NAME__$" priority="default" multicast="default"/>
-                </Interfaces>
-            </General>
-            <Tracing>
-                <Verbosity>config</Verbosity>
-            <OutputFile>/tmp/cdds.LOG</OutputFile>
-        </Tracing>
-        </Domain>
-    </CycloneDDS>'''
-
-ChannelConfigAutoDetermine = '''<?xml version="1.0" encoding="UTF-8" ?>
-    <CycloneDDS>
-        <Domain Id="any">
-            <General>
-                <Interfaces>
-                    <NetworkInterface autodetermine=\"true\" priority=\"default\" multicast=\"default\" />
-                </Interfaces>
-            </General>
-        </Domain>
-    </CycloneDDS>'''
+"""
+" class ChannelConfig
+" builds the cyclonedds xml configuration used by ChannelFactory.Init.
+"
+" usage:
+"     config = ChannelConfig("eth0").SetSocketBufferSize(8 << 20, 8 << 20).SetMaxMessageSize(65500)
+"     ChannelFactoryInitialize(0, config=config)
+"""
+class ChannelConfig:
+    def __init__(self, networkInterface: str = None):
+        self.networkInterface = networkInterface
+        self.multicast = None               # None: cyclonedds default, True/False, or "spdp"
+        self.peers = []                     # unicast peer addresses
+        self.socketReceiveBufferSize = None # bytes
+        self.socketSendBufferSize = None    # bytes
+        self.maxMessageSize = None          # bytes
+        self.fragmentSize = None            # bytes
+        self.sharedMemory = False           # iceoryx shared memory transport
+        self.tracingVerbosity = None        # None: tracing off, e.g. "config", "fine", "finest"
+        self.tracingFile = "/tmp/cdds.LOG"
+
+    def SetNetworkInterface(self, networkInterface: str):
+        self.networkInterface = networkInterface
+        return self
+
+    def SetMulticast(self, multicast):
+        self.multicast = multicast
+        return self
+
+    def SetPeers(self, peers: list):
+        self.peers = list(peers)
+        return self
+
+    # unicast discovery on the loopback interface only
+    def SetLoopbackOnly(self):
+        self.networkInterface = "lo"
+        self.multicast = False
+        self.peers = ["127.0.0.1"]
+        return self
+
+    def SetSocketBufferSize(self, receive: int = None, send: int = None):
+        self.socketReceiveBufferSize = receive
+        self.socketSendBufferSize = send
+        return self
+
+    def SetMaxMessageSize(self, size: int):
+        self.maxMessageSize = size
+        return self
+
+    def SetFragmentSize(self, size: int):
+        self.fragmentSize = size
+        return self
+
+    def SetSharedMemory(self, enable: bool):
+        self.sharedMemory = enable
+        return self
+
+    def SetTracing(self, verbosity: str, outputFile: str = "/tmp/cdds.LOG"):
+        self.tracingVerbosity = verbosity
+        self.tracingFile = outputFile
+        return self
+
+    # networkInterface is used when the config names none, the config itself is left unchanged
+    def ToXml(self, networkInterface: str = None):
+        if self.networkInterface is not None:
+            networkInterface = self.networkInterface
+
+        general = []
+        if networkInterface is None:
+            general.append('<Interfaces><NetworkInterface autodetermine="true" priority="default" multicast="default" /></Interfaces>')
+        else:
+            general.append('<Interfaces><NetworkInterface name="{}" priority="default" multicast="default"/></Interfaces>'.format(networkInterface))
+        if self.multicast is not None:
+            multicast = self.multicast if isinstance(self.multicast, str) else str(bool(self.multicast)).lower()
+            general.append("<AllowMulticast>{}</AllowMulticast>".format(multicast))
+        if self.maxMessageSize is not None:
+            general.append("<MaxMessageSize>{}B</MaxMessageSize>".format(int(self.maxMessageSize)))
+        if self.fragmentSize is not None:
+            general.append("<FragmentSize>{}B</FragmentSize>".format(int(self.fragmentSize)))
+
+        sections = ["<General>" + "".join(general) + "</General>"]
+
+        if self.peers:
+            peers = "".join('<Peer address="{}"/>'.format(peer) for peer in self.peers)
+            sections.append("<Discovery><ParticipantIndex>auto</ParticipantIndex><Peers>" + peers + "</Peers></Discovery>")
+
+        internal = []
+        if self.socketReceiveBufferSize is not None:
+            internal.append('<SocketReceiveBufferSize min="{}B"/>'.format(int(self.socketReceiveBufferSize)))
+        if self.socketSendBufferSize is not None:
+            internal.append('<SocketSendBufferSize min="{}B"/>'.format(int(self.socketSendBufferSize)))
+        if internal:
+            sections.append("<Internal>" + "".join(internal) + "</Internal>")
+
+        if self.sharedMemory:
+            sections.append("<SharedMemory><Enable>true</Enable></SharedMemory>")
+
+        if self.tracingVerbosity is not None:
+            sections.append("<Tracing><Verbosity>{}</Verbosity><OutputFile>{}</OutputFile></Tracing>".format(
+                self.tracingVerbosity, self.tracingFile))
+
+        return ('<?xml version="1.0" encoding="UTF-8" ?>'
+                '<CycloneDDS><Domain Id="any">' + "".join(sections) + '</Domain></CycloneDDS>')
+
+
+ChannelConfigHasInterface = ChannelConfig("$__IF_NAME__$").ToXml()
+
+ChannelConfigAutoDetermine = ChannelConfig().ToXml()
@@ -0,0 +1,79 @@
+import threading
+from typing import Any, Callable
+
+"""
+" in-process transport constants
+"""
+CHANNEL_TRANSPORT_DDS = "dds"
+CHANNEL_TRANSPORT_INPROC = "inproc"
+
+
+"""
+" class InprocTopic
+" in-process stand-in for a dds topic. Publish hands the sample object to every attached reader
+" on the caller's thread, without serialization. Readers see the very object that was written,
+" so a publisher must not modify a sample after writing it if readers queue samples.
+"""
+class InprocTopic:
+    def __init__(self, name: str, type: Any):
+        self.__name = name
+        self.__type = type
+        self.__sinks = ()
+        self.__writers = ()
+        self.__readers = ()
+        self.__lock = threading.Lock()
+
+    def GetName(self):
+        return self.__name
+
+    def GetType(self):
+        return self.__type
+
+    # onMatched(count) is called with the writer count whenever a writer comes or goes
+    def Attach(self, sink: Callable, onMatched: Callable = None):
+        with self.__lock:
+            self.__sinks = self.__sinks + (sink,)
+            if onMatched is not None:
+                self.__readers = self.__readers + ((sink, onMatched),)
+            count = len(self.__sinks)
+            writers = self.__writers
+        for onWriterMatched in writers:
+            onWriterMatched(count)
+        if onMatched is not None:
+            onMatched(len(writers))
+
+    def Detach(self, sink: Callable):
+        with self.__lock:
+            self.__sinks = tuple(s for s in self.__sinks if s != sink)
+            self.__readers = tuple(r for r in self.__readers if r[0] != sink)
+            count = len(self.__sinks)
+            writers = self.__writers
+        for onMatched in writers:
+            onMatched(count)
+
+    def AttachWriter(self, onMatched: Callable):
+        with self.__lock:
+            self.__writers = self.__writers + (onMatched,)
+            count = len(self.__sinks)
+            readers = self.__readers
+        onMatched(count)
+        self.__NotifyReaders(readers)
+
+    def DetachWriter(self, onMatched: Callable):
+        with self.__lock:
+            self.__writers = tuple(w for w in self.__writers if w != onMatched)
+            readers = self.__readers
+        self.__NotifyReaders(readers)
+
+    def __NotifyReaders(self, readers: tuple):
+        count = len(self.__writers)
+        for sink, onMatched in readers:
+            onMatched(count)
+
+    def Publish(self, sample: Any):
+        samples = [sample]
+        for sink in self.__sinks:
+            try:
+                sink(samples, 0)
+            except Exception as e:
+                print("[InprocTopic] sample handler error. msg:", e)
@@ -0,0 +1,55 @@
+from typing import Union
+
+from cyclonedds.qos import Qos, Policy
+from cyclonedds.util import duration
+
+"""
+" built-in channel qos profiles
+"""
+# control loops (rt/lowcmd ...): never block or retransmit, only the newest sample matters
+ChannelQosControl = Qos(
+    Policy.Reliability.BestEffort,
+    Policy.History.KeepLast(1),
+    Policy.Durability.Volatile,
+    Policy.LatencyBudget(duration(seconds=0)),
+)
+
+# request/response traffic: reliable with a short history
+ChannelQosRpc = Qos(
+    Policy.Reliability.Reliable(max_blocking_time=duration(milliseconds=100)),
+    Policy.History.KeepLast(10),
+    Policy.Durability.Volatile,
+)
+
+# video, point clouds and other large samples: reliable with a large history
+ChannelQosBulk = Qos(
+    Policy.Reliability.Reliable(max_blocking_time=duration(seconds=1)),
+    Policy.History.KeepLast(64),
+    Policy.Durability.Volatile,
+)
+
+CHANNEL_QOS_PROFILES = {
+    "default": None,
+    "control": ChannelQosControl,
+    "rpc": ChannelQosRpc,
+    "bulk": ChannelQosBulk,
+}
+
+"""
+" function GetChannelQos. resolve a profile name to Qos, Qos objects and None pass through.
+"""
+def GetChannelQos(qos: Union[str, Qos] = None):
+    if qos is None or not isinstance(qos, str):
+        return qos
+
+    if qos not in CHANNEL_QOS_PROFILES:
+        raise Exception("unknown channel qos profile: " + qos)
+
+    return CHANNEL_QOS_PROFILES[qos]
+
+
+"""
+" function ChannelQosKey. hashable value of a Qos, equal for equal policies whatever the object.
+"""
+def ChannelQosKey(qos: Qos = None):
+    return None if qos is None else frozenset(qos)
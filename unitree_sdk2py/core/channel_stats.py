@@ -0,0 +1,121 @@
+import time
+from threading import Lock
+
+from ..utils.histogram import Histogram, RunningStat
+
+"""
+" class ChannelStats
+" live counters of one channel. times are in microseconds.
+"
+" interArrival is the gap between consecutive source timestamps, the publishing interval and its
+" jitter as received, unaffected by how many samples one take returns. samples without a SampleInfo
+" (the in-process transport, Read) use their arrival time, which is only measured per sample.
+" latency is source timestamp to take, including any time a sample waited in the reader.
+"""
+class ChannelStats:
+    # serializing a sample only to count its size is not free, so it is opt-in
+    countBytes = False
+
+    def __init__(self, name: str):
+        self.__name = name
+        self.__lock = Lock()
+        self.Reset()
+
+    def Reset(self):
+        self.received = 0
+        self.receivedBytes = 0
+        self.written = 0
+        self.writtenBytes = 0
+        self.writeErrors = 0
+        self.invalid = 0
+        self.dropped = 0
+        self.replaced = 0
+        self.filtered = 0
+        self.__lastStamp = None
+        self.__interArrival = RunningStat()
+        self.__latency = RunningStat()
+        self.__handlerTime = Histogram()
+
+    def OnReceive(self, samples: list, invalid: int = 0):
+        now = time.time_ns()
+        nbytes = 0
+        if ChannelStats.countBytes:
+            nbytes = sum(self.__SampleSize(sample) for sample in samples)
+
+        with self.__lock:
+            self.received += len(samples)
+            self.receivedBytes += nbytes
+            self.invalid += invalid
+
+            for sample in samples:
+                info = getattr(sample, "sample_info", None)
+                source = None if info is None else getattr(info, "source_timestamp", None)
+                if source:
+                    self.__latency.Add((now - source) / 1000.0)
+                    stamp = source
+                elif len(samples) == 1:
+                    stamp = now
+                else:
+                    # a batch taken at once has no per sample arrival time
+                    self.__lastStamp = None
+                    continue
+
+                if self.__lastStamp is not None:
+                    self.__interArrival.Add((stamp - self.__lastStamp) / 1000.0)
+                self.__lastStamp = stamp
+
+    def OnInvalid(self, count: int = 1):
+        with self.__lock:
+            self.invalid += count
+
+    def OnDrop(self, count: int = 1):
+        with self.__lock:
+            self.dropped += count
+
+    # latest mode: samples superseded by a newer one before the handler saw them
+    def OnReplace(self, count: int = 1):
+        with self.__lock:
+            self.replaced += count
+
+    def OnFilter(self, count: int = 1):
+        with self.__lock:
+            self.filtered += count
+
+    def OnHandler(self, seconds: float):
+        with self.__lock:
+            self.__handlerTime.Add(seconds * 1e6)
+
+    def OnWrite(self, sample, ok: bool):
+        nbytes = self.__SampleSize(sample) if ok and ChannelStats.countBytes else 0
+        with self.__lock:
+            if ok:
+                self.written += 1
+                self.writtenBytes += nbytes
+            else:
+                self.writeErrors += 1
+
+    def Snapshot(self):
+        with self.__lock:
+            interArrival = self.__interArrival.Snapshot()
+            interArrival["jitter"] = interArrival.pop("std")
+            return {
+                "name": self.__name,
+                "received": self.received,
+                "receivedBytes": self.receivedBytes,
+                "written": self.written,
+                "writtenBytes": self.writtenBytes,
+                "writeErrors": self.writeErrors,
+                "invalid": self.invalid,
+                "dropped": self.dropped,
+                "replaced": self.replaced,
+                "filtered": self.filtered,
+                "interArrival": interArrival,
+                "latency": self.__latency.Snapshot(),
+                "handlerTime": self.__handlerTime.Snapshot(),
+            }
+
+    def __SampleSize(self, sample):
+        try:
+            return len(sample.serialize())
+        except:
+            return 0
@@ -40,16 +40,23 @@ class G1ArmActionClient(Client):
 
     ## API Call ##
     def ExecuteAction(self, action_id: int):
+        return self.ExecuteActionAsync(action_id).GetResult()[0]
+
+    def ExecuteActionAsync(self, action_id: int):
         p = {}
         p["data"] = action_id
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_ARM_ACTION_EXECUTE_ACTION, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_ARM_ACTION_EXECUTE_ACTION, parameter)
     
     def GetActionList(self):
+        return self.GetActionListAsync().GetResult()
+
+    def GetActionListAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_ARM_ACTION_GET_ACTION_LIST, parameter)
+        return self._CallAsync(ROBOT_API_ID_ARM_ACTION_GET_ACTION_LIST, parameter, self.__ParseActionList)
+
+    def __ParseActionList(self, code: int, data: str):
         if code == 0:
             return code, json.loads(data)
         else:
@@ -24,48 +24,68 @@ class AudioClient(Client):
         self._RegistApi(ROBOT_API_ID_AUDIO_SET_VOLUME, 0) 
         self._RegistApi(ROBOT_API_ID_AUDIO_SET_RGB_LED, 0) 
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(ROBOT_API_ID_AUDIO_GET_VOLUME, [ROBOT_API_ID_AUDIO_SET_VOLUME])
+
     ## API Call ##
     def TtsMaker(self, text: str, speaker_id: int):
+        return self.TtsMakerAsync(text, speaker_id).GetResult()[0]
+
+    def TtsMakerAsync(self, text: str, speaker_id: int):
         self.tts_index += self.tts_index
         p = {}
         p["index"] = self.tts_index
         p["text"] = text
         p["speaker_id"] = speaker_id
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_AUDIO_TTS, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_AUDIO_TTS, parameter)
 
     def GetVolume(self):
+        return self.GetVolumeAsync().GetResult()
+
+    def GetVolumeAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_AUDIO_GET_VOLUME, parameter)
+        return self._CallAsync(ROBOT_API_ID_AUDIO_GET_VOLUME, parameter, self.__ParseVolume)
+
+    def __ParseVolume(self, code: int, data: str):
         if code == 0:
             return code, json.loads(data)
         else:
             return code, None
 
     def SetVolume(self, volume: int):
+        return self.SetVolumeAsync(volume).GetResult()[0]
+
+    def SetVolumeAsync(self, volume: int):
         p = {}
         p["volume"] = volume
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_AUDIO_SET_VOLUME, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_AUDIO_SET_VOLUME, parameter)
 
     def LedControl(self, R: int, G: int, B: int):
+        return self.LedControlAsync(R, G, B).GetResult()[0]
+
+    def LedControlAsync(self, R: int, G: int, B: int):
         p = {}
         p["R"] = R
         p["G"] = G
         p["B"] = B
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_AUDIO_SET_RGB_LED, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_AUDIO_SET_RGB_LED, parameter)
     
     def PlayStream(self, app_name: str, stream_id: str, pcm_data: bytes):
         param = json.dumps({"app_name": app_name, "stream_id": stream_id})
-        pcm_list = list(pcm_data) 
-        return self._CallRequestWithParamAndBin(ROBOT_API_ID_AUDIO_START_PLAY, param, pcm_list)
+        return self._CallRequestWithParamAndBin(ROBOT_API_ID_AUDIO_START_PLAY, param, pcm_data)
+
+    def PlayStreamAsync(self, app_name: str, stream_id: str, pcm_data: bytes):
+        param = json.dumps({"app_name": app_name, "stream_id": stream_id})
+        return self._CallRequestWithParamAndBinAsync(ROBOT_API_ID_AUDIO_START_PLAY, param, pcm_data)
     
     def PlayStop(self, app_name: str):
-        parameter = json.dumps({"app_name": app_name})
-        self._Call(ROBOT_API_ID_AUDIO_STOP_PLAY, parameter)
+        self.PlayStopAsync(app_name).GetResult()
         return 0
+
+    def PlayStopAsync(self, app_name: str):
+        parameter = json.dumps({"app_name": app_name})
+        return self._CallAsync(ROBOT_API_ID_AUDIO_STOP_PLAY, parameter)
@@ -1,8 +1,16 @@
 import json
 
 from ...rpc.client import Client
+from ...rpc.command_stream import CommandStream, COMMAND_STREAM_RATE, COMMAND_STREAM_TIMEOUT
+from ...rpc.client_future import GatherResults
+from ...rpc.param_codec import ParamTemplate, JsonLoads
 from .g1_loco_api import *
 
+"""
+" precompiled parameters of the streamed commands
+"""
+LOCO_PARAM_VELOCITY = ParamTemplate(("velocity", [float, float, float]), ("duration", float))
+
 """
 " class SportClient
 """
@@ -30,47 +38,135 @@ class LocoClient(Client):
         self._RegistApi(ROBOT_API_ID_LOCO_SET_VELOCITY, 0)
         self._RegistApi(ROBOT_API_ID_LOCO_SET_ARM_TASK, 0)
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(ROBOT_API_ID_LOCO_GET_FSM_ID, [ROBOT_API_ID_LOCO_SET_FSM_ID])
+        self._RegistCacheInvalidation(ROBOT_API_ID_LOCO_GET_FSM_MODE, [ROBOT_API_ID_LOCO_SET_FSM_ID, ROBOT_API_ID_LOCO_SET_VELOCITY])
+        self._RegistCacheInvalidation(ROBOT_API_ID_LOCO_GET_BALANCE_MODE, [ROBOT_API_ID_LOCO_SET_BALANCE_MODE])
+        self._RegistCacheInvalidation(ROBOT_API_ID_LOCO_GET_SWING_HEIGHT, [ROBOT_API_ID_LOCO_SET_SWING_HEIGHT])
+        self._RegistCacheInvalidation(ROBOT_API_ID_LOCO_GET_STAND_HEIGHT, [ROBOT_API_ID_LOCO_SET_STAND_HEIGHT])
+
+    # 7001
+    def GetFsmId(self):
+        return self.GetFsmIdAsync().GetResult()
+
+    def GetFsmIdAsync(self):
+        p = {}
+        parameter = json.dumps(p)
+        return self._CallAsync(ROBOT_API_ID_LOCO_GET_FSM_ID, parameter, self.__ParseData)
+
+    # 7002
+    def GetFsmMode(self):
+        return self.GetFsmModeAsync().GetResult()
+
+    def GetFsmModeAsync(self):
+        p = {}
+        parameter = json.dumps(p)
+        return self._CallAsync(ROBOT_API_ID_LOCO_GET_FSM_MODE, parameter, self.__ParseData)
+
+    # 7003
+    def GetBalanceMode(self):
+        return self.GetBalanceModeAsync().GetResult()
+
+    def GetBalanceModeAsync(self):
+        p = {}
+        parameter = json.dumps(p)
+        return self._CallAsync(ROBOT_API_ID_LOCO_GET_BALANCE_MODE, parameter, self.__ParseData)
+
+    # 7004
+    def GetSwingHeight(self):
+        return self.GetSwingHeightAsync().GetResult()
+
+    def GetSwingHeightAsync(self):
+        p = {}
+        parameter = json.dumps(p)
+        return self._CallAsync(ROBOT_API_ID_LOCO_GET_SWING_HEIGHT, parameter, self.__ParseData)
+
+    # 7005
+    def GetStandHeight(self):
+        return self.GetStandHeightAsync().GetResult()
+
+    def GetStandHeightAsync(self):
+        p = {}
+        parameter = json.dumps(p)
+        return self._CallAsync(ROBOT_API_ID_LOCO_GET_STAND_HEIGHT, parameter, self.__ParseData)
+
+    # the getters above in one round trip. return the first error code and the values by name.
+    def GetStatus(self, timeout: float = None):
+        futures = [self.GetFsmIdAsync(), self.GetFsmModeAsync(), self.GetBalanceModeAsync(),
+                   self.GetSwingHeightAsync(), self.GetStandHeightAsync()]
+        results = GatherResults(futures, timeout)
+
+        code = next((c for c, d in results if c != 0), 0)
+        names = ["fsm_id", "fsm_mode", "balance_mode", "swing_height", "stand_height"]
+        return code, {name: d for name, (c, d) in zip(names, results)}
+
+    def __ParseData(self, code: int, data: str):
+        if code == 0:
+            d = JsonLoads(data)
+            return code, d["data"]
+        else:
+            return code, None
+
     # 7101
     def SetFsmId(self, fsm_id: int):
+        return self.SetFsmIdAsync(fsm_id).GetResult()[0]
+
+    def SetFsmIdAsync(self, fsm_id: int):
         p = {}
         p["data"] = fsm_id
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_LOCO_SET_FSM_ID, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_LOCO_SET_FSM_ID, parameter)
 
     # 7102
     def SetBalanceMode(self, balance_mode: int):
+        return self.SetBalanceModeAsync(balance_mode).GetResult()[0]
+
+    def SetBalanceModeAsync(self, balance_mode: int):
         p = {}
         p["data"] = balance_mode
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_LOCO_SET_BALANCE_MODE, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_LOCO_SET_BALANCE_MODE, parameter)
 
     # 7104
     def SetStandHeight(self, stand_height: float):
+        return self.SetStandHeightAsync(stand_height).GetResult()[0]
+
+    def SetStandHeightAsync(self, stand_height: float):
         p = {}
         p["data"] = stand_height
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_LOCO_SET_STAND_HEIGHT, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_LOCO_SET_STAND_HEIGHT, parameter)
 
     # 7105
     def SetVelocity(self, vx: float, vy: float, omega: float, duration: float = 1.0):
-        p = {}
-        velocity = [vx,vy,omega]
-        p["velocity"] = velocity
-        p["duration"] = duration
-        parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_LOCO_SET_VELOCITY, parameter)
-        return code
+        return self.SetVelocityAsync(vx, vy, omega, duration).GetResult()[0]
+
+    def SetVelocityAsync(self, vx: float, vy: float, omega: float, duration: float = 1.0):
+        parameter = LOCO_PARAM_VELOCITY.Encode(vx, vy, omega, duration)
+        return self._CallAsync(ROBOT_API_ID_LOCO_SET_VELOCITY, parameter)
+
+    def SetVelocityNoReply(self, vx: float, vy: float, omega: float, duration: float = 1.0):
+        parameter = LOCO_PARAM_VELOCITY.Encode(vx, vy, omega, duration)
+        return self._CallNoReply(ROBOT_API_ID_LOCO_SET_VELOCITY, parameter)
+
+    # latest wins SetVelocity at a fixed rate for joysticks and planners, started. see CommandStream.
+    # each command lasts duration seconds on the robot, the stream stops it on producer silence.
+    def VelocityStream(self, rate: float = COMMAND_STREAM_RATE, timeout: float = COMMAND_STREAM_TIMEOUT,
+                       duration: float = 1.0):
+        send = lambda vx, vy, omega: self.SetVelocityNoReply(vx, vy, omega, duration)
+        stream = CommandStream(send, rate, (0.0, 0.0, 0.0), timeout, name="velocity_stream")
+        stream.Start()
+        return stream
     
     # 7106
     def SetTaskId(self, task_id: float):
+        return self.SetTaskIdAsync(task_id).GetResult()[0]
+
+    def SetTaskIdAsync(self, task_id: float):
         p = {}
         p["data"] = task_id
         parameter = json.dumps(p)
-        code, data = self._Call(ROBOT_API_ID_LOCO_SET_ARM_TASK, parameter)
-        return code
+        return self._CallAsync(ROBOT_API_ID_LOCO_SET_ARM_TASK, parameter)
 
     def Damp(self):
         self.SetFsmId(1)
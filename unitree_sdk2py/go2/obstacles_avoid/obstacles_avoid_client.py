@@ -1,9 +1,17 @@
 import json
 
 from ...rpc.client import Client
+from ...rpc.command_stream import CommandStream, COMMAND_STREAM_RATE, COMMAND_STREAM_TIMEOUT
+from ...rpc.param_codec import ParamTemplate, JsonLoads
 from .obstacles_avoid_api import *
 
 
+"""
+" precompiled parameters of the streamed commands
+"""
+OBSTACLES_AVOID_PARAM_MOVE = ParamTemplate(("x", float), ("y", float), ("yaw", float), ("mode", int))
+
+
 """
 " class ObstaclesAvoidClient
 """
@@ -20,41 +28,53 @@ class ObstaclesAvoidClient(Client):
         self._RegistApi(OBSTACLES_AVOID_API_ID_MOVE, 0)
         self._RegistApi(OBSTACLES_AVOID_API_ID_USE_REMOTE_COMMAND_FROM_API, 0)
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(OBSTACLES_AVOID_API_ID_SWITCH_GET, [OBSTACLES_AVOID_API_ID_SWITCH_SET])
+
     # 1001
     def SwitchSet(self, on: bool):
+        return self.SwitchSetAsync(on).GetResult()[0]
+
+    def SwitchSetAsync(self, on: bool):
         p = {}
         p["enable"] = on
         parameter = json.dumps(p)
 
-        code, data = self._Call(OBSTACLES_AVOID_API_ID_SWITCH_SET, parameter)
-        return code
+        return self._CallAsync(OBSTACLES_AVOID_API_ID_SWITCH_SET, parameter)
 
     # 1002
     def SwitchGet(self):
+        return self.SwitchGetAsync().GetResult()
+
+    def SwitchGetAsync(self):
         p = {}
         parameter = json.dumps(p)
+        return self._CallAsync(OBSTACLES_AVOID_API_ID_SWITCH_GET, parameter, self.__ParseSwitch)
 
-        code, data = self._Call(OBSTACLES_AVOID_API_ID_SWITCH_GET, parameter)
+    def __ParseSwitch(self, code: int, data: str):
         if code == 0:
-            d = json.loads(data)
+            d = JsonLoads(data)
             return code, d["enable"]
         else:
             return code, None
 
     # 1003
     def Move(self, vx: float, vy: float, vyaw: float):
-        p = {}
-        p["x"] = vx
-        p["y"] = vy
-        p["yaw"] = vyaw
-        p["mode"] = 0
-        parameter = json.dumps(p)
+        parameter = OBSTACLES_AVOID_PARAM_MOVE.Encode(vx, vy, vyaw, 0)
         code = self._CallNoReply(OBSTACLES_AVOID_API_ID_MOVE, parameter)
         return code
 
+    # latest wins Move at a fixed rate for joysticks and planners, started. see CommandStream.
+    def MoveStream(self, rate: float = COMMAND_STREAM_RATE, timeout: float = COMMAND_STREAM_TIMEOUT):
+        stream = CommandStream(self.Move, rate, (0.0, 0.0, 0.0), timeout, name="move_stream")
+        stream.Start()
+        return stream
+
     def UseRemoteCommandFromApi(self, isRemoteCommandsFromApi: bool):
+        return self.UseRemoteCommandFromApiAsync(isRemoteCommandsFromApi).GetResult()[0]
+
+    def UseRemoteCommandFromApiAsync(self, isRemoteCommandsFromApi: bool):
         p = {}
         p["is_remote_commands_from_api"] = isRemoteCommandsFromApi
         parameter = json.dumps(p)
-        code, data = self._Call(OBSTACLES_AVOID_API_ID_USE_REMOTE_COMMAND_FROM_API, parameter)
-        return code
\ No newline at end of file
+        return self._CallAsync(OBSTACLES_AVOID_API_ID_USE_REMOTE_COMMAND_FROM_API, parameter)
\ No newline at end of file
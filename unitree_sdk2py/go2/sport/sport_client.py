@@ -1,6 +1,8 @@
 import json
 
 from ...rpc.client import Client
+from ...rpc.command_stream import CommandStream, COMMAND_STREAM_RATE, COMMAND_STREAM_TIMEOUT
+from ...rpc.param_codec import ParamTemplate, JsonLoads
 from .sport_api import *
 
 """
@@ -9,6 +11,12 @@ from .sport_api import *
 SPORT_PATH_POINT_SIZE = 30
 
 
+"""
+" precompiled parameters of the streamed commands
+"""
+SPORT_PARAM_XYZ = ParamTemplate(("x", float), ("y", float), ("z", float))
+
+
 """
 " class PathPoint
 """
@@ -76,288 +84,366 @@ class SportClient(Client):
         self._RegistApi(SPORT_API_ID_AUTORECOVERY_GET, 0)      # AutoRecoveryGet
         self._RegistApi(SPORT_API_ID_SWITCHAVOIDMODE, 0)       # SwitchAvoidMode
 
+        # setters that change what the getters return, for SetApiCache
+        self._RegistCacheInvalidation(SPORT_API_ID_AUTORECOVERY_GET, [SPORT_API_ID_AUTORECOVERY_SET])
+
     # 1001
     def Damp(self):
+        return self.DampAsync().GetResult()[0]
+
+    def DampAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_DAMP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_DAMP, parameter)
     
     # 1002
     def BalanceStand(self):
+        return self.BalanceStandAsync().GetResult()[0]
+
+    def BalanceStandAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_BALANCESTAND, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_BALANCESTAND, parameter)
     
     # 1003
     def StopMove(self):
+        return self.StopMoveAsync().GetResult()[0]
+
+    def StopMoveAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_STOPMOVE, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_STOPMOVE, parameter)
 
     # 1004
     def StandUp(self):
+        return self.StandUpAsync().GetResult()[0]
+
+    def StandUpAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_STANDUP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_STANDUP, parameter)
 
     # 1005
     def StandDown(self):
+        return self.StandDownAsync().GetResult()[0]
+
+    def StandDownAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_STANDDOWN, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_STANDDOWN, parameter)
 
     # 1006
     def RecoveryStand(self):
+        return self.RecoveryStandAsync().GetResult()[0]
+
+    def RecoveryStandAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_RECOVERYSTAND, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_RECOVERYSTAND, parameter)
 
     # 1007
     def Euler(self, roll: float, pitch: float, yaw: float):
-        p = {}
-        p["x"] = roll
-        p["y"] = pitch
-        p["z"] = yaw
-        parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_EULER, parameter)
-        return code
+        return self.EulerAsync(roll, pitch, yaw).GetResult()[0]
+
+    def EulerAsync(self, roll: float, pitch: float, yaw: float):
+        parameter = SPORT_PARAM_XYZ.Encode(roll, pitch, yaw)
+        return self._CallAsync(SPORT_API_ID_EULER, parameter)
 
     # 1008
     def Move(self, vx: float, vy: float, vyaw: float):
-        p = {}
-        p["x"] = vx
-        p["y"] = vy
-        p["z"] = vyaw
-        parameter = json.dumps(p)
+        parameter = SPORT_PARAM_XYZ.Encode(vx, vy, vyaw)
         code = self._CallNoReply(SPORT_API_ID_MOVE, parameter)
         return code
 
+    # latest wins Move at a fixed rate for joysticks and planners, started. see CommandStream.
+    def MoveStream(self, rate: float = COMMAND_STREAM_RATE, timeout: float = COMMAND_STREAM_TIMEOUT):
+        stream = CommandStream(self.Move, rate, (0.0, 0.0, 0.0), timeout, name="move_stream")
+        stream.Start()
+        return stream
+
     # 1009
     def Sit(self):
+        return self.SitAsync().GetResult()[0]
+
+    def SitAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_SIT, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_SIT, parameter)
 
     #1010
     def RiseSit(self):
+        return self.RiseSitAsync().GetResult()[0]
+
+    def RiseSitAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_RISESIT, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_RISESIT, parameter)
 
     # 1015
     def SpeedLevel(self, level: int):
+        return self.SpeedLevelAsync(level).GetResult()[0]
+
+    def SpeedLevelAsync(self, level: int):
         p = {}
         p["data"] = level
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_SPEEDLEVEL, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_SPEEDLEVEL, parameter)
 
     # 1016
     def Hello(self):
+        return self.HelloAsync().GetResult()[0]
+
+    def HelloAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_HELLO, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_HELLO, parameter)
 
     # 1017
     def Stretch(self):
+        return self.StretchAsync().GetResult()[0]
+
+    def StretchAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_STRETCH, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_STRETCH, parameter)
 
     # 1020
     def Content(self):
+        return self.ContentAsync().GetResult()[0]
+
+    def ContentAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_CONTENT, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_CONTENT, parameter)
 
     # 1022
     def Dance1(self):
+        return self.Dance1Async().GetResult()[0]
+
+    def Dance1Async(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_DANCE1, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_DANCE1, parameter)
 
     # 1023
     def Dance2(self):
+        return self.Dance2Async().GetResult()[0]
+
+    def Dance2Async(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_DANCE2, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_DANCE2, parameter)
 
     # 1027
     def SwitchJoystick(self, on: bool):
+        return self.SwitchJoystickAsync(on).GetResult()[0]
+
+    def SwitchJoystickAsync(self, on: bool):
         p = {}
         p["data"] = on
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_SWITCHJOYSTICK, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_SWITCHJOYSTICK, parameter)
 
     # 1028
     def Pose(self, flag: bool):
+        return self.PoseAsync(flag).GetResult()[0]
+
+    def PoseAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_POSE, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_POSE, parameter)
 
     # 1029
     def Scrape(self):
+        return self.ScrapeAsync().GetResult()[0]
+
+    def ScrapeAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_SCRAPE, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_SCRAPE, parameter)
 
     # 1030
     def FrontFlip(self):
+        return self.FrontFlipAsync().GetResult()[0]
+
+    def FrontFlipAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FRONTFLIP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FRONTFLIP, parameter)
 
     # 1031
     def FrontJump(self):
+        return self.FrontJumpAsync().GetResult()[0]
+
+    def FrontJumpAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FRONTJUMP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FRONTJUMP, parameter)
 
     # 1032
     def FrontPounce(self):
+        return self.FrontPounceAsync().GetResult()[0]
+
+    def FrontPounceAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FRONTPOUNCE, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FRONTPOUNCE, parameter)
 
     # 1036
     def Heart(self):
+        return self.HeartAsync().GetResult()[0]
+
+    def HeartAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_HEART, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_HEART, parameter)
     
     # 2041
     def LeftFlip(self):
+        return self.LeftFlipAsync().GetResult()[0]
+
+    def LeftFlipAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_LEFTFLIP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_LEFTFLIP, parameter)
 
     # 2043
     def BackFlip(self):
+        return self.BackFlipAsync().GetResult()[0]
+
+    def BackFlipAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_BACKFLIP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_BACKFLIP, parameter)
 
     # 2045
     def FreeWalk(self):
+        return self.FreeWalkAsync().GetResult()[0]
+
+    def FreeWalkAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FREEWALK, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FREEWALK, parameter)
 
     # 2046
     def FreeBound(self, flag: bool):
+        return self.FreeBoundAsync(flag).GetResult()[0]
+
+    def FreeBoundAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FREEBOUND, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FREEBOUND, parameter)
     
     # 2047
     def FreeJump(self, flag: bool):
+        return self.FreeJumpAsync(flag).GetResult()[0]
+
+    def FreeJumpAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FREEJUMP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FREEJUMP, parameter)
 
     # 2048
     def FreeAvoid(self, flag: bool):
+        return self.FreeAvoidAsync(flag).GetResult()[0]
+
+    def FreeAvoidAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_FREEAVOID, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_FREEAVOID, parameter)
     
     # 2050
     def WalkUpright(self, flag: bool):
+        return self.WalkUprightAsync(flag).GetResult()[0]
+
+    def WalkUprightAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_WALKUPRIGHT, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_WALKUPRIGHT, parameter)
 
     # 2051
     def CrossStep(self, flag: bool):  
+        return self.CrossStepAsync(flag).GetResult()[0]
+
+    def CrossStepAsync(self, flag: bool):  
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_CROSSSTEP, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_CROSSSTEP, parameter)
     
     # 1061
     def StaticWalk(self):
+        return self.StaticWalkAsync().GetResult()[0]
+
+    def StaticWalkAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_STATICWALK, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_STATICWALK, parameter)
  
     # 1062
     def TrotRun(self):
+        return self.TrotRunAsync().GetResult()[0]
+
+    def TrotRunAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_TROTRUN, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_TROTRUN, parameter)
 
     # 2044
     def HandStand(self, flag: bool):
+        return self.HandStandAsync(flag).GetResult()[0]
+
+    def HandStandAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_HANDSTAND, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_HANDSTAND, parameter)
     # 2049
     def ClassicWalk(self, flag: bool):
+        return self.ClassicWalkAsync(flag).GetResult()[0]
+
+    def ClassicWalkAsync(self, flag: bool):
         p = {}
         p["data"] = flag
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_CLASSICWALK, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_CLASSICWALK, parameter)
 
     # 2054
     def AutoRecoverySet(self, enabled: bool):
+        return self.AutoRecoverySetAsync(enabled).GetResult()[0]
+
+    def AutoRecoverySetAsync(self, enabled: bool):
         p = {}
         p["data"] = enabled
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_AUTORECOVERY_SET, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_AUTORECOVERY_SET, parameter)
 
     # 2055
     def AutoRecoveryGet(self):
+        return self.AutoRecoveryGetAsync().GetResult()
+
+    def AutoRecoveryGetAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_AUTORECOVERY_GET, parameter)
+        return self._CallAsync(SPORT_API_ID_AUTORECOVERY_GET, parameter, self.__ParseAutoRecovery)
+
+    def __ParseAutoRecovery(self, code: int, data: str):
         if code == 0:
-            d = json.loads(data)
+            d = JsonLoads(data)
             return code, d["data"]
         else:
             return code, None
 
     # 2058
     def SwitchAvoidMode(self):
+        return self.SwitchAvoidModeAsync().GetResult()[0]
+
+    def SwitchAvoidModeAsync(self):
         p = {}
         parameter = json.dumps(p)
-        code, data = self._Call(SPORT_API_ID_SWITCHAVOIDMODE, parameter)
-        return code
+        return self._CallAsync(SPORT_API_ID_SWITCHAVOIDMODE, parameter)
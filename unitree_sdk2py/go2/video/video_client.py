@@ -20,4 +20,7 @@ class VideoClient(Client):
 
     # 1001
     def GetImageSample(self):
-        return self._CallBinary(VIDEO_API_ID_GETIMAGESAMPLE, [])
+        return self.GetImageSampleAsync().GetResult()
+
+    def GetImageSampleAsync(self):
+        return self._CallBinaryAsync(VIDEO_API_ID_GETIMAGESAMPLE, b"")
@@ -0,0 +1,54 @@
+import os
+import json
+import struct
+import importlib
+
+"""
+" log layout
+"
+"     <path>/topics.json              topic id -> name and idl type
+"     <path>/segment_00000.log        segment header + records
+"     <path>/segment_00000.idx        one (timestamp, offset) entry per record
+"
+" record: RECORD_HEADER (take timestamp ns, topic id, flags, payload length) + raw cdr payload,
+" padded to 8 bytes. segments are preallocated and truncated on close, a zero header ends a segment.
+" the timestamp is when the recorder took the sample, every sample of one take gets the same one.
+" timestamps never decrease across the log.
+"""
+LOG_MAGIC = b"UTSDKLOG"
+LOG_VERSION = 1
+
+SEGMENT_HEADER = struct.Struct("<8sIIQQ")   # magic, version, segment number, created ns, reserved
+RECORD_HEADER = struct.Struct("<QHHI")      # take timestamp ns, topic id, flags, length
+INDEX_ENTRY = struct.Struct("<QQ")          # timestamp ns, record offset
+
+LOG_TOPICS_FILE = "topics.json"
+LOG_SEGMENT_SIZE = 64 << 20
+
+def SegmentPath(path: str, segment: int):
+    return os.path.join(path, "segment_{:05d}.log".format(segment))
+
+def IndexPath(path: str, segment: int):
+    return os.path.join(path, "segment_{:05d}.idx".format(segment))
+
+def RecordSize(length: int):
+    return (RECORD_HEADER.size + length + 7) & ~7
+
+def TypeName(type):
+    return type.__module__ + ":" + type.__qualname__
+
+def ResolveType(typeName: str):
+    moduleName, _, qualName = typeName.partition(":")
+    obj = importlib.import_module(moduleName)
+    for name in qualName.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+def WriteTopics(path: str, topics: list):
+    data = [{"id": id, "name": name, "type": TypeName(type)} for id, (name, type) in enumerate(topics)]
+    with open(os.path.join(path, LOG_TOPICS_FILE), "w") as f:
+        json.dump(data, f, indent=1)
+
+def ReadTopics(path: str):
+    with open(os.path.join(path, LOG_TOPICS_FILE), "r") as f:
+        return json.load(f)
@@ -0,0 +1,130 @@
+import os
+import mmap
+import bisect
+
+from .log_format import *
+
+
+"""
+" class LogSegment
+" memory mapped, read only view of one segment and its index.
+"""
+class LogSegment:
+    def __init__(self, path: str, segment: int):
+        self.__logFile = open(SegmentPath(path, segment), "rb")
+        self.__log = mmap.mmap(self.__logFile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, _, _ = SEGMENT_HEADER.unpack_from(self.__log, 0)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise Exception("bad log segment: " + SegmentPath(path, segment))
+
+        self.__times = []
+        self.__offsets = []
+        indexPath = IndexPath(path, segment)
+        if os.path.exists(indexPath) and os.path.getsize(indexPath) > 0:
+            with open(indexPath, "rb") as f:
+                idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                for timestamp, offset in INDEX_ENTRY.iter_unpack(idx[:len(idx) - len(idx) % INDEX_ENTRY.size]):
+                    if offset == 0:
+                        break
+                    self.__times.append(timestamp)
+                    self.__offsets.append(offset)
+                idx.close()
+
+    def StartTime(self):
+        return self.__times[0] if self.__times else None
+
+    def EndTime(self):
+        return self.__times[-1] if self.__times else None
+
+    # yield (timestamp, topic id, payload memoryview) from the first record at or after timestamp
+    def Records(self, timestamp: int = None):
+        start = 0 if timestamp is None else bisect.bisect_left(self.__times, timestamp)
+        if start >= len(self.__offsets):
+            return
+
+        view = memoryview(self.__log)
+        offset = self.__offsets[start]
+        size = len(self.__log)
+        while offset + RECORD_HEADER.size <= size:
+            timestamp, topicId, _, length = RECORD_HEADER.unpack_from(self.__log, offset)
+            if timestamp == 0 and length == 0:
+                break
+            start = offset + RECORD_HEADER.size
+            yield timestamp, topicId, view[start:start + length]
+            offset += RecordSize(length)
+
+    def Close(self):
+        self.__log.close()
+        self.__logFile.close()
+
+
+"""
+" class LogReader
+" iterates a recorded log without loading whole files. samples are deserialized lazily.
+"
+" usage:
+"     reader = LogReader("/tmp/lowstate_log")
+"     for timestamp, name, sample in reader.Read(topics=["rt/lowstate"]):
+"         ...
+"""
+class LogReader:
+    def __init__(self, path: str):
+        self.__path = path
+        self.__topics = {}
+        for t in ReadTopics(path):
+            self.__topics[t["id"]] = (t["name"], ResolveType(t["type"]))
+
+        self.__segments = []
+        segment = 0
+        while os.path.exists(SegmentPath(path, segment)):
+            self.__segments.append(LogSegment(path, segment))
+            segment += 1
+
+    def GetTopics(self):
+        return {id: name for id, (name, _) in self.__topics.items()}
+
+    def GetType(self, name: str):
+        for topicName, type in self.__topics.values():
+            if topicName == name:
+                return type
+        return None
+
+    def StartTime(self):
+        times = [s.StartTime() for s in self.__segments if s.StartTime() is not None]
+        return min(times) if times else None
+
+    def EndTime(self):
+        times = [s.EndTime() for s in self.__segments if s.EndTime() is not None]
+        return max(times) if times else None
+
+    # yield (timestamp, topic name, payload) in [start, end). payload is the raw cdr memoryview if raw
+    # is set, otherwise the deserialized sample.
+    def Read(self, start: int = None, end: int = None, topics: list = None, raw: bool = False):
+        topicIds = None
+        if topics is not None:
+            topicIds = set(id for id, (name, _) in self.__topics.items() if name in topics)
+
+        for segment in self.__segments:
+            segmentEnd = segment.EndTime()
+            if segmentEnd is None or (start is not None and segmentEnd < start):
+                continue
+            segmentStart = segment.StartTime()
+            if end is not None and segmentStart >= end:
+                break
+
+            for timestamp, topicId, payload in segment.Records(start):
+                if end is not None and timestamp >= end:
+                    return
+                if topicIds is not None and topicId not in topicIds:
+                    continue
+
+                name, type = self.__topics[topicId]
+                if raw:
+                    yield timestamp, name, payload
+                else:
+                    yield timestamp, name, type.deserialize(bytes(payload))
+
+    def Close(self):
+        for segment in self.__segments:
+            segment.Close()
+        self.__segments = []
@@ -0,0 +1,162 @@
+import os
+import mmap
+import time
+import threading
+
+from typing import Any
+
+from cyclonedds.sub import DataReader
+from cyclonedds.core import DDSException, Listener
+
+# raw cdr take, samples are written to the log without being deserialized
+from ..core.channel import ChannelFactory, CHANNEL_TAKE_MAX, RAW_TAKE_ARGS, ddspy_take
+from ..core.channel_inproc import CHANNEL_TRANSPORT_DDS
+from .log_format import *
+
+
+"""
+" class LogSegmentWriter
+"""
+class LogSegmentWriter:
+    def __init__(self, path: str, segment: int, size: int):
+        self.__logFile = open(SegmentPath(path, segment), "w+b")
+        self.__idxFile = open(IndexPath(path, segment), "w+b")
+        self.__logFile.truncate(size)
+        self.__idxFile.truncate(max(INDEX_ENTRY.size, size // 4))
+        self.__log = mmap.mmap(self.__logFile.fileno(), size)
+        self.__idx = mmap.mmap(self.__idxFile.fileno(), max(INDEX_ENTRY.size, size // 4))
+        SEGMENT_HEADER.pack_into(self.__log, 0, LOG_MAGIC, LOG_VERSION, segment, time.time_ns(), 0)
+        self.__offset = SEGMENT_HEADER.size
+        self.__idxOffset = 0
+
+    def Fits(self, length: int):
+        return (self.__offset + RecordSize(length) <= len(self.__log)
+                and self.__idxOffset + INDEX_ENTRY.size <= len(self.__idx))
+
+    def Append(self, timestamp: int, topicId: int, data: bytes):
+        offset = self.__offset
+        length = len(data)
+        RECORD_HEADER.pack_into(self.__log, offset, timestamp, topicId, 0, length)
+        start = offset + RECORD_HEADER.size
+        self.__log[start:start + length] = data
+        INDEX_ENTRY.pack_into(self.__idx, self.__idxOffset, timestamp, offset)
+        self.__offset = offset + RecordSize(length)
+        self.__idxOffset += INDEX_ENTRY.size
+
+    def Close(self):
+        self.__log.flush()
+        self.__idx.flush()
+        self.__log.close()
+        self.__idx.close()
+        self.__logFile.truncate(self.__offset)
+        self.__idxFile.truncate(self.__idxOffset)
+        self.__logFile.close()
+        self.__idxFile.close()
+
+
+"""
+" class Recorder
+" subscribes to a list of (name, type) topics and appends the raw cdr samples to a segmented log.
+" records carry the time they were taken from the reader, see log_format.
+"
+" usage:
+"     recorder = Recorder("/tmp/lowstate_log", [("rt/lowstate", LowState_), ("rt/sportmodestate", SportModeState_)])
+"     recorder.Start()
+"     ...
+"     recorder.Stop()
+"""
+class Recorder:
+    def __init__(self, path: str, topics: list, segmentSize: int = LOG_SEGMENT_SIZE):
+        self.__path = path
+        self.__topics = list(topics)
+        self.__segmentSize = segmentSize
+        self.__segment = None
+        self.__segmentCount = 0
+        self.__readers = []
+        self.__lock = threading.Lock()
+        self.__lastTimestamp = 0
+        self.__recorded = 0
+        self.__started = False
+
+    def Start(self):
+        if self.__started:
+            return True
+
+        if RAW_TAKE_ARGS is None:
+            print("[Recorder] raw take is not supported by this cyclonedds version")
+            return False
+
+        factory = ChannelFactory()
+        if factory.GetTransport() != CHANNEL_TRANSPORT_DDS:
+            print("[Recorder] recording needs the dds transport")
+            return False
+
+        os.makedirs(self.__path, exist_ok=True)
+        WriteTopics(self.__path, self.__topics)
+        self.__segment = LogSegmentWriter(self.__path, 0, self.__segmentSize)
+        self.__segmentCount = 1
+
+        participant = factory.GetParticipant()
+        for id, (name, type) in enumerate(self.__topics):
+            topic = factory.GetTopic(name, type)
+            listener = Listener(on_data_available=lambda reader, id=id: self.__OnDataAvailable(reader, id))
+            self.__readers.append(DataReader(participant, topic, None, listener))
+
+        self.__started = True
+        return True
+
+    def Stop(self):
+        if not self.__started:
+            return
+
+        self.__readers.clear()
+        with self.__lock:
+            self.__segment.Close()
+            self.__segment = None
+        self.__started = False
+
+    def GetRecordedCount(self):
+        return self.__recorded
+
+    def __OnDataAvailable(self, reader: DataReader, topicId: int):
+        while True:
+            try:
+                samples = ddspy_take(reader._ref, *RAW_TAKE_ARGS, CHANNEL_TAKE_MAX)
+            except DDSException as e:
+                print("[Recorder] catch DDSException error. msg:", e.msg)
+                return
+            except Exception as e:
+                print("[Recorder] take sample error. msg:", e)
+                return
+
+            if type(samples) == int:
+                print("[Recorder] take sample error. code:", samples)
+                return
+
+            if not samples or not self.__Append(samples, topicId) or len(samples) < CHANNEL_TAKE_MAX:
+                return
+
+    # the timestamp is taken under the lock and never goes back, so records of every topic are
+    # appended in timestamp order, which the seek index of LogReader relies on. it is the take time,
+    # shared by every sample of one take: samples that queued up in the reader, e.g. behind a slow
+    # listener, are recorded and replayed as one burst.
+    def __Append(self, samples: list, topicId: int):
+        with self.__lock:
+            if self.__segment is None:
+                return False
+            timestamp = max(time.time_ns(), self.__lastTimestamp)
+            self.__lastTimestamp = timestamp
+            for data, info in samples:
+                if not info.valid_data:
+                    continue
+                if not self.__segment.Fits(len(data)):
+                    self.__Rotate(len(data))
+                self.__segment.Append(timestamp, topicId, data)
+                self.__recorded += 1
+            return True
+
+    def __Rotate(self, length: int):
+        self.__segment.Close()
+        size = max(self.__segmentSize, SEGMENT_HEADER.size + RecordSize(length))
+        self.__segment = LogSegmentWriter(self.__path, self.__segmentCount, size)
+        self.__segmentCount += 1
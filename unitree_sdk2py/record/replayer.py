@@ -0,0 +1,60 @@
+import time
+
+from ..core.channel import ChannelPublisher
+from .log_reader import LogReader
+
+
+"""
+" class Replayer
+" republishes a recorded log through ChannelPublisher.
+" speed: 1.0 original timing, 2.0 twice as fast, 0 or less as fast as possible.
+"""
+class Replayer:
+    def __init__(self, path: str, speed: float = 1.0, topics: list = None, remap: dict = None):
+        self.__reader = LogReader(path)
+        self.__speed = speed
+        self.__topics = topics
+        self.__remap = {} if remap is None else remap
+        self.__publishers = {}
+        self.__stop = False
+
+    def Init(self):
+        for name in self.__reader.GetTopics().values():
+            if self.__topics is not None and name not in self.__topics:
+                continue
+            publisher = ChannelPublisher(self.__remap.get(name, name), self.__reader.GetType(name))
+            publisher.Init()
+            self.__publishers[name] = publisher
+
+    # replay [start, end) in log time (ns). return the number of samples published.
+    def Play(self, start: int = None, end: int = None):
+        self.__stop = False
+        count = 0
+        logStart = None
+        wallStart = None
+
+        for timestamp, name, sample in self.__reader.Read(start, end, list(self.__publishers.keys())):
+            if self.__stop:
+                break
+
+            if self.__speed > 0:
+                if logStart is None:
+                    logStart = timestamp
+                    wallStart = time.monotonic()
+                delay = (timestamp - logStart) / 1e9 / self.__speed - (time.monotonic() - wallStart)
+                if delay > 0:
+                    time.sleep(delay)
+
+            if self.__publishers[name].Write(sample):
+                count += 1
+
+        return count
+
+    def Stop(self):
+        self.__stop = True
+
+    def Close(self):
+        for publisher in self.__publishers.values():
+            publisher.Close()
+        self.__publishers = {}
+        self.__reader.Close()
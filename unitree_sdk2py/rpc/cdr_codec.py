@@ -0,0 +1,118 @@
+import struct
+
+from typing import Any
+
+from ..idl.unitree_api.msg.dds_ import Request_ as Request
+from ..idl.unitree_api.msg.dds_ import RequestHeader_ as RequestHeader
+from ..idl.unitree_api.msg.dds_ import RequestIdentity_ as RequestIdentity
+from ..idl.unitree_api.msg.dds_ import RequestLease_ as RequestLease
+from ..idl.unitree_api.msg.dds_ import RequestPolicy_ as RequestPolicy
+from ..idl.unitree_api.msg.dds_ import Response_ as Response
+from ..idl.unitree_api.msg.dds_ import ResponseHeader_ as ResponseHeader
+from ..idl.unitree_api.msg.dds_ import ResponseStatus_ as ResponseStatus
+
+
+"""
+" hand written xcdr1 little endian codec of Request_/Response_, the encoding the generated
+" types use by default. the binary member is copied as one block of bytes instead of going
+" through one python int per byte. frames are padded to 4 bytes like those of the stock
+" DataWriter. other encodings fall back to the generated types.
+"""
+CDR_LE_HEADER = b"\x00\x01\x00\x00"
+
+REQUEST_HEAD = struct.Struct("<qqqi?")     # identity.id, identity.api_id, lease.id, policy.priority, policy.noreply
+RESPONSE_HEAD = struct.Struct("<qqi")      # identity.id, identity.api_id, status.code
+UINT32 = struct.Struct("<I")
+PADDING = b"\x00\x00\x00"
+
+
+"""
+" function BinaryView. bytes like view of a binary payload without copying buffers.
+" accepts bytes, bytearray, memoryview, numpy arrays or a list of ints.
+"""
+def BinaryView(binary: Any):
+    if binary is None:
+        return b""
+    if isinstance(binary, (bytes, bytearray)):
+        return binary
+    if isinstance(binary, (list, tuple)):
+        return bytes(binary)
+    return memoryview(binary).cast("B")
+
+
+def BinaryBytes(binary: Any):
+    return binary if isinstance(binary, bytes) else bytes(BinaryView(binary))
+
+
+def EncodeRequest(request: Request):
+    header = request.header
+    parts = [CDR_LE_HEADER, REQUEST_HEAD.pack(header.identity.id, header.identity.api_id, header.lease.id,
+                                              header.policy.priority, header.policy.noreply)]
+    _AppendBody(parts, REQUEST_HEAD.size, request.parameter, request.binary)
+    return b"".join(parts)
+
+
+def EncodeResponse(response: Response):
+    header = response.header
+    parts = [CDR_LE_HEADER, RESPONSE_HEAD.pack(header.identity.id, header.identity.api_id, header.status.code)]
+    _AppendBody(parts, RESPONSE_HEAD.size, response.data, response.binary)
+    return b"".join(parts)
+
+
+def DecodeRequest(data: bytes):
+    if not data.startswith(CDR_LE_HEADER):
+        request = Request.deserialize(data)
+        request.binary = bytes(request.binary)
+        return request
+
+    id, apiId, leaseId, priority, noreply = REQUEST_HEAD.unpack_from(data, 4)
+    parameter, binary = _ParseBody(data, 4 + REQUEST_HEAD.size)
+    header = RequestHeader(RequestIdentity(id, apiId), RequestLease(leaseId), RequestPolicy(priority, noreply))
+    return Request(header, parameter, binary)
+
+
+def DecodeResponse(data: bytes):
+    if not data.startswith(CDR_LE_HEADER):
+        response = Response.deserialize(data)
+        response.binary = bytes(response.binary)
+        return response
+
+    id, apiId, code = RESPONSE_HEAD.unpack_from(data, 4)
+    text, binary = _ParseBody(data, 4 + RESPONSE_HEAD.size)
+    return Response(ResponseHeader(RequestIdentity(id, apiId), ResponseStatus(code)), text, binary)
+
+
+# string then sequence<uint8>, offsets relative to the start of the body
+def _AppendBody(parts: list, offset: int, text: str, binary: Any):
+    text = text.encode("utf-8")
+    binary = BinaryView(binary)
+
+    pad = -offset & 3
+    parts.append(PADDING[:pad])
+    offset += pad + UINT32.size + len(text) + 1
+    parts.append(UINT32.pack(len(text) + 1))
+    parts.append(text)
+    parts.append(b"\x00")
+
+    pad = -offset & 3
+    parts.append(PADDING[:pad])
+    offset += pad + UINT32.size + len(binary)
+    parts.append(UINT32.pack(len(binary)))
+    parts.append(binary)
+
+    # DataWriter.write pads the serialized sample to a multiple of 4 before it is sent, do the same
+    parts.append(PADDING[:-offset & 3])
+
+
+def _ParseBody(data: bytes, pos: int):
+    # alignment counts from the end of the encapsulation header
+    pos += -(pos - 4) & 3
+    length = UINT32.unpack_from(data, pos)[0]
+    pos += UINT32.size
+    text = data[pos:pos + length - 1].decode("utf-8")
+    pos += length
+
+    pos += -(pos - 4) & 3
+    count = UINT32.unpack_from(data, pos)[0]
+    pos += UINT32.size
+    return text, data[pos:pos + count]
@@ -1,5 +1,11 @@
+import time
+
+from typing import Callable
+
 from .client_base import ClientBase
+from .client_future import ClientFuture, GatherResults
 from .lease_client import LeaseClient
+from .response_cache import ResponseCache
 from .internal import *
 
 """
@@ -13,6 +19,7 @@ class Client(ClientBase):
         self.__apiVersion = None
         self.__leaseClient = None
         self.__enableLease = enabaleLease
+        self.__cache = ResponseCache()
 
         if (self.__enableLease):
             self.__leaseClient = LeaseClient(serviceName)
@@ -22,6 +29,15 @@ class Client(ClientBase):
         if self.__enableLease:
             self.__leaseClient.WaitApplied()
 
+    def WaitReady(self, timeout: float = None):
+        if not self.__enableLease:
+            return super().WaitReady(timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not super().WaitReady(timeout):
+            return False
+        return self.__leaseClient.WaitReady(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
     def GetLeaseId(self):
         if self.__enableLease:
             return self.__leaseClient.GetId()
@@ -32,23 +48,54 @@ class Client(ClientBase):
         return self.__apiVersion
     
     def GetServerApiVersion(self):
-        code, apiVerson = self._CallBase(RPC_API_ID_INTERNAL_API_VERSION, "{}", 0, 0)
+        return self.GetServerApiVersionAsync().GetResult()
+
+    def GetServerApiVersionAsync(self):
+        return self.__CallAsync(RPC_API_ID_INTERNAL_API_VERSION, "{}", 0, 0, self.__ParseServerApiVersion, None)
+
+    def __ParseServerApiVersion(self, code: int, apiVerson: str):
         if code != 0:
             print("[Client] get server api version error:", code)
             return code, None
         else:
             return code, apiVerson
 
+    # cache successful responses of a getter for ttl seconds, ttl <= 0 disables.
+    # concurrent identical calls share one request while it is in flight.
+    def SetApiCache(self, apiId: int, ttl: float):
+        self.__cache.SetTtl(apiId, ttl)
+
+    def InvalidateCache(self, apiId: int = None):
+        self.__cache.Invalidate(apiId)
+
+    def GetCacheStats(self):
+        return self.__cache.GetStats()
+
     def _SetApiVerson(self, apiVersion: str):
         self.__apiVersion = apiVersion
 
-    def _Call(self, apiId: int, parameter: str):
+    # calling any of the setters drops the cached responses of the getter
+    def _RegistCacheInvalidation(self, apiId: int, setterApiIds: list):
+        self.__cache.AddInvalidation(apiId, setterApiIds)
+
+    # timeout is the budget of this call including retries, the client timeout when None
+    def _Call(self, apiId: int, parameter: str, timeout: float = None):
+        return self._CallAsync(apiId, parameter, timeout=timeout).GetResult()
+            
+    # non-blocking call. return a ClientFuture, GetResult() or await it for (code, data).
+    def _CallAsync(self, apiId: int, parameter: str, parser: Callable = None, timeout: float = None):
         ret, proirity, leaseId = self.__CheckApi(apiId)
         if ret == 0:
-            return self._CallBase(apiId, parameter, proirity, leaseId)
+            return self.__CallAsync(apiId, parameter, proirity, leaseId, parser, timeout)
         else:
-            return RPC_ERR_CLIENT_API_NOT_REG, None
-            
+            return ClientFuture(apiId, code=RPC_ERR_CLIENT_API_NOT_REG, parser=parser)
+
+    # calls are (apiId, parameter) or (apiId, parameter, parser). all requests are written back to
+    # back before waiting, the results come back in order against one shared deadline.
+    def _CallBatch(self, calls: list, timeout: float = None):
+        futures = [self._CallAsync(*call) for call in calls]
+        return GatherResults(futures, timeout)
+
     def _CallNoReply(self, apiId: int, parameter: str):
         ret, proirity, leaseId = self.__CheckApi(apiId)
         if ret == 0:
@@ -57,15 +104,26 @@ class Client(ClientBase):
             return RPC_ERR_CLIENT_API_NOT_REG
     
     def _CallRequestWithParamAndBin(self, apiId: int, requestParamter: str,
-                                    requestBinary: list):
+                                    requestBinary: list, timeout: float = None):
         ret, proirity, leaseId = self.__CheckApi(apiId)
         if ret == 0:
             return self._CallRequestWithParamAndBinBase(apiId, requestParamter,
                                                         requestBinary, proirity,
-                                                        leaseId)
+                                                        leaseId, timeout)
         else:
             return RPC_ERR_CLIENT_API_NOT_REG, None
 
+    def _CallRequestWithParamAndBinAsync(self, apiId: int, requestParamter: str,
+                                         requestBinary: list, parser: Callable = None,
+                                         timeout: float = None):
+        ret, proirity, leaseId = self.__CheckApi(apiId)
+        if ret == 0:
+            return self._CallRequestWithParamAndBinAsyncBase(apiId, requestParamter,
+                                                             requestBinary, proirity,
+                                                             leaseId, parser, timeout)
+        else:
+            return ClientFuture(apiId, code=RPC_ERR_CLIENT_API_NOT_REG, parser=parser)
+
     def _CallRequestWithParamAndBinNoReply(self, apiId: int, requestParamter: str,
                                            requestBinary: list):
         ret, proirity, leaseId = self.__CheckApi(apiId)
@@ -78,13 +136,22 @@ class Client(ClientBase):
         else:
             return RPC_ERR_CLIENT_API_NOT_REG
 
-    def _CallBinary(self, apiId: int, parameter: list):
+    # binary parameters may be bytes, bytearray, memoryview, a numpy uint8 buffer or a list of ints.
+    # binary results are bytes.
+    def _CallBinary(self, apiId: int, parameter: list, timeout: float = None):
         ret, proirity, leaseId = self.__CheckApi(apiId)
         if ret == 0:
-            return self._CallBinaryBase(apiId, parameter, proirity, leaseId)
+            return self._CallBinaryBase(apiId, parameter, proirity, leaseId, timeout)
         else:
             return RPC_ERR_CLIENT_API_NOT_REG, None
 
+    def _CallBinaryAsync(self, apiId: int, parameter: list, parser: Callable = None, timeout: float = None):
+        ret, proirity, leaseId = self.__CheckApi(apiId)
+        if ret == 0:
+            return self._CallBinaryAsyncBase(apiId, parameter, proirity, leaseId, parser, timeout)
+        else:
+            return ClientFuture(apiId, code=RPC_ERR_CLIENT_API_NOT_REG, parser=parser)
+
     def _CallBinaryNoReply(self, apiId: int, parameter: list):
         ret, proirity, leaseId = self.__CheckApi(apiId)
         if ret == 0:
@@ -95,6 +162,17 @@ class Client(ClientBase):
     def _RegistApi(self, apiId: int, proirity: int):
         self.__apiMapping[apiId] = proirity
     
+    def __CallAsync(self, apiId: int, parameter: str, proirity: int, leaseId: int, parser: Callable, timeout: float):
+        if self.__cache.IsCached(apiId):
+            return self.__cache.Call(apiId, parameter, self.GetTimeout() if timeout is None else timeout,
+                                     lambda: self._CallAsyncBase(apiId, parameter, proirity, leaseId, timeout=timeout), parser)
+
+        future = self._CallAsyncBase(apiId, parameter, proirity, leaseId, parser, timeout)
+        if self.__cache.IsSetter(apiId):
+            # a getter sent before the setter took effect may have refilled the cache
+            future.AddDoneCallback(lambda f: self.__cache.OnSetter(apiId))
+        return future
+
     def __CheckApi(self, apiId: int):
         proirity = 0
         leaseId = 0
@@ -108,4 +186,19 @@ class Client(ClientBase):
             if self.__enableLease:
                 leaseId = self.__leaseClient.GetId()
 
-        return 0, proirity, leaseId
\ No newline at end of file
+        self.__cache.OnSetter(apiId)
+        return 0, proirity, leaseId
+
+
+"""
+" function WaitClientsReady. clients match in the background, so wait them all against one deadline.
+"""
+def WaitClientsReady(clients: list, timeout: float = None):
+    deadline = None if timeout is None else time.monotonic() + timeout
+    ready = True
+    for client in clients:
+        remain = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not client.WaitReady(remain):
+            print("[Client] wait client ready timeout. type:", type(client).__name__)
+            ready = False
+    return ready
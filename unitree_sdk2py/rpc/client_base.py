@@ -1,5 +1,7 @@
 import time
 
+from typing import Callable
+
 from ..idl.unitree_api.msg.dds_ import Request_ as Request
 from ..idl.unitree_api.msg.dds_ import RequestHeader_ as RequestHeader
 from ..idl.unitree_api.msg.dds_ import RequestLease_ as RequestLease
@@ -7,8 +9,10 @@ from ..idl.unitree_api.msg.dds_ import RequestIdentity_ as RequestIdentity
 from ..idl.unitree_api.msg.dds_ import RequestPolicy_ as RequestPolicy
 
 from ..utils.future import FutureResult
-
-from .client_stub import ClientStub
+from .client_stub import ClientStubPool
+from .client_future import ClientFuture
+from .client_retry import RetryPolicy, CallTimer
+from .rpc_stats import RpcStats
 from .internal import *
 
 
@@ -18,111 +22,162 @@ from .internal import *
 class ClientBase:
     def __init__(self, serviceName: str):
         self.__timeout = 1.0
-        self.__stub = ClientStub(serviceName)
-        self.__stub.Init()
+        self.__serviceName = serviceName
+        # clients of the same service share one stub, responses are matched by request id
+        self.__stub = ClientStubPool().Acquire(serviceName)
+        self.__retryPolicies = {}
+        self.__stats = RpcStats(serviceName)
+
+    def Close(self):
+        if self.__stub is not None:
+            ClientStubPool().Release(self.__serviceName)
+            self.__stub = None
 
     def SetTimeout(self, timeout: float):
         self.__timeout = timeout
 
-    def _CallBase(self, apiId: int, parameter: str, proirity: int = 0, leaseId: int = 0):
-        # print("[CallBase] call apiId:", apiId, ", proirity:", proirity, ", leaseId:", leaseId)
-        header = self.__SetHeader(apiId, leaseId, proirity, False)
-        request = Request(header, parameter, [])
+    def GetTimeout(self):
+        return self.__timeout
 
-        future = self.__stub.SendRequest(request, self.__timeout)
-        if future is None:
-            return RPC_ERR_CLIENT_SEND, None
+    # retry an idempotent api within the call budget: attempts sends at most, each waiting
+    # attemptTimeout or an equal share of the budget. hedge sends one extra attempt once the call
+    # takes longer than the p95 latency of the api. the server may run such a call more than once.
+    def SetApiRetry(self, apiId: int, attempts: int = 3, attemptTimeout: float = None, hedge: bool = False):
+        if attempts > 1 or hedge:
+            self.__retryPolicies[apiId] = RetryPolicy(attempts, attemptTimeout, hedge)
+        else:
+            self.__retryPolicies.pop(apiId, None)
 
-        result = future.GetResult(self.__timeout)
+    def GetApiRetryStats(self, apiId: int):
+        policy = self.__retryPolicies.get(apiId)
+        return None if policy is None else policy.GetStats()
 
-        if result.code != FutureResult.FUTURE_SUCC:
-            self.__stub.RemoveFuture(request.header.identity.id)
-            code = RPC_ERR_CLIENT_API_TIMEOUT if result.code == FutureResult.FUTUTE_ERR_TIMEOUT else RPC_ERR_UNKNOWN
-            return code, None
+    # per api calls, latency histogram (us from the first send), timeouts, lease denials and error codes
+    def GetApiStats(self):
+        return self.__stats.Snapshot()
 
-        response = result.value
+    def ResetApiStats(self):
+        self.__stats.Reset()
 
-        if response.header.identity.api_id != apiId:
-            return RPC_ERR_CLIENT_API_NOT_MATCH, None
-        else:
-            return response.header.status.code, response.data
+    # sink(GetApiStats()) every interval seconds, printed when sink is None
+    def StartStatsDump(self, interval: float, sink: Callable = None):
+        self.__stats.StartDump(interval, sink)
+
+    def StopStatsDump(self):
+        self.__stats.StopDump()
+
+    # wait until the service endpoints are matched. return False on timeout.
+    def WaitReady(self, timeout: float = None):
+        return self.__stub.WaitReady(timeout)
+
+    def IsReady(self):
+        return self.__stub.IsReady()
+
+    # timeout is the budget of the call including retries, the client timeout when None
+    def _CallBase(self, apiId: int, parameter: str, proirity: int = 0, leaseId: int = 0, timeout: float = None):
+        # print("[CallBase] call apiId:", apiId, ", proirity:", proirity, ", leaseId:", leaseId)
+        return self._CallAsyncBase(apiId, parameter, proirity, leaseId, timeout=timeout).GetResult()
+
+    def _CallAsyncBase(self, apiId: int, parameter: str, proirity: int = 0, leaseId: int = 0,
+                       parser: Callable = None, timeout: float = None):
+        header = self.__SetHeader(apiId, leaseId, proirity, False)
+        request = Request(header, parameter, [])
+        return self.__SendRequest(request, False, parser, timeout)
 
     def _CallNoReplyBase(self, apiId: int, parameter: str, proirity: int, leaseId: int):
         header = self.__SetHeader(apiId, leaseId, proirity, True)
         request = Request(header, parameter, [])
-
-        if self.__stub.Send(request, self.__timeout):
-            return 0
-        else:
-            return RPC_ERR_CLIENT_SEND
+        return self.__SendNoReply(request)
 
     def _CallRequestWithParamAndBinBase(self, apiId: int, requestParamter: str,
                                         requestBinary: list, proirity: int = 0,
-                                        leaseId: int = 0):
+                                        leaseId: int = 0, timeout: float = None):
+        return self._CallRequestWithParamAndBinAsyncBase(apiId, requestParamter, requestBinary,
+                                                         proirity, leaseId, timeout=timeout).GetResult()
+
+    def _CallRequestWithParamAndBinAsyncBase(self, apiId: int, requestParamter: str,
+                                             requestBinary: list, proirity: int = 0,
+                                             leaseId: int = 0, parser: Callable = None,
+                                             timeout: float = None):
         header = self.__SetHeader(apiId, leaseId, proirity, False)
         request = Request(header, requestParamter, requestBinary)
-
-        future = self.__stub.SendRequest(request, self.__timeout)
-        if future is None:
-            return RPC_ERR_CLIENT_SEND, None
-
-        result = future.GetResult(self.__timeout)
-
-        if result.code != FutureResult.FUTURE_SUCC:
-            self.__stub.RemoveFuture(request.header.identity.id)
-            code = RPC_ERR_CLIENT_API_TIMEOUT if result.code == FutureResult.FUTUTE_ERR_TIMEOUT else RPC_ERR_UNKNOWN
-            return code, None
-
-        response = result.value
-
-        if response.header.identity.api_id != apiId:
-            return RPC_ERR_CLIENT_API_NOT_MATCH, None
-        else:
-            return response.header.status.code, response.data
+        return self.__SendRequest(request, False, parser, timeout)
 
     def _CallRequestWithParamAndBinNoReplyBase(self, apiId: int, requestParamter: str,
                                                requestBinary: list, proirity: int,
                                                leaseId: int):
         header = self.__SetHeader(apiId, leaseId, proirity, True)
-        request = Request(header, requestParamter, request_binary)
+        request = Request(header, requestParamter, requestBinary)
+        return self.__SendNoReply(request)
 
-        if self.__stub.Send(request, self.__timeout):
-            return 0
-        else:
-            return RPC_ERR_CLIENT_SEND
+    def _CallBinaryBase(self, apiId: int, parameter: list, proirity: int, leaseId: int, timeout: float = None):
+        return self._CallBinaryAsyncBase(apiId, parameter, proirity, leaseId, timeout=timeout).GetResult()
 
-    def _CallBinaryBase(self, apiId: int, parameter: list, proirity: int, leaseId: int):
+    def _CallBinaryAsyncBase(self, apiId: int, parameter: list, proirity: int, leaseId: int,
+                             parser: Callable = None, timeout: float = None):
         header = self.__SetHeader(apiId, leaseId, proirity, False)
         request = Request(header, "", parameter)
-        
-        future = self.__stub.SendRequest(request, self.__timeout)
+        return self.__SendRequest(request, True, parser, timeout)
+
+    def _CallBinaryNoReplyBase(self, apiId: int, parameter: list, proirity: int, leaseId: int):
+        header = self.__SetHeader(apiId, leaseId, proirity, True)
+        request = Request(header, "", parameter)
+        return self.__SendNoReply(request)
+
+    def __SendRequest(self, request: Request, binary: bool, parser: Callable, timeout: float):
+        apiId = request.header.identity.api_id
+        timeout = self.__timeout if timeout is None else timeout
+        start = time.monotonic()
+
+        future = self.__stub.SendRequest(request, timeout)
         if future is None:
-            return RPC_ERR_CLIENT_SEND, None
+            self.__stats.OnCall(apiId, RPC_ERR_CLIENT_SEND)
+            return ClientFuture(apiId, code=RPC_ERR_CLIENT_SEND, parser=parser)
 
-        result = future.GetResult(self.__timeout)
-        if result.code != FutureResult.FUTURE_SUCC:
+        # the send may have waited for the service, the call deadline still counts from start
+        onTimeout = lambda: self.__stats.OnCall(apiId, RPC_ERR_CLIENT_API_TIMEOUT, time.monotonic() - start)
+        remaining = start + timeout - time.monotonic()
+        if remaining <= 0 and not future.Done():
             self.__stub.RemoveFuture(request.header.identity.id)
-            code = RPC_ERR_CLIENT_API_TIMEOUT if result.code == FutureResult.FUTUTE_ERR_TIMEOUT else RPC_ERR_UNKNOWN
-            return code, None
+            onTimeout()
+            return ClientFuture(apiId, code=RPC_ERR_CLIENT_API_TIMEOUT, parser=parser)
 
-        response = result.value
+        future.AddDoneCallback(lambda f: self.__OnResponse(apiId, f, start))
 
-        if response.header.identity.api_id != apiId:
-            return RPC_ERR_CLIENT_API_NOT_MATCH, None
-        else:
-            return response.header.status.code, response.binary
+        policy = self.__retryPolicies.get(apiId)
+        if policy is not None:
+            future.AddDoneCallback(lambda f: policy.AddLatency(time.monotonic() - start))
+            for delay, hedge in policy.GetSchedule(timeout):
+                CallTimer().Schedule(start + delay, lambda hedge=hedge: self.__Resend(request, future, policy, hedge, start + timeout))
 
-    def _CallBinaryNoReplyBase(self, apiId: int, parameter: list, proirity: int, leaseId: int):
-        header = self.__SetHeader(apiId, leaseId, proirity, True)
-        request = Request(header, "", parameter)
+        return ClientFuture(apiId, future, self.__stub, max(0.0, remaining), binary, parser=parser, onTimeout=onTimeout)
 
+    def __SendNoReply(self, request: Request):
+        apiId = request.header.identity.api_id
         if self.__stub.Send(request, self.__timeout):
+            self.__stats.OnCall(apiId, 0)
             return 0
         else:
+            self.__stats.OnCall(apiId, RPC_ERR_CLIENT_SEND)
             return RPC_ERR_CLIENT_SEND
+
+    def __OnResponse(self, apiId: int, future, start: float):
+        result = future.GetResult(0)
+        code = result.value.header.status.code if result.code == FutureResult.FUTURE_SUCC else RPC_ERR_UNKNOWN
+        self.__stats.OnCall(apiId, code, time.monotonic() - start)
+
+    def __Resend(self, request: Request, future, policy: RetryPolicy, hedge: bool, deadline: float):
+        remain = deadline - time.monotonic()
+        if future.Done() or remain <= 0:
+            return
+
+        header = request.header
+        header = self.__SetHeader(header.identity.api_id, header.lease.id, header.policy.priority, False)
+        if self.__stub.Resend(Request(header, request.parameter, request.binary), future, remain):
+            policy.OnAttempt(hedge)
     
     def __SetHeader(self, apiId: int, leaseId: int, priority: int, noReply: bool):
-        identity = RequestIdentity(time.monotonic_ns(), apiId)
+        identity = RequestIdentity(self.__stub.NextRequestId(), apiId)
         lease = RequestLease(leaseId)
         policy = RequestPolicy(priority, noReply)
         return RequestHeader(identity, lease, policy)
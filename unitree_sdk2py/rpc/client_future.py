@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+from typing import Any, Callable
+
+from ..utils.future import FutureResult
+from .request_future import RequestFuture
+from .cdr_codec import BinaryBytes
+from .internal import *
+
+
+"""
+" class ClientFuture
+" result of an asynchronous call. GetResult blocks, 'await future' suspends the coroutine.
+" the result is (code, data), or parser(code, data) when a parser is given.
+" the default wait is bounded by the call timeout counted from the send time.
+"""
+class ClientFuture:
+    def __init__(self, apiId: int, future: RequestFuture = None, stub = None, timeout: float = 1.0,
+                 binary: bool = False, code: int = RPC_ERR_CLIENT_SEND, parser: Callable = None, data: Any = None,
+                 onTimeout: Callable = None):
+        self.__apiId = apiId
+        self.__future = future
+        self.__stub = stub
+        self.__deadline = time.monotonic() + timeout
+        self.__binary = binary
+        self.__parser = parser
+        self.__onTimeout = onTimeout
+        self.__result = None if future is not None else (code, data)
+
+    def GetApiId(self):
+        return self.__apiId
+
+    def GetRequestId(self):
+        return None if self.__future is None else self.__future.GetRequestId()
+
+    # another future of the same request with its own parser, for callers sharing the request
+    def Share(self, parser: Callable = None):
+        if self.__future is None:
+            code, data = self.__result
+            return ClientFuture(self.__apiId, code=code, parser=parser, data=data)
+        return ClientFuture(self.__apiId, self.__future, self.__stub, self.__Remaining(), self.__binary, parser=parser,
+                            onTimeout=self.__onTimeout)
+
+    def Done(self):
+        return self.__result is not None or self.__future.Done()
+
+    def AddDoneCallback(self, callback: Callable):
+        if self.__future is None:
+            callback(self)
+        else:
+            self.__future.AddDoneCallback(lambda f: callback(self))
+
+    def GetResult(self, timeout: float = None):
+        if self.__result is None:
+            self.__result = self.__WaitResponse(self.__Remaining() if timeout is None else timeout)
+
+        if self.__parser is None:
+            return self.__result
+        return self.__parser(*self.__result)
+
+    async def AsyncResult(self, timeout: float = None):
+        if not self.Done():
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+
+            def OnDone(f):
+                loop.call_soon_threadsafe(lambda: waiter.done() or waiter.set_result(None))
+
+            self.AddDoneCallback(OnDone)
+            try:
+                await asyncio.wait_for(waiter, self.__Remaining() if timeout is None else timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        return self.GetResult(0)
+
+    def __await__(self):
+        return self.AsyncResult().__await__()
+
+    def __Remaining(self):
+        return max(0.0, self.__deadline - time.monotonic())
+
+    def __WaitResponse(self, timeout: float):
+        result = self.__future.GetResult(timeout)
+
+        if result.code != FutureResult.FUTURE_SUCC:
+            # futures sharing the request count the timeout once, whichever removes it
+            removed = [self.__stub.RemoveFuture(requestId) for requestId in self.__future.GetRequestIds()]
+            if any(removed) and result.code == FutureResult.FUTUTE_ERR_TIMEOUT and self.__onTimeout is not None:
+                self.__onTimeout()
+            code = RPC_ERR_CLIENT_API_TIMEOUT if result.code == FutureResult.FUTUTE_ERR_TIMEOUT else RPC_ERR_UNKNOWN
+            return code, None
+
+        response = result.value
+
+        if response.header.identity.api_id != self.__apiId:
+            return RPC_ERR_CLIENT_API_NOT_MATCH, None
+        elif self.__binary:
+            return response.header.status.code, BinaryBytes(response.binary)
+        else:
+            return response.header.status.code, response.data
+
+
+"""
+" function GatherResults. the requests of the futures are already in flight, so waiting them
+" in turn against one deadline costs a single round trip. timeout None keeps each call's own.
+"""
+def GatherResults(futures: list, timeout: float = None):
+    deadline = None if timeout is None else time.monotonic() + timeout
+    results = []
+    for future in futures:
+        if deadline is None:
+            results.append(future.GetResult())
+        else:
+            results.append(future.GetResult(max(0.0, deadline - time.monotonic())))
+    return results
@@ -0,0 +1,133 @@
+import heapq
+import math
+import time
+
+from collections import deque
+from threading import Thread, Condition, Lock
+from typing import Callable
+
+from ..utils.singleton import Singleton
+
+
+"""
+" retry defaults
+"""
+RETRY_HEDGE_PERCENTILE = 95.0
+# the hedge delay is the exact percentile of the last window latencies. it needs this many
+# calls of the api and is refreshed every refresh calls.
+RETRY_HEDGE_MIN_SAMPLES = 20
+RETRY_HEDGE_WINDOW = 512
+RETRY_HEDGE_REFRESH = 32
+
+
+"""
+" class RetryPolicy
+" retries and hedging of an idempotent api. the call budget is split in attempts, an attempt that
+" got no response by its end is sent again under a new request id. with hedging one extra attempt
+" is sent once the call has taken longer than the p95 latency of the api. the first response of
+" any attempt completes the call.
+"""
+class RetryPolicy:
+    def __init__(self, attempts: int = 3, attemptTimeout: float = None, hedge: bool = False,
+                 hedgePercentile: float = RETRY_HEDGE_PERCENTILE):
+        self.attempts = max(1, attempts)
+        self.attemptTimeout = attemptTimeout
+        self.hedge = hedge
+        self.hedgePercentile = hedgePercentile
+
+        self.__lock = Lock()
+        self.__latency = deque(maxlen=RETRY_HEDGE_WINDOW)
+        self.__sinceRefresh = 0
+        self.__hedgeDelay = None
+        self.__retries = 0
+        self.__hedges = 0
+
+    # latency of a completed call, from the first send
+    def AddLatency(self, seconds: float):
+        with self.__lock:
+            self.__latency.append(seconds)
+            self.__sinceRefresh += 1
+            if len(self.__latency) < RETRY_HEDGE_MIN_SAMPLES:
+                return
+            if self.__hedgeDelay is None or self.__sinceRefresh >= RETRY_HEDGE_REFRESH:
+                self.__hedgeDelay = self.__Percentile(self.hedgePercentile)
+                self.__sinceRefresh = 0
+
+    def GetHedgeDelay(self):
+        with self.__lock:
+            return self.__hedgeDelay if self.hedge else None
+
+    # send times of the extra attempts relative to the first send, as (delay, hedge)
+    def GetSchedule(self, budget: float):
+        attemptTimeout = self.attemptTimeout if self.attemptTimeout else budget / self.attempts
+        schedule = [(attemptTimeout * i, False) for i in range(1, self.attempts) if attemptTimeout * i < budget]
+
+        hedgeDelay = self.GetHedgeDelay()
+        if hedgeDelay is not None and hedgeDelay < (schedule[0][0] if schedule else budget):
+            schedule.insert(0, (hedgeDelay, True))
+        return schedule
+
+    def OnAttempt(self, hedge: bool):
+        with self.__lock:
+            if hedge:
+                self.__hedges += 1
+            else:
+                self.__retries += 1
+
+    def GetStats(self):
+        with self.__lock:
+            return {
+                "retries": self.__retries,
+                "hedges": self.__hedges,
+                "hedgeDelay": self.__hedgeDelay,
+            }
+
+    # nearest rank percentile of the window
+    def __Percentile(self, p: float):
+        values = sorted(self.__latency)
+        rank = max(1, int(math.ceil(p / 100.0 * len(values))))
+        return values[rank - 1]
+
+
+"""
+" class CallTimer
+" process wide timer thread that sends the extra attempts of every client at their due time.
+"""
+class CallTimer(Singleton):
+    __condition = Condition()
+    __heap = []
+    __seq = 0
+    __thread = None
+
+    def __init__(self):
+        super().__init__()
+
+    def Schedule(self, due: float, action: Callable):
+        cls = self.__class__
+        with cls.__condition:
+            cls.__seq += 1
+            heapq.heappush(cls.__heap, (due, cls.__seq, action))
+            if cls.__thread is None:
+                cls.__thread = Thread(target=self.__ThreadFunc, name="rpc_call_timer", daemon=True)
+                cls.__thread.start()
+            cls.__condition.notify()
+
+    def __ThreadFunc(self):
+        cls = self.__class__
+        while True:
+            with cls.__condition:
+                if not cls.__heap:
+                    cls.__condition.wait()
+                    continue
+
+                wait = cls.__heap[0][0] - time.monotonic()
+                if wait > 0:
+                    cls.__condition.wait(wait)
+                    continue
+
+                due, seq, action = heapq.heappop(cls.__heap)
+
+            try:
+                action()
+            except Exception as e:
+                print("[CallTimer] action error. msg:", e)
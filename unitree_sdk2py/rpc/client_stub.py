@@ -1,14 +1,36 @@
 import time
+import struct
 
 from enum import Enum
-from threading import Thread, Condition
+from threading import Thread, Condition, Lock
 
 from ..idl.unitree_api.msg.dds_ import Request_ as Request
 from ..idl.unitree_api.msg.dds_ import Response_ as Response
 
-from ..core.channel import ChannelFactory
+from ..core.channel import ChannelFactory, ChannelTakeMode
 from ..core.channel_name import ChannelType, GetClientChannelName
+from ..utils.singleton import Singleton
 from .request_future import RequestFuture, RequestFutureQueue
+from .cdr_codec import EncodeRequest, DecodeResponse
+
+
+"""
+" response queue length of a client stub. one stub serves every client of a service.
+"""
+CLIENT_STUB_QUEUE_LEN = 64
+
+
+"""
+" function PeekResponseId
+" request id of a serialized Response_ without deserializing it. header.identity.id is the
+" first member of a final struct, so it sits right after the 4 byte encapsulation header in
+" both xcdr1 and xcdr2. return None if the encoding is not recognized.
+"""
+def PeekResponseId(data: bytes):
+    if len(data) < 12 or data[0] != 0:
+        return None
+    # odd encapsulation kinds are little endian
+    return struct.unpack_from("<q" if data[1] & 1 else ">q", data, 4)[0]
 
 
 """
@@ -21,17 +43,55 @@ class ClientStub:
 
         self.__sendChannel = None
         self.__recvChannel = None
+        self.__ready = False
+        self.__lastRequestId = 0
+        self.__idLock = Lock()
 
     def Init(self):
         factory = ChannelFactory()
         self.__futureQueue = RequestFutureQueue()
 
         # create channel
-        self.__sendChannel = factory.CreateSendChannel(GetClientChannelName(self.__serviceName, ChannelType.SEND), Request)
+        self.__sendChannel = factory.CreateSendChannel(GetClientChannelName(self.__serviceName, ChannelType.SEND), Request,
+                                                       serializer=EncodeRequest)
+        # every process calling the service shares the response topic. responses to other
+        # processes are dropped by request id before they are deserialized.
         self.__recvChannel = factory.CreateRecvChannel(GetClientChannelName(self.__serviceName, ChannelType.RECV), Response,
-                                    self.__ResponseHandler,10)
-        time.sleep(0.5)
+                                    self.__ResponseHandler, CLIENT_STUB_QUEUE_LEN, ChannelTakeMode.DRAIN,
+                                    rawFilter=self.__IsPendingResponse, deserializer=DecodeResponse)
+
+    def Close(self):
+        self.__sendChannel.CloseWriter()
+        self.__recvChannel.CloseReader()
+        self.__ready = False
+
+    def GetServiceName(self):
+        return self.__serviceName
+
+    # request ids are monotonic ns, bumped so that clients sharing this stub never collide
+    def NextRequestId(self):
+        with self.__idLock:
+            self.__lastRequestId = max(time.monotonic_ns(), self.__lastRequestId + 1)
+            return self.__lastRequestId
 
+    # ready when the server's request reader and response writer are both matched
+    def WaitReady(self, timeout: float = None):
+        if self.__ready:
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.__sendChannel.WaitForMatched(1, timeout):
+            return False
+
+        remain = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.__recvChannel.WaitForReaderMatched(1, remain):
+            return False
+
+        self.__ready = True
+        return True
+
+    def IsReady(self):
+        return self.__ready or (self.__sendChannel.GetMatchedCount() > 0 and self.__recvChannel.GetReaderMatchedCount() > 0)
 
     def Send(self, request: Request, timeout: float):
         if self.__sendChannel.Write(request, timeout):
@@ -43,6 +103,14 @@ class ClientStub:
     def SendRequest(self, request: Request, timeout: float):
         id = request.header.identity.id
 
+        # the response would be lost if the server has not matched our reader yet.
+        # one deadline covers the wait and the write.
+        if not self.__ready:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            self.WaitReady(timeout)
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+
         future = RequestFuture()
         future.SetRequestId(id)
         self.__futureQueue.Set(id, future)
@@ -54,16 +122,85 @@ class ClientStub:
             self.__futureQueue.Remove(id)
             return None
 
+    # another attempt of a pending request under a new id, the first response of any attempt completes the future
+    def Resend(self, request: Request, future: RequestFuture, timeout: float):
+        id = request.header.identity.id
+        if future.Done():
+            return False
+
+        future.AddRequestId(id)
+        self.__futureQueue.Set(id, future)
+        # completed meanwhile by another attempt, which could not see this id yet
+        if future.Done():
+            self.__futureQueue.Remove(id)
+            return False
+
+        if self.__sendChannel.Write(request, timeout):
+            return True
+        else:
+            print("[ClientStub] resend request error. id:", id)
+            self.__futureQueue.Remove(id)
+            return False
+
     def RemoveFuture(self, requestId: int):
-        self.__futureQueue.Remove(requestId)
+        return self.__futureQueue.Remove(requestId)
+
+    def __IsPendingResponse(self, data: bytes):
+        id = PeekResponseId(data)
+        return id is None or self.__futureQueue.Contains(id)
 
     def __ResponseHandler(self, response: Response):
         id = response.header.identity.id
         # apiId = response.header.identity.api_id
         # print("[ClientStub] responseHandler recv response id:", id, ", apiId:", apiId)
         future = self.__futureQueue.Get(id)
-        if future is None:
+        if future is None or future.Done():
             # print("[ClientStub] get future from queue error. id:", id)
-            pass
-        elif not future.Ready(response):
+            return
+
+        # the other attempts' responses are dropped by the filter from now on
+        for requestId in future.GetRequestIds():
+            if requestId != id:
+                self.__futureQueue.Remove(requestId)
+
+        if not future.Ready(response):
             print("[ClientStub] set future ready error.")
+
+
+"""
+" class ClientStubPool
+" process wide ClientStub per service name, reference counted.
+"""
+class ClientStubPool(Singleton):
+    __stubs = {}
+    __lock = Lock()
+
+    def __init__(self):
+        super().__init__()
+
+    def Acquire(self, serviceName: str):
+        with self.__class__.__lock:
+            entry = self.__class__.__stubs.get(serviceName)
+            if entry is None:
+                stub = ClientStub(serviceName)
+                stub.Init()
+                entry = [stub, 0]
+                self.__class__.__stubs[serviceName] = entry
+            entry[1] += 1
+            return entry[0]
+
+    def Release(self, serviceName: str):
+        with self.__class__.__lock:
+            entry = self.__class__.__stubs.get(serviceName)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            self.__class__.__stubs.pop(serviceName)
+        entry[0].Close()
+
+    def GetRefCount(self, serviceName: str):
+        with self.__class__.__lock:
+            entry = self.__class__.__stubs.get(serviceName)
+            return 0 if entry is None else entry[1]
@@ -0,0 +1,130 @@
+import time
+
+from threading import Lock
+from typing import Callable
+
+from ..utils.thread import RecurrentThread
+
+
+"""
+" command stream defaults
+"""
+COMMAND_STREAM_RATE = 50.0
+COMMAND_STREAM_TIMEOUT = 0.5
+COMMAND_STREAM_KEEPALIVE = 0.2
+COMMAND_STREAM_STOP_REPEAT = 3
+
+
+"""
+" class CommandStream
+" latest wins sender of a streamed command such as a velocity. producers Set the newest values
+" from any thread and any rate, the stream sends the latest at a fixed rate through send(*values),
+" usually a noreply call. an unchanged command is sent again only every keepalive seconds. when
+" no producer Set for timeout seconds, or Stop is called, the stop values are sent on stopRepeat
+" consecutive ticks, then the stream idles until the next Set.
+"
+" stream = CommandStream(client.Move, 50.0, (0.0, 0.0, 0.0))
+" stream.Start()
+" stream.Set(0.3, 0.0, 0.0)
+"""
+class CommandStream:
+    def __init__(self, send: Callable, rate: float = COMMAND_STREAM_RATE, stop: tuple = None,
+                 timeout: float = COMMAND_STREAM_TIMEOUT, keepalive: float = COMMAND_STREAM_KEEPALIVE,
+                 stopRepeat: int = COMMAND_STREAM_STOP_REPEAT, name: str = "command_stream"):
+        self.__send = send
+        self.__interval = 1.0 / rate
+        self.__stop = None if stop is None else tuple(stop)
+        self.__timeout = timeout
+        self.__keepalive = keepalive
+        self.__stopRepeat = stopRepeat
+        self.__name = name
+        self.__thread = None
+
+        self.__lock = Lock()
+        self.__values = None
+        self.__setTime = 0.0
+
+        # state of the send thread only
+        self.__lastValues = None
+        self.__lastSendTime = 0.0
+        self.__stopSent = 0
+
+        self.__sets = 0
+        self.__sent = 0
+        self.__suppressed = 0
+        self.__stops = 0
+        self.__errors = 0
+
+    def Start(self):
+        self.__thread = RecurrentThread(self.__interval, target=self.__Tick, name=self.__name)
+        self.__thread.Start()
+
+    # stop the thread, then send the stop values once if the robot may still be moving
+    def Close(self):
+        if self.__thread is not None:
+            self.__thread.Wait()
+            self.__thread = None
+
+        if self.__stop is not None and self.__lastValues is not None and self.__lastValues != self.__stop:
+            self.__Send(self.__stop)
+
+    def Set(self, *values):
+        with self.__lock:
+            self.__values = values
+            self.__setTime = time.monotonic()
+            self.__sets += 1
+
+    # make the stop values the latest command at once, without waiting for the timeout
+    def Stop(self):
+        if self.__stop is not None:
+            self.Set(*self.__stop)
+
+    def GetStats(self):
+        with self.__lock:
+            return {
+                "set": self.__sets,
+                "sent": self.__sent,
+                "suppressed": self.__suppressed,
+                "stops": self.__stops,
+                "errors": self.__errors,
+            }
+
+    def __Tick(self):
+        with self.__lock:
+            values = self.__values
+            setTime = self.__setTime
+
+        if values is None:
+            return
+
+        now = time.monotonic()
+        if now - setTime > self.__timeout:
+            if self.__stop is None:
+                return
+            values = self.__stop
+
+        # a lost stop must not leave the robot moving, so it is sent on stopRepeat ticks in a row
+        # whatever the keepalive
+        isStop = values == self.__stop
+        if isStop and self.__stopSent >= self.__stopRepeat:
+            return
+
+        if not isStop and values == self.__lastValues and (self.__keepalive is None or now - self.__lastSendTime < self.__keepalive):
+            with self.__lock:
+                self.__suppressed += 1
+            return
+
+        self.__stopSent = self.__stopSent + 1 if isStop else 0
+        self.__Send(values)
+
+    def __Send(self, values: tuple):
+        code = self.__send(*values)
+        self.__lastValues = values
+        self.__lastSendTime = time.monotonic()
+
+        with self.__lock:
+            self.__sent += 1
+            if values == self.__stop:
+                self.__stops += 1
+            if code != 0:
+                self.__errors += 1
@@ -29,3 +29,4 @@ RPC_ERR_SERVER_API_PARAMETER = 3204
 RPC_ERR_SERVER_LEASE_DENIED = 3205
 RPC_ERR_SERVER_LEASE_NOT_EXIST = 3206
 RPC_ERR_SERVER_LEASE_EXIST = 3207
+RPC_ERR_SERVER_BUSY = 3208
@@ -138,11 +138,12 @@ class LeaseServer(ServerBase):
             print("[LeaseServer] api is not implemented. apiId", apiId)
 
         if request.header.policy.noreply:
-            return
+            return code
 
         status = ResponseStatus(code)
         response = Response(ResponseHeader(identity, status), data, [])
         self._SendResponse(response)
+        return code
 
     def __GenerateId(self):
         return self.__Now()
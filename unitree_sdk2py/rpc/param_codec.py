@@ -0,0 +1,147 @@
+import json
+import math
+
+from typing import Any
+
+"""
+" json backend. the stdlib json by default, SetJsonBackend switches to orjson or ujson when
+" installed. the faster backends write compact json and encode nan/inf as null.
+"""
+JSON_BACKEND_STDLIB = "json"
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_UJSON = "ujson"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+_jsonDumps = json.dumps
+_jsonLoads = json.loads
+_jsonBackend = JSON_BACKEND_STDLIB
+
+
+# numpy scalars and arrays, which json handles as float subclasses or rejects
+def _OrjsonDefault(obj: Any):
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError
+
+
+# process wide, name None picks the fastest installed backend
+def SetJsonBackend(name: str = None):
+    global _jsonDumps, _jsonLoads, _jsonBackend
+    if name is None:
+        name = JSON_BACKEND_ORJSON if orjson is not None else JSON_BACKEND_UJSON if ujson is not None else JSON_BACKEND_STDLIB
+
+    if name == JSON_BACKEND_ORJSON and orjson is not None:
+        _jsonDumps = lambda obj: orjson.dumps(obj, default=_OrjsonDefault).decode()
+        _jsonLoads = orjson.loads
+    elif name == JSON_BACKEND_UJSON and ujson is not None:
+        _jsonDumps = ujson.dumps
+        _jsonLoads = ujson.loads
+    elif name == JSON_BACKEND_STDLIB:
+        _jsonDumps = json.dumps
+        _jsonLoads = json.loads
+    else:
+        print("[ParamCodec] json backend not available:", name)
+        return False
+
+    _jsonBackend = name
+    return True
+
+
+def GetJsonBackend():
+    return _jsonBackend
+
+
+def JsonDumps(obj: Any):
+    return _jsonDumps(obj)
+
+
+def JsonLoads(text: str):
+    return _jsonLoads(text)
+
+
+"""
+" function ValueText. the json.dumps text of a value, scalars without going through the encoder.
+"""
+def ValueText(value: Any):
+    cls = type(value)
+    if cls is float:
+        return float.__repr__(value) if math.isfinite(value) else json.dumps(value)
+    if cls is int:
+        return int.__repr__(value)
+    if cls is bool:
+        return "true" if value else "false"
+    return json.dumps(value)
+
+
+PARAM_TYPES = (float, int, bool, str)
+
+
+"""
+" class ParamTemplate
+" precompiled encoder of a fixed shape json object. fields are (key, type) pairs, the type is
+" float, int, bool, str or a list of those for a fixed length array. the types give the shape
+" only, values are written as given, like a dict passed to json.dumps. Encode takes the values
+" in field order, arrays flattened. with the stdlib backend the text is formatted from a
+" precompiled string, the same text as json.dumps of the dict. a faster backend is given the
+" object instead and writes the same values as compact json.
+"
+" MOVE = ParamTemplate(("x", float), ("y", float), ("z", float))
+" MOVE.Encode(0.3, 0.0, 0.1) -> '{"x": 0.3, "y": 0.0, "z": 0.1}'
+"""
+class ParamTemplate:
+    def __init__(self, *fields: tuple):
+        self.__fieldCount = 0
+        self.__shape = []
+        members = []
+        for key, kind in fields:
+            members.append(json.dumps(key).replace("%", "%%") + ": " + self.__Compile(kind))
+            self.__shape.append((key, len(kind) if isinstance(kind, (list, tuple)) else None))
+        self.__format = "{" + ", ".join(members) + "}"
+        self.__keys = tuple(key for key, count in self.__shape)
+        self.__flat = all(count is None for key, count in self.__shape)
+
+    def Encode(self, *values: Any):
+        if _jsonBackend == JSON_BACKEND_STDLIB:
+            return self.__format % tuple([ValueText(value) for value in values])
+        if self.__flat:
+            return _jsonDumps(dict(zip(self.__keys, values)))
+        return _jsonDumps(self.Build(*values))
+
+    # the object Encode writes, values as given like a dict passed to json.dumps
+    def Build(self, *values: Any):
+        if self.__flat:
+            return dict(zip(self.__keys, values))
+
+        obj = {}
+        i = 0
+        for key, count in self.__shape:
+            if count is None:
+                obj[key] = values[i]
+                i += 1
+            else:
+                obj[key] = list(values[i:i + count])
+                i += count
+        return obj
+
+    def GetFieldCount(self):
+        return self.__fieldCount
+
+    def __Compile(self, kind: Any):
+        if isinstance(kind, (list, tuple)):
+            return "[" + ", ".join(self.__CompileValue(k) for k in kind) + "]"
+        return self.__CompileValue(kind)
+
+    def __CompileValue(self, kind: type):
+        if kind not in PARAM_TYPES:
+            raise TypeError("[ParamTemplate] unsupported field type: " + str(kind))
+        self.__fieldCount += 1
+        return "%s"
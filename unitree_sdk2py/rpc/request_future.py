@@ -11,14 +11,23 @@ from ..utils.future import Future, FutureResult
 class RequestFuture(Future):
     def __init__(self):
         self.__requestId = None
+        self.__requestIds = []
         super().__init__()
 
     def SetRequestId(self, requestId: int):
         self.__requestId = requestId
+        self.__requestIds = [requestId]
 
     def GetRequestId(self):
         return self.__requestId
 
+    # a retried or hedged request waits under the ids of all its attempts
+    def AddRequestId(self, requestId: int):
+        self.__requestIds = self.__requestIds + [requestId]
+
+    def GetRequestIds(self):
+        return self.__requestIds
+
 
 class RequestFutureQueue:
     def __init__(self):
@@ -40,7 +49,10 @@ class RequestFutureQueue:
                 self.__data.pop(requestId)
         return future
 
+    def Contains(self, requestId: int):
+        with self.__lock:
+            return requestId in self.__data
+
     def Remove(self, requestId: int):
         with self.__lock:
-            if id in self.__data:
-                self.__data.pop(requestId)
\ No newline at end of file
+            return self.__data.pop(requestId, None) is not None
\ No newline at end of file
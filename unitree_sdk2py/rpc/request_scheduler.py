@@ -0,0 +1,93 @@
+from collections import deque
+from enum import Enum
+from threading import Condition
+from typing import Any
+
+
+"""
+" Enum SchedulePolicy
+"""
+class SchedulePolicy(Enum):
+    STRICT = 0      # always serve the highest non-empty level first
+    WEIGHTED = 1    # share workers between levels in proportion to their weights
+
+
+"""
+" class RequestScheduler
+" bounded queue per priority level, higher level is more urgent.
+" weighted mode uses smooth weighted round robin over the non-empty levels.
+"""
+class RequestScheduler:
+    def __init__(self, levels: int = 1, queueLens: list = None, policy: SchedulePolicy = SchedulePolicy.STRICT,
+                 weights: list = None):
+        self.__levels = max(1, levels)
+        self.__policy = policy
+        self.__queues = [deque() for i in range(self.__levels)]
+        self.__queueLens = list(queueLens) if queueLens is not None else [10] * self.__levels
+        # default weights double with each level: 1, 2, 4, ...
+        self.__weights = list(weights) if weights is not None else [1 << i for i in range(self.__levels)]
+        self.__current = [0] * self.__levels
+        self.__condition = Condition()
+        self.__interrupted = False
+
+    def GetLevels(self):
+        return self.__levels
+
+    def GetLevel(self, priority: int):
+        return min(max(priority, 0), self.__levels - 1)
+
+    def Put(self, level: int, x: Any):
+        with self.__condition:
+            queue = self.__queues[level]
+            if len(queue) >= self.__queueLens[level]:
+                return False
+            queue.append(x)
+            # workers may serve different levels, wake them all
+            self.__condition.notify_all()
+            return True
+
+    # minLevel lets a worker serve the urgent levels only
+    def Get(self, minLevel: int = 0, timeout: float = None):
+        with self.__condition:
+            level = self.__Select(minLevel)
+            while level is None and not self.__interrupted:
+                if not self.__condition.wait(timeout):
+                    return None
+                level = self.__Select(minLevel)
+
+            if level is None:
+                return None
+            return self.__queues[level].popleft()
+
+    def Size(self, level: int = None):
+        with self.__condition:
+            if level is None:
+                return sum(len(queue) for queue in self.__queues)
+            return len(self.__queues[level])
+
+    def Sizes(self):
+        with self.__condition:
+            return [len(queue) for queue in self.__queues]
+
+    def Interrupt(self):
+        with self.__condition:
+            self.__interrupted = True
+            self.__condition.notify_all()
+
+    def __Select(self, minLevel: int):
+        levels = [i for i in range(minLevel, self.__levels) if self.__queues[i]]
+        if not levels:
+            return None
+
+        if self.__policy == SchedulePolicy.STRICT or len(levels) == 1:
+            return levels[-1]
+
+        total = 0
+        best = None
+        for i in levels:
+            self.__current[i] += self.__weights[i]
+            total += self.__weights[i]
+            if best is None or self.__current[i] > self.__current[best]:
+                best = i
+        self.__current[best] -= total
+        return best
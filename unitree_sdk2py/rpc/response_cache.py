@@ -0,0 +1,156 @@
+import time
+
+from threading import Lock, Event
+from typing import Callable
+
+from .client_future import ClientFuture
+from .internal import *
+
+
+"""
+" class CacheEntry
+"""
+class CacheEntry:
+    def __init__(self, deadline: float):
+        self.future = None          # request in flight, attached once sent, None once the result is cached
+        self.sent = Event()         # set when the send returned, the future is attached unless it failed
+        self.deadline = deadline    # end of the flight, then end of the ttl
+        self.result = None
+
+
+"""
+" class ResponseCache
+" opt-in ttl cache of getter responses, keyed by api id and parameter. only successful
+" responses are cached. concurrent identical calls share the request in flight, and calling
+" a setter drops the cached responses of the getters it changes.
+"""
+class ResponseCache:
+    def __init__(self):
+        self.__lock = Lock()
+        self.__ttls = {}
+        self.__invalidations = {}   # setter api id -> getter api ids
+        self.__entries = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__coalesced = 0
+
+    def SetTtl(self, apiId: int, ttl: float):
+        with self.__lock:
+            if ttl > 0:
+                self.__ttls[apiId] = ttl
+            else:
+                self.__ttls.pop(apiId, None)
+                self.__Drop(apiId)
+
+    def GetTtl(self, apiId: int):
+        return self.__ttls.get(apiId)
+
+    def IsCached(self, apiId: int):
+        return apiId in self.__ttls
+
+    def AddInvalidation(self, apiId: int, setterApiIds: list):
+        with self.__lock:
+            for setterApiId in setterApiIds:
+                self.__invalidations.setdefault(setterApiId, set()).add(apiId)
+
+    def IsSetter(self, apiId: int):
+        return apiId in self.__invalidations
+
+    def OnSetter(self, setterApiId: int):
+        apiIds = self.__invalidations.get(setterApiId)
+        if not apiIds:
+            return
+        with self.__lock:
+            for apiId in apiIds:
+                self.__Drop(apiId)
+
+    def Invalidate(self, apiId: int = None):
+        with self.__lock:
+            if apiId is None:
+                self.__entries.clear()
+            else:
+                self.__Drop(apiId)
+
+    def GetStats(self):
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "coalesced": self.__coalesced,
+                "size": len(self.__entries),
+            }
+
+    # send() issues the request and returns its ClientFuture, called only on a miss
+    def Call(self, apiId: int, parameter: str, timeout: float, send: Callable, parser: Callable = None):
+        key = (apiId, parameter)
+        with self.__lock:
+            now = time.monotonic()
+            entry = self.__entries.get(key)
+            if entry is not None and now < entry.deadline:
+                if entry.result is not None:
+                    self.__hits += 1
+                    code, data = entry.result
+                    return ClientFuture(apiId, code=code, data=data, parser=parser)
+                self.__coalesced += 1
+                inflight = True
+            else:
+                # a placeholder, so concurrent callers find the request in flight while it is sent
+                self.__misses += 1
+                entry = CacheEntry(now + timeout)
+                self.__entries[key] = entry
+                inflight = False
+
+        if inflight:
+            return self.__Share(apiId, entry, parser)
+
+        # sent outside the lock, a slow send must not block the other apis of the client
+        try:
+            future = send()
+        except:
+            self.__Abandon(key, entry)
+            raise
+
+        entry.future = future
+        entry.sent.set()
+        future.AddDoneCallback(lambda f: self.__Fill(key, entry))
+        return future.Share(parser)
+
+    def __Share(self, apiId: int, entry: CacheEntry, parser: Callable):
+        entry.sent.wait(max(0.0, entry.deadline - time.monotonic()))
+        future = entry.future
+        if future is not None:
+            return future.Share(parser)
+
+        result = entry.result
+        if result is not None:
+            code, data = result
+            return ClientFuture(apiId, code=code, data=data, parser=parser)
+
+        # the send failed or is still blocked past the deadline
+        return ClientFuture(apiId, code=RPC_ERR_CLIENT_SEND, parser=parser)
+
+    def __Abandon(self, key: tuple, entry: CacheEntry):
+        with self.__lock:
+            if self.__entries.get(key) is entry:
+                del self.__entries[key]
+        entry.sent.set()
+
+    def __Fill(self, key: tuple, entry: CacheEntry):
+        code, data = entry.future.GetResult(0)
+        with self.__lock:
+            # dropped by an invalidation while in flight
+            if self.__entries.get(key) is not entry:
+                return
+
+            ttl = self.__ttls.get(key[0])
+            if code == 0 and ttl is not None:
+                # result before future, a caller sharing the entry sees one of them
+                entry.result = (code, data)
+                entry.deadline = time.monotonic() + ttl
+                entry.future = None
+            else:
+                del self.__entries[key]
+
+    def __Drop(self, apiId: int):
+        for key in [key for key in self.__entries if key[0] == apiId]:
+            del self.__entries[key]
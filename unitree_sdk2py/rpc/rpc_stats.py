@@ -0,0 +1,125 @@
+from threading import Lock
+from typing import Callable
+
+from ..utils.histogram import Histogram
+from ..utils.thread import RecurrentThread
+from .internal import *
+
+
+"""
+" class ApiStats
+" counters of one api. times are in microseconds.
+"""
+class ApiStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.leaseDenied = 0
+        self.expired = 0
+        self.rejected = 0
+        self.codes = {}
+        self.latency = Histogram()
+        self.queueWait = Histogram()
+        self.handlerTime = Histogram()
+
+    def Snapshot(self):
+        snapshot = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "leaseDenied": self.leaseDenied,
+            "codes": dict(self.codes),
+            "latency": self.latency.Snapshot(),
+        }
+        # server side only
+        if self.queueWait.Count() > 0 or self.expired or self.rejected:
+            snapshot["expired"] = self.expired
+            snapshot["rejected"] = self.rejected
+            snapshot["queueWait"] = self.queueWait.Snapshot()
+            snapshot["handlerTime"] = self.handlerTime.Snapshot()
+        return snapshot
+
+
+"""
+" class RpcStats
+" per api statistics of a client or a server, with an optional periodic dump.
+"""
+class RpcStats:
+    def __init__(self, name: str):
+        self.__name = name
+        self.__lock = Lock()
+        self.__apis = {}
+        self.__dumpThread = None
+        self.__dumpSink = None
+
+    # latency, queueWait and handlerTime in seconds, None when not measured
+    def OnCall(self, apiId: int, code: int, latency: float = None, queueWait: float = None, handlerTime: float = None):
+        with self.__lock:
+            stats = self.__Get(apiId)
+            stats.calls += 1
+            if code != 0:
+                stats.errors += 1
+                stats.codes[code] = stats.codes.get(code, 0) + 1
+                if code == RPC_ERR_CLIENT_API_TIMEOUT:
+                    stats.timeouts += 1
+                elif code == RPC_ERR_SERVER_LEASE_DENIED:
+                    stats.leaseDenied += 1
+
+            if latency is not None:
+                stats.latency.Add(latency * 1e6)
+            if queueWait is not None:
+                stats.queueWait.Add(queueWait * 1e6)
+            if handlerTime is not None:
+                stats.handlerTime.Add(handlerTime * 1e6)
+
+    def OnExpired(self, apiId: int, queueWait: float):
+        with self.__lock:
+            stats = self.__Get(apiId)
+            stats.expired += 1
+            stats.queueWait.Add(queueWait * 1e6)
+
+    def OnRejected(self, apiId: int):
+        with self.__lock:
+            self.__Get(apiId).rejected += 1
+
+    def Snapshot(self):
+        with self.__lock:
+            return {
+                "name": self.__name,
+                "apis": {apiId: stats.Snapshot() for apiId, stats in sorted(self.__apis.items())},
+            }
+
+    def Reset(self):
+        with self.__lock:
+            self.__apis = {}
+
+    # sink(snapshot) every interval seconds, a one line per api print by default
+    def StartDump(self, interval: float, sink: Callable = None):
+        self.StopDump()
+        self.__dumpSink = self.__Print if sink is None else sink
+        self.__dumpThread = RecurrentThread(interval, target=lambda: self.__dumpSink(self.Snapshot()),
+                                            name="rpc_stats_" + self.__name)
+        self.__dumpThread.Start()
+
+    def StopDump(self):
+        if self.__dumpThread is not None:
+            self.__dumpThread.Wait()
+            self.__dumpThread = None
+
+    def __Get(self, apiId: int):
+        stats = self.__apis.get(apiId)
+        if stats is None:
+            stats = ApiStats()
+            self.__apis[apiId] = stats
+        return stats
+
+    def __Print(self, snapshot: dict):
+        for apiId, api in snapshot["apis"].items():
+            latency = api["latency"]
+            line = "[RpcStats] {} api:{} calls:{} errors:{} timeouts:{} p50:{:.0f}us p99:{:.0f}us".format(
+                snapshot["name"], apiId, api["calls"], api["errors"], api["timeouts"], latency["p50"], latency["p99"])
+            if "queueWait" in api:
+                line += " wait p99:{:.0f}us handler p99:{:.0f}us expired:{} rejected:{}".format(
+                    api["queueWait"]["p99"], api["handlerTime"]["p99"], api["expired"], api["rejected"])
+            print(line)
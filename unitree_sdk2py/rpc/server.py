@@ -1,4 +1,5 @@
 import time
+import traceback
 
 from typing import Callable, Any
 
@@ -9,6 +10,7 @@ from ..idl.unitree_api.msg.dds_ import Response_ as Response
 
 from .server_base import ServerBase
 from .lease_server import LeaseServer
+from .cdr_codec import BinaryBytes
 from .internal import *
 
 """
@@ -19,7 +21,7 @@ class Server(ServerBase):
         self.__apiVersion = ""
         self.__apiHandlerMapping = {}
         self.__apiBinaryHandlerMapping = {}
-        self.__apiBinarySet = {}
+        self.__apiBinarySet = set()
         self.__enableLease = False
         self.__leaseServer = None
         super().__init__(name)
@@ -33,9 +35,10 @@ class Server(ServerBase):
         self.__leaseServer.Init()
         self.__leaseServer.Start(False)
 
-    def Start(self, enablePrioQueue: bool = False):
+    # workerCount handlers run concurrently, see _SetApiConcurrency/_SetApiSerial to limit an api
+    def Start(self, enablePrioQueue: bool = False, workerCount: int = 1):
         super()._SetServerRequestHandler(self.__ServerRequestHandler)
-        super()._Start(enablePrioQueue)
+        super()._Start(enablePrioQueue, workerCount)
 
     def GetApiVersion(self):
         return self.__apiVersion
@@ -51,6 +54,10 @@ class Server(ServerBase):
         self.__apiBinaryHandlerMapping[apiId] = (handler, checkLease)
         self.__apiBinarySet.add(apiId)
 
+    # handlers touching shared hardware state can be pinned to one request at a time
+    def _SetApiSerial(self, apiId: int):
+        self._SetApiConcurrency(apiId, 1)
+
     def __GetHandler(self, apiId: int):
         if apiId in self.__apiHandlerMapping:
             return self.__apiHandlerMapping.get(apiId)
@@ -74,7 +81,7 @@ class Server(ServerBase):
 
     def __ServerRequestHandler(self, request: Request):
         parameter = request.parameter
-        parameterBinary = request.binary
+        parameterBinary = BinaryBytes(request.binary)
 
         identity = request.header.identity
         leaseId = request.header.lease.id
@@ -82,7 +89,7 @@ class Server(ServerBase):
 
         code = 0
         data = ""
-        dataBinary = []
+        dataBinary = b""
 
         if apiId == RPC_API_ID_INTERNAL_API_VERSION:
             data = self.__apiVersion
@@ -109,14 +116,17 @@ class Server(ServerBase):
                     else:
                         code, dataBinary = binaryRequestHandler(parameterBinary)
                         if code != 0:
-                            dataBinary = []
-                except:
+                            dataBinary = b""
+                except Exception:
+                    print("[Server] handler error. apiId:", apiId, ", id:", identity.id)
+                    traceback.print_exc()
                     code = RPC_ERR_SERVER_INTERNAL
 
         if request.header.policy.noreply:
-            return
+            return code
 
         status = ResponseStatus(code)
         response = Response(ResponseHeader(identity, status), data, dataBinary)
 
-        self._SendResponse(response)
\ No newline at end of file
+        self._SendResponse(response)
+        return code
\ No newline at end of file
@@ -5,7 +5,8 @@ from typing import Callable, Any
 from ..idl.unitree_api.msg.dds_ import Request_ as Request
 from ..idl.unitree_api.msg.dds_ import Response_ as Response
 
-from .server_stub import ServerStub
+from .server_stub import ServerStub, SERVER_QUEUE_LEN, SERVER_PRIO_QUEUE_LEN, SERVER_REQUEST_TIMEOUT
+from .request_scheduler import SchedulePolicy
 
 
 """
@@ -20,10 +21,50 @@ class ServerBase:
     def GetName(self):
         return self.__name
 
-    def _Start(self, enablePrioQueue: bool = False):
-        self.__serverStub.Init(self.__serverRequestHandler, enablePrioQueue)
-        print("[ServerBase] server started. name:", self.__name, ", enable proirity queue:", enablePrioQueue)
+    def _Start(self, enablePrioQueue: bool = False, workerCount: int = 1):
+        self.__serverStub.Init(self.__serverRequestHandler, enablePrioQueue, workerCount)
+        print("[ServerBase] server started. name:", self.__name, ", enable proirity queue:", enablePrioQueue,
+              ", worker count:", workerCount)
 
+    def _SetApiConcurrency(self, apiId: int, limit: int):
+        self.__serverStub.SetApiConcurrency(apiId, limit)
+
+    def GetClientCount(self):
+        return self.__serverStub.GetClientCount()
+
+    # call before Start. see ServerStub.SetQueuePolicy
+    def SetQueuePolicy(self, queueLen: int = SERVER_QUEUE_LEN, prioQueueLen: int = SERVER_PRIO_QUEUE_LEN,
+                       requestTimeout: float = SERVER_REQUEST_TIMEOUT):
+        self.__serverStub.SetQueuePolicy(queueLen, prioQueueLen, requestTimeout)
+
+    # see ServerStub.SetRequestTimeout
+    def SetRequestTimeout(self, timeout: float = None):
+        self.__serverStub.SetRequestTimeout(timeout)
+
+    # call before Start. see ServerStub.SetPriorityPolicy, takes effect with enablePrioQueue
+    def SetPriorityPolicy(self, levels: int = 2, policy: SchedulePolicy = SchedulePolicy.STRICT, weights: list = None,
+                          prioWorkerCount: int = 1):
+        self.__serverStub.SetPriorityPolicy(levels, policy, weights, prioWorkerCount)
+
+    # counters of queued, rejected (busy), expired and handled requests
+    def GetQueueStats(self):
+        return self.__serverStub.GetQueueStats()
+
+    # per api calls, latency, queue wait vs handler time, lease denials and error codes. see RpcStats
+    def GetApiStats(self):
+        return self.__serverStub.GetApiStats().Snapshot()
+
+    def ResetApiStats(self):
+        self.__serverStub.GetApiStats().Reset()
+
+    # sink(GetApiStats()) every interval seconds, printed when sink is None
+    def StartStatsDump(self, interval: float, sink: Callable = None):
+        self.__serverStub.GetApiStats().StartDump(interval, sink)
+
+    def StopStatsDump(self):
+        self.__serverStub.GetApiStats().StopDump()
+
+    # the handler returns the response status code
     def _SetServerRequestHandler(self, serverRequestHandler: Callable):
         self.__serverRequestHandler = serverRequestHandler
 
@@ -1,15 +1,46 @@
 import time
+import traceback
 
+from collections import deque
 from enum import Enum
-from threading import Thread, Condition
+from threading import Thread, Condition, Lock
 from typing import Callable, Any
 
-from ..utils.bqueue import BQueue
 from ..idl.unitree_api.msg.dds_ import Request_ as Request
+from ..idl.unitree_api.msg.dds_ import ResponseStatus_ as ResponseStatus
+from ..idl.unitree_api.msg.dds_ import ResponseHeader_ as ResponseHeader
 from ..idl.unitree_api.msg.dds_ import Response_ as Response
 
-from ..core.channel import ChannelFactory
+from ..core.channel import ChannelFactory, ChannelTakeMode
 from ..core.channel_name import ChannelType, GetServerChannelName
+from ..utils.bqueue import BQueue
+from .cdr_codec import EncodeResponse, DecodeRequest
+from .request_scheduler import RequestScheduler, SchedulePolicy
+from .rpc_stats import RpcStats
+from .internal import *
+
+
+"""
+" server queue defaults
+"""
+SERVER_QUEUE_LEN = 10
+SERVER_PRIO_QUEUE_LEN = 5
+# the request header is a final type shared with the robot services and has no room for the
+# caller's deadline, so queued requests do not expire unless the server sets a request timeout
+SERVER_REQUEST_TIMEOUT = None
+# busy and error replies waiting for the refusal thread, more are not answered and their clients time out
+SERVER_REFUSAL_QUEUE_LEN = 64
+
+
+"""
+" class ApiLane
+" concurrency limit of one api. requests over the limit wait in the lane, not in a worker.
+"""
+class ApiLane:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.running = 0
+        self.pending = deque()
 
 
 """
@@ -22,33 +53,112 @@ class ServerStub:
         self.__sendChannel = None
         self.__recvChannel = None
         self.__enablePriority = None
-        self.__queue = None
-        self.__prioQueue = None
-        self.__queueThread = None
-        self.__prioQueueThread = None
+        self.__scheduler = None
+        self.__queueThreads = []
+        self.__refusals = BQueue(SERVER_REFUSAL_QUEUE_LEN)
+        self.__lanes = {}
+        self.__laneLock = Lock()
+
+        self.__queueLen = SERVER_QUEUE_LEN
+        self.__prioQueueLen = SERVER_PRIO_QUEUE_LEN
+        self.__requestTimeout = SERVER_REQUEST_TIMEOUT
+        self.__prioLevels = 2
+        self.__prioPolicy = SchedulePolicy.STRICT
+        self.__prioWeights = None
+        self.__prioWorkerCount = 1
+        self.__statsLock = Lock()
+        self.__queued = 0
+        self.__rejected = 0
+        self.__expired = 0
+        self.__handled = 0
+        self.__apiStats = RpcStats(serviceName)
+
+    # limit the number of concurrent handlers of an api, 1 makes the api a serial lane
+    def SetApiConcurrency(self, apiId: int, limit: int):
+        with self.__laneLock:
+            if limit > 0:
+                lane = self.__lanes.get(apiId)
+                if lane is None:
+                    self.__lanes[apiId] = ApiLane(limit)
+                else:
+                    lane.limit = limit
+            else:
+                self.__lanes.pop(apiId, None)
+
+    # set before Init. a full queue rejects with RPC_ERR_SERVER_BUSY. requests waiting longer than
+    # requestTimeout are answered with RPC_ERR_SERVER_BUSY unhandled, None never expires them.
+    # keep requestTimeout below the clients' timeout, or they stop waiting before the answer.
+    def SetQueuePolicy(self, queueLen: int = SERVER_QUEUE_LEN, prioQueueLen: int = SERVER_PRIO_QUEUE_LEN,
+                       requestTimeout: float = SERVER_REQUEST_TIMEOUT):
+        self.__queueLen = queueLen
+        self.__prioQueueLen = prioQueueLen
+        self.__requestTimeout = requestTimeout
+
+    # expire requests queued longer than timeout seconds, None turns expiry off. see SetQueuePolicy
+    def SetRequestTimeout(self, timeout: float = None):
+        self.__requestTimeout = timeout
 
-    def Init(self, serverRequestHander: Callable, enablePriority: bool = False):
+    # set before Init, used when priority is enabled. header.policy.priority selects the level,
+    # priorities above levels - 1 share the top level. prioWorkerCount workers serve levels >= 1 only,
+    # so urgent requests never wait behind a long handler of level 0.
+    def SetPriorityPolicy(self, levels: int = 2, policy: SchedulePolicy = SchedulePolicy.STRICT, weights: list = None,
+                          prioWorkerCount: int = 1):
+        self.__prioLevels = levels
+        self.__prioPolicy = policy
+        self.__prioWeights = weights
+        self.__prioWorkerCount = prioWorkerCount
+
+    def Init(self, serverRequestHander: Callable, enablePriority: bool = False, workerCount: int = 1):
         self.__serverRquestHandler = serverRequestHander
         self.__enablePriority = enablePriority
 
+        levels = max(1, self.__prioLevels) if enablePriority else 1
+        queueLens = [self.__queueLen] + [self.__prioQueueLen] * (levels - 1)
+        self.__scheduler = RequestScheduler(levels, queueLens, self.__prioPolicy, self.__prioWeights)
+
         factory = ChannelFactory()
 
-        # create channel
-        self.__sendChannel = factory.CreateSendChannel(GetServerChannelName(self.__serviceName, ChannelType.SEND), Response)
-        self.__recvChannel = factory.CreateRecvChannel(GetServerChannelName(self.__serviceName, ChannelType.RECV), Request, self.__Enqueue, 10)
+        # create channel. requests are admitted on the receive thread, the queues below are the only buffer.
+        self.__sendChannel = factory.CreateSendChannel(GetServerChannelName(self.__serviceName, ChannelType.SEND), Response,
+                                                       serializer=EncodeResponse)
+        self.__recvChannel = factory.CreateRecvChannel(GetServerChannelName(self.__serviceName, ChannelType.RECV), Request,
+                                                       self.__Enqueue, 0, ChannelTakeMode.DRAIN, deserializer=DecodeRequest)
+
+        # busy replies are written off the receive thread, a blocking write must not stall intake
+        self.__StartThread("server_refusal", None)
+
+        # start request threads
+        for i in range(max(1, workerCount)):
+            self.__StartThread("server_queue_" + str(i), 0)
 
-        # start priority request thread
-        self.__queue = BQueue(10)
-        self.__queueThread = Thread(target=self.__QueueThreadFunc, name="server_queue", daemon=True)
-        self.__queueThread.start()
-        
-        if enablePriority:
-            self.__prioQueue = BQueue(5)
-            self.__prioQueueThread = Thread(target=self.__PrioQueueThreadFunc, name="server_prio_queue", daemon=True)
-            self.__prioQueueThread.start()
+        if levels > 1:
+            for i in range(self.__prioWorkerCount):
+                self.__StartThread("server_prio_queue_" + str(i), 1)
 
-        # wait thread started
-        time.sleep(0.5)
+    # number of clients whose request writer is matched
+    def GetClientCount(self):
+        return self.__recvChannel.GetReaderMatchedCount()
+
+    def WaitClient(self, count: int = 1, timeout: float = None):
+        return self.__recvChannel.WaitForReaderMatched(count, timeout)
+
+    def GetQueueStats(self):
+        with self.__statsLock:
+            stats = {
+                "queued": self.__queued,
+                "rejected": self.__rejected,
+                "expired": self.__expired,
+                "handled": self.__handled,
+            }
+        sizes = self.__scheduler.Sizes() if self.__scheduler is not None else [0]
+        stats["depth"] = sizes[0]
+        stats["prioDepth"] = sum(sizes[1:])
+        stats["levelDepth"] = sizes
+        return stats
+
+    # per api calls, latency (queue wait + handler, us), queue wait, handler time, expired, rejected and error codes
+    def GetApiStats(self):
+        return self.__apiStats
 
     def Send(self, response: Response, timeout: float):
         if self.__sendChannel.Write(response, timeout):
@@ -58,21 +168,107 @@ class ServerStub:
             return False
 
     def __Enqueue(self, request: Request):
-        if self.__enablePriority and request.header.policy.priority > 0:
-            self.__prioQueue.Put(request, True)
+        level = self.__scheduler.GetLevel(request.header.policy.priority)
+        if self.__scheduler.Put(level, (time.monotonic(), request)):
+            self.__Count(queued=1)
+        else:
+            self.__Reject(request)
+
+    def __Reject(self, request: Request):
+        self.__Count(rejected=1)
+        self.__apiStats.OnRejected(request.header.identity.api_id)
+        self.__Refuse(request)
+
+    def __Expire(self, request: Request, queueWait: float):
+        self.__Count(expired=1)
+        self.__apiStats.OnExpired(request.header.identity.api_id, queueWait)
+        self.__Refuse(request)
+
+    # answer at once, so the client fails fast instead of waiting for its timeout
+    def __Refuse(self, request: Request, code: int = RPC_ERR_SERVER_BUSY):
+        if request.header.policy.noreply:
+            return
+
+        status = ResponseStatus(code)
+        response = Response(ResponseHeader(request.header.identity, status), "", [])
+        self.__refusals.Put(response)
+
+    # minLevel None runs the refusal thread
+    def __StartThread(self, name: str, minLevel: int):
+        if minLevel is None:
+            thread = Thread(target=self.__RefusalThreadFunc, name=name, daemon=True)
         else:
-            self.__queue.Put(request, True)
+            thread = Thread(target=self.__QueueThreadFunc, args=(minLevel,), name=name, daemon=True)
+        thread.start()
+        self.__queueThreads.append(thread)
 
-    def __QueueThreadFunc(self):
+    def __RefusalThreadFunc(self):
         while True:
-            request = self.__queue.Get()
-            if request is None:
-                continue
-            self.__serverRquestHandler(request)
+            response = self.__refusals.Get()
+            if response is not None:
+                self.__sendChannel.Write(response)
 
-    def __PrioQueueThreadFunc(self):
+    def __QueueThreadFunc(self, minLevel: int):
         while True:
-            request = self.__prioQueue.Get()
-            if request is None:
+            item = self.__scheduler.Get(minLevel)
+            if item is None:
                 continue
-            self.__serverRquestHandler(request)
+            self.__Run(*item)
+
+    def __Run(self, arrival: float, request: Request):
+        with self.__laneLock:
+            lane = self.__lanes.get(request.header.identity.api_id)
+            full = False
+            if lane is not None:
+                if lane.running < lane.limit:
+                    lane.running += 1
+                elif len(lane.pending) < self.__queueLen:
+                    # the worker that finishes a running request of this api picks it up
+                    lane.pending.append((arrival, request))
+                    return
+                else:
+                    full = True
+
+        if full:
+            self.__Reject(request)
+            return
+
+        while request is not None:
+            try:
+                self.__Process(arrival, request)
+            finally:
+                # the lane slot is handed on or released whatever the handler did
+                request = None
+                if lane is not None:
+                    with self.__laneLock:
+                        if lane.pending:
+                            arrival, request = lane.pending.popleft()
+                        else:
+                            lane.running -= 1
+
+    def __Process(self, arrival: float, request: Request):
+        apiId = request.header.identity.api_id
+        start = time.monotonic()
+        if self.__requestTimeout is not None and start - arrival > self.__requestTimeout:
+            self.__Expire(request, start - arrival)
+            return
+
+        try:
+            code = self.__serverRquestHandler(request)
+        except Exception:
+            # the handler did not answer, a raising handler must not cost the worker or the caller's timeout
+            print("[ServerStub] request handler error. apiId:", apiId, ", id:", request.header.identity.id)
+            traceback.print_exc()
+            code = RPC_ERR_SERVER_INTERNAL
+            self.__Refuse(request, code)
+
+        self.__Count(handled=1)
+        end = time.monotonic()
+        self.__apiStats.OnCall(apiId, code or 0, end - arrival, start - arrival, end - start)
+
+    def __Count(self, queued: int = 0, rejected: int = 0, expired: int = 0, handled: int = 0):
+        with self.__statsLock:
+            self.__queued += queued
+            self.__rejected += rejected
+            self.__expired += expired
+            self.__handled += handled
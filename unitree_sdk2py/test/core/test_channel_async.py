@@ -0,0 +1,112 @@
+import time
+import asyncio
+import threading
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize, ChannelPublisher
+from unitree_sdk2py.core.channel_async import AsyncChannelSubscriber, AsyncChannelPublisher
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+
+
+"""
+" two coroutines waiting in Read both wake up, neither waits for its timeout
+"""
+def test_concurrent_readers():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    async def Main():
+        sub = AsyncChannelSubscriber("test_async_readers", String_)
+        sub.Init()
+        pub = AsyncChannelPublisher("test_async_readers", String_)
+        pub.Init()
+
+        readers = [asyncio.ensure_future(sub.Read(2.0)) for i in range(2)]
+        await asyncio.sleep(0.05)
+
+        start = time.monotonic()
+        await pub.Write(String_("a"))
+        await pub.Write(String_("b"))
+        results = await asyncio.gather(*readers)
+
+        sub.Close()
+        pub.Close()
+        return sorted(sample.data for sample in results), time.monotonic() - start
+
+    data, elapsed = asyncio.run(Main())
+    assert data == ["a", "b"]
+    assert elapsed < 1.0
+
+"""
+" Close from another thread wakes a waiting Read, which returns None
+"""
+def test_close_from_thread():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    async def Main():
+        sub = AsyncChannelSubscriber("test_async_close", String_)
+        sub.Init()
+
+        threading.Timer(0.1, sub.Close).start()
+        start = time.monotonic()
+        sample = await sub.Read(2.0)
+        return sample, time.monotonic() - start
+
+    sample, elapsed = asyncio.run(Main())
+    assert sample is None
+    assert elapsed < 1.0
+
+"""
+" a reader woken over and over without winning a sample still returns at its timeout
+"""
+def test_timeout_bounds_woken_reader():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    async def Main():
+        sub = AsyncChannelSubscriber("test_async_timeout", String_)
+        sub.Init()
+        pub = ChannelPublisher("test_async_timeout", String_)
+        pub.Init()
+
+        start = time.monotonic()
+        reader = asyncio.ensure_future(sub.Read(0.3))
+        await asyncio.sleep(0.01)
+
+        stolen = 0
+        while not reader.done() and time.monotonic() - start < 1.0:
+            # the sample is pushed and taken here before the woken reader runs
+            pub.Write(String_("x"))
+            await asyncio.sleep(0)
+            if await sub.Read(0) is not None:
+                stolen += 1
+            await asyncio.sleep(0.05)
+
+        sample = await reader
+        elapsed = time.monotonic() - start
+        sub.Close()
+        pub.Close()
+        return sample, stolen, elapsed
+
+    sample, stolen, elapsed = asyncio.run(Main())
+    assert sample is None
+    assert stolen >= 3
+    assert elapsed < 0.5
+
+"""
+" reading or iterating before Init raises a clear error instead of failing on the missing loop
+"""
+def test_read_before_init():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    async def Main():
+        sub = AsyncChannelSubscriber("test_async_not_init", String_)
+        errors = []
+        for read in [lambda: sub.Read(0.1), lambda: sub.__anext__()]:
+            try:
+                await read()
+            except RuntimeError as e:
+                errors.append(str(e))
+        return errors
+
+    errors = asyncio.run(Main())
+    assert len(errors) == 2
+    assert all("not initialized" in error for error in errors)
@@ -0,0 +1,80 @@
+import xml.etree.ElementTree as ET
+
+from cyclonedds.domain import Domain
+
+from unitree_sdk2py.core.channel_config import ChannelConfig, ChannelConfigAutoDetermine, ChannelConfigHasInterface
+
+
+def Parse(config: ChannelConfig):
+    return ET.fromstring(config.ToXml()).find("Domain")
+
+"""
+" the default configs trace nothing and write no log file
+"""
+def test_tracing_off_by_default():
+    for xml in [ChannelConfigAutoDetermine, ChannelConfigHasInterface, ChannelConfig("eth0").ToXml()]:
+        assert ET.fromstring(xml).find("Domain/Tracing") is None
+
+def test_tracing():
+    domain = Parse(ChannelConfig().SetTracing("fine", "/tmp/test.log"))
+    assert domain.findtext("Tracing/Verbosity") == "fine"
+    assert domain.findtext("Tracing/OutputFile") == "/tmp/test.log"
+
+def test_socket_buffers_and_message_size():
+    config = ChannelConfig("eth0").SetSocketBufferSize(8 << 20, 4 << 20).SetMaxMessageSize(65500).SetFragmentSize(4000)
+    domain = Parse(config)
+    assert domain.find("Internal/SocketReceiveBufferSize").get("min") == str(8 << 20) + "B"
+    assert domain.find("Internal/SocketSendBufferSize").get("min") == str(4 << 20) + "B"
+    assert domain.findtext("General/MaxMessageSize") == "65500B"
+    assert domain.findtext("General/FragmentSize") == "4000B"
+
+def test_interface_and_peers():
+    domain = Parse(ChannelConfig("eth0").SetMulticast(False).SetPeers(["192.168.123.161", "192.168.123.18"]))
+    assert domain.find("General/Interfaces/NetworkInterface").get("name") == "eth0"
+    assert domain.findtext("General/AllowMulticast") == "false"
+    assert [peer.get("address") for peer in domain.findall("Discovery/Peers/Peer")] == ["192.168.123.161", "192.168.123.18"]
+
+    domain = Parse(ChannelConfig())
+    assert domain.find("General/Interfaces/NetworkInterface").get("autodetermine") == "true"
+    assert domain.find("General/AllowMulticast") is None
+    assert domain.find("Discovery") is None
+
+"""
+" the interface given to ToXml fills in for a config without one, and the config is not changed
+"""
+def test_fallback_interface():
+    config = ChannelConfig()
+    domain = ET.fromstring(config.ToXml("eth1")).find("Domain")
+    assert domain.find("General/Interfaces/NetworkInterface").get("name") == "eth1"
+    assert config.networkInterface is None
+
+    domain = ET.fromstring(ChannelConfig("eth0").ToXml("eth1")).find("Domain")
+    assert domain.find("General/Interfaces/NetworkInterface").get("name") == "eth0"
+
+def test_loopback_only():
+    domain = Parse(ChannelConfig("eth0").SetLoopbackOnly())
+    assert domain.find("General/Interfaces/NetworkInterface").get("name") == "lo"
+    assert domain.findtext("General/AllowMulticast") == "false"
+    assert [peer.get("address") for peer in domain.findall("Discovery/Peers/Peer")] == ["127.0.0.1"]
+
+def test_shared_memory():
+    assert Parse(ChannelConfig()).find("SharedMemory") is None
+    assert Parse(ChannelConfig().SetSharedMemory(True)).findtext("SharedMemory/Enable") == "true"
+
+"""
+" cyclonedds accepts the generated xml
+"""
+def test_domain_accepts_config():
+    config = ChannelConfig().SetLoopbackOnly().SetSocketBufferSize(1 << 20, 1 << 20).SetMaxMessageSize(65500)
+    Domain(97, config.ToXml())
+
+if __name__ == "__main__":
+    test_tracing_off_by_default()
+    test_tracing()
+    test_socket_buffers_and_message_size()
+    test_interface_and_peers()
+    test_fallback_interface()
+    test_loopback_only()
+    test_shared_memory()
+    test_domain_accepts_config()
+    print("channel config: ok")
@@ -0,0 +1,45 @@
+import time
+
+from cyclonedds.domain import DomainParticipant
+
+from unitree_sdk2py.core.channel import Channel, ChannelTakeMode, RAW_TAKE_ARGS
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+
+
+"""
+" a raw reader whose decoder fails on one frame still delivers the rest of the taken batch
+"""
+def test_raw_decode_error_keeps_batch():
+    assert RAW_TAKE_ARGS is not None
+
+    def Decode(data: bytes):
+        sample = String_.deserialize(data)
+        if sample.data == "bad":
+            raise ValueError("malformed frame")
+        return sample
+
+    received = []
+    participant = DomainParticipant(0)
+    reader = Channel(participant, "test_channel_raw", String_)
+    reader.SetReader(None, lambda msg: received.append(msg.data), 0, ChannelTakeMode.DRAIN, deserializer=Decode)
+    writer = Channel(participant, "test_channel_raw", String_)
+    writer.SetWriter()
+    assert writer.WaitForMatched(1, 2.0)
+
+    for data in ["m0", "bad", "m1", "m2"]:
+        assert writer.Write(String_(data))
+
+    deadline = time.monotonic() + 2.0
+    while len(received) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    stats = reader.GetStats().Snapshot()
+    reader.CloseReader()
+    writer.CloseWriter()
+
+    assert received == ["m0", "m1", "m2"]
+    assert stats["invalid"] == 1
+
+if __name__ == "__main__":
+    test_raw_decode_error_keeps_batch()
+    print("channel raw: ok")
@@ -0,0 +1,83 @@
+import time
+from types import SimpleNamespace
+
+from unitree_sdk2py.core.channel import ChannelFactory, ChannelFactoryInitialize, ChannelPublisher, ChannelSubscriber, ChannelTakeMode
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.core.channel_stats import ChannelStats
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+
+
+def Sample(source: int):
+    return SimpleNamespace(sample_info=SimpleNamespace(source_timestamp=source))
+
+"""
+" gaps come from the source timestamps, a batch taken at once reports the publishing interval
+"""
+def test_inter_arrival_from_source_timestamps():
+    stats = ChannelStats("test")
+    stats.OnReceive([Sample((i + 1) * 1000000) for i in range(5)])
+    stats.OnReceive([Sample((i + 1) * 1000000) for i in range(5, 10)])
+
+    interArrival = stats.Snapshot()["interArrival"]
+    assert interArrival["count"] == 9
+    assert interArrival["mean"] == 1000.0
+    assert interArrival["jitter"] == 0.0
+
+"""
+" samples without a SampleInfo are only measured one at a time
+"""
+def test_batch_without_sample_info_is_skipped():
+    stats = ChannelStats("test")
+    stats.OnReceive([SimpleNamespace() for i in range(5)])
+
+    assert stats.Snapshot()["interArrival"]["count"] == 0
+    assert stats.Snapshot()["received"] == 5
+
+"""
+" a latest mode sample replaced in the handler queue is counted, every sample is either handled or replaced
+"""
+def test_latest_queue_replacements_counted():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    handled = []
+    def Handler(msg: String_):
+        handled.append(msg.data)
+        time.sleep(0.02)
+
+    sub = ChannelSubscriber("test_stats_replaced", String_)
+    sub.Init(Handler, 1, ChannelTakeMode.LATEST)
+    pub = ChannelPublisher("test_stats_replaced", String_)
+    pub.Init()
+
+    for i in range(20):
+        pub.Write(String_("m" + str(i)))
+    time.sleep(0.2)
+    stats = [s for s in ChannelFactory().Stats() if s["name"] == "test_stats_replaced" and s["received"] > 0][0]
+    sub.Close()
+    pub.Close()
+
+    assert handled[-1] == "m19"
+    assert stats["received"] == 20
+    assert stats["replaced"] > 0
+    assert stats["replaced"] + len(handled) == 20
+    assert stats["dropped"] == 0
+
+"""
+" samples of one take skipped for the newest in latest mode are counted as replaced
+"""
+def test_latest_take_skips_counted():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    handled = []
+    channel = ChannelFactory().CreateChannel("test_stats_take_skips", String_)
+    channel.SetReader(None, lambda msg: handled.append(msg.data), 0, ChannelTakeMode.LATEST)
+
+    # a take returning several samples, the dds listener usually gets one per call
+    channel._Channel__reader._Reader__OnSamples([String_("m" + str(i)) for i in range(5)])
+    stats = channel.GetStats().Snapshot()
+    channel.CloseReader()
+
+    assert handled == ["m4"]
+    assert stats["received"] == 5
+    assert stats["replaced"] == 4
+    assert stats["dropped"] == 0
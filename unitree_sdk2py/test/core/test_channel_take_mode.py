@@ -0,0 +1,58 @@
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactory, ChannelFactoryInitialize, ChannelPublisher, ChannelSubscriber, ChannelTakeMode
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+
+
+"""
+" a slow latest mode handler behind a full queue still ends on the newest sample
+"""
+def test_latest_queue_keeps_newest():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    received = []
+    def Handler(msg: String_):
+        received.append(msg.data)
+        time.sleep(0.05)
+
+    sub = ChannelSubscriber("test_take_latest", String_)
+    sub.Init(Handler, 2, ChannelTakeMode.LATEST)
+    pub = ChannelPublisher("test_take_latest", String_)
+    pub.Init()
+
+    for i in range(10):
+        pub.Write(String_("m" + str(i)))
+
+    time.sleep(0.5)
+    stats = [s for s in ChannelFactory().Stats() if s["name"] == "test_take_latest"]
+    sub.Close()
+
+    assert received[-1] == "m9"
+    assert len(received) <= 4
+    assert all(s["dropped"] == 0 for s in stats)
+
+"""
+" drain mode hands every sample to the handler in order
+"""
+def test_drain_delivers_all():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    received = []
+    sub = ChannelSubscriber("test_take_drain", String_)
+    sub.Init(lambda msg: received.append(msg.data), 0, ChannelTakeMode.DRAIN)
+    pub = ChannelPublisher("test_take_drain", String_)
+    pub.Init()
+
+    for i in range(100):
+        pub.Write(String_("m" + str(i)))
+
+    time.sleep(0.2)
+    sub.Close()
+
+    assert received == ["m" + str(i) for i in range(100)]
+
+if __name__ == "__main__":
+    test_latest_queue_keeps_newest()
+    test_drain_delivers_all()
+    print("channel take mode: ok")
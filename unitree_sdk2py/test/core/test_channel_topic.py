@@ -0,0 +1,81 @@
+import pytest
+
+from cyclonedds.qos import Qos, Policy
+
+from unitree_sdk2py.core.channel import ChannelFactory, ChannelFactoryInitialize, ChannelPublisher, ChannelSubscriber
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.core.channel_qos import ChannelQosKey, ChannelQosControl, ChannelQosRpc
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_, Header_
+
+
+"""
+" a topic name keeps its first type while it is open, another type raises instead of returning the wrong topic
+"""
+def test_topic_type_mismatch_raises():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    factory = ChannelFactory()
+
+    pub = ChannelPublisher("test_topic_type", String_)
+    pub.Init()
+    topic = factory.GetTopic("test_topic_type", String_)
+    assert factory.GetTopic("test_topic_type", String_) is topic
+
+    with pytest.raises(Exception):
+        factory.GetTopic("test_topic_type", Header_)
+    with pytest.raises(Exception):
+        factory.CreateChannel("test_topic_type", Header_)
+    pub.Close()
+
+"""
+" handler subscribers get their own reader unless sharing is enabled
+"""
+def test_reader_sharing_off_by_default():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    assert not ChannelFactory().IsReaderShared()
+
+"""
+" a topic is registered by the first reader or writer and released when the last one closes, a channel
+" created before that opens on the topic registered at the time
+"""
+def test_topic_released_on_last_close():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    factory = ChannelFactory()
+
+    # a channel that never opens registers nothing
+    factory.CreateChannel("test_topic_release", String_)
+    assert factory.GetTopic("test_topic_release", String_) is not factory.GetTopic("test_topic_release", String_)
+
+    pub = ChannelPublisher("test_topic_release", String_)
+    pub.Init()
+    received = []
+    sub = ChannelSubscriber("test_topic_release", String_)
+    sub.Init(received.append)
+    topic = factory.GetTopic("test_topic_release", String_)
+
+    pub.Close()
+    assert factory.GetTopic("test_topic_release", String_) is topic
+    late = ChannelSubscriber("test_topic_release", String_)
+    sub.Close()
+    assert factory.GetTopic("test_topic_release", String_) is not topic
+    assert factory.GetTopic("test_topic_release", String_) is not factory.GetTopic("test_topic_release", String_)
+
+    pub = ChannelPublisher("test_topic_release", String_)
+    pub.Init()
+    lateReceived = []
+    late.Init(lateReceived.append)
+    assert pub.Write(String_("m"))
+    assert [msg.data for msg in lateReceived] == ["m"]
+    assert received == []
+
+    pub.Close()
+    late.Close()
+
+"""
+" shared readers are keyed on the qos value, not on the identity of the Qos object
+"""
+def test_qos_key_by_value():
+    assert ChannelQosKey(None) is None
+    assert ChannelQosKey(Qos(Policy.History.KeepLast(1), Policy.Reliability.BestEffort)) == \
+        ChannelQosKey(Qos(Policy.Reliability.BestEffort, Policy.History.KeepLast(1)))
+    assert ChannelQosKey(Qos(Policy.History.KeepLast(1))) != ChannelQosKey(Qos(Policy.History.KeepLast(2)))
+    assert ChannelQosKey(ChannelQosControl) != ChannelQosKey(ChannelQosRpc)
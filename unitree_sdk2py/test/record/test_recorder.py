@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import subprocess
+
+import unitree_sdk2py
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize, ChannelPublisher, ChannelSubscriber, ChannelTakeMode
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.idl.std_msgs.msg.dds_ import String_
+from unitree_sdk2py.record.log_format import SegmentPath
+from unitree_sdk2py.record.log_reader import LogReader
+from unitree_sdk2py.record.recorder import Recorder
+from unitree_sdk2py.record.replayer import Replayer
+
+RECORD_TOPICS = [("test/record/a", String_), ("test/record/b", String_)]
+RECORD_COUNT = 20
+# 15 records or 8 index entries per segment
+RECORD_SEGMENT_SIZE = 512
+
+
+# records over dds, run in its own process since the tests of this process use the inproc transport
+def Record(path: str):
+    ChannelFactoryInitialize(0)
+    recorder = Recorder(path, RECORD_TOPICS, RECORD_SEGMENT_SIZE)
+    assert recorder.Start()
+
+    publishers = []
+    for name, type in RECORD_TOPICS:
+        publisher = ChannelPublisher(name, type)
+        publisher.Init()
+        assert publisher.WaitForMatched(1, 5.0)
+        publishers.append(publisher)
+
+    for i in range(RECORD_COUNT):
+        publishers[i % 2].Write(String_("m{:02d}".format(i)))
+        # wait for the take, so every record gets its own timestamp
+        deadline = time.monotonic() + 2.0
+        while recorder.GetRecordedCount() <= i and time.monotonic() < deadline:
+            time.sleep(0.001)
+        time.sleep(0.2 if i == RECORD_COUNT // 2 - 1 else 0.01)
+
+    recorder.Stop()
+    assert recorder.GetRecordedCount() == RECORD_COUNT
+
+
+def RecordInProcess(path: str):
+    root = os.path.dirname(os.path.dirname(unitree_sdk2py.__file__))
+    env = dict(os.environ, PYTHONPATH=root)
+    result = subprocess.run([sys.executable, __file__, "record", path], env=env, timeout=30)
+    assert result.returncode == 0
+
+"""
+" a log written across several small segments reads back in order, seeks by time and replays in order
+"""
+def test_record_read_replay(tmp_path):
+    path = str(tmp_path / "log")
+    RecordInProcess(path)
+    assert os.path.exists(SegmentPath(path, 2))
+
+    reader = LogReader(path)
+    records = [(timestamp, name, sample.data) for timestamp, name, sample in reader.Read()]
+    assert [data for _, _, data in records] == ["m{:02d}".format(i) for i in range(RECORD_COUNT)]
+    assert [name for _, name, _ in records] == [RECORD_TOPICS[i % 2][0] for i in range(RECORD_COUNT)]
+    times = [timestamp for timestamp, _, _ in records]
+    assert times == sorted(times)
+    assert reader.StartTime() == times[0] and reader.EndTime() == times[-1]
+
+    # seek into the second segment
+    seek = times[12]
+    assert [s.data for _, _, s in reader.Read(seek)] == [r[2] for r in records if r[0] >= seek]
+    assert [s.data for _, _, s in reader.Read(times[3], seek)] == [r[2] for r in records if times[3] <= r[0] < seek]
+    assert [s.data for _, _, s in reader.Read(topics=["test/record/b"])] == [r[2] for r in records[1::2]]
+    reader.Close()
+
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    received = []
+    subscribers = []
+    for name in ["test/replay/a", "test/replay/b"]:
+        subscriber = ChannelSubscriber(name, String_)
+        subscriber.Init(lambda msg: received.append(msg.data), 0, ChannelTakeMode.DRAIN)
+        subscribers.append(subscriber)
+
+    replayer = Replayer(path, 1.0, remap={"test/record/a": "test/replay/a", "test/record/b": "test/replay/b"})
+    replayer.Init()
+    start = time.monotonic()
+    assert replayer.Play() == RECORD_COUNT
+    elapsed = time.monotonic() - start
+    replayer.Close()
+    for subscriber in subscribers:
+        subscriber.Close()
+
+    assert received == [data for _, _, data in records]
+    # the gap in the middle of the recording is kept
+    assert elapsed >= (times[-1] - times[0]) / 1e9 * 0.9
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "record":
+        Record(sys.argv[2])
+    else:
+        import tempfile, pathlib
+        with tempfile.TemporaryDirectory() as tmp:
+            test_record_read_replay(pathlib.Path(tmp))
+        print("recorder: ok")
@@ -0,0 +1,99 @@
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.server import Server
+from unitree_sdk2py.rpc.internal import RPC_ERR_CLIENT_API_TIMEOUT, RPC_ERR_CLIENT_API_NOT_REG, RPC_ERR_SERVER_API_PARAMETER
+
+BATCH_SERVICE_NAME = "test_batch"
+BATCH_API_ID_ECHO = 1001
+BATCH_API_ID_FAIL = 1002
+BATCH_API_ID_UNKNOWN = 1003
+
+"""
+" class BatchServer
+" echo answers with the parameter after sleeping the seconds it names
+"""
+class BatchServer(Server):
+    def __init__(self):
+        super().__init__(BATCH_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistHandler(BATCH_API_ID_ECHO, self.Echo, False)
+        self._RegistHandler(BATCH_API_ID_FAIL, self.Fail, False)
+
+    def Echo(self, parameter: str):
+        time.sleep(float(parameter.split(":")[1]))
+        return 0, parameter
+
+    def Fail(self, parameter: str):
+        return RPC_ERR_SERVER_API_PARAMETER, ""
+
+class BatchClient(Client):
+    def __init__(self):
+        super().__init__(BATCH_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistApi(BATCH_API_ID_ECHO, 0)
+        self._RegistApi(BATCH_API_ID_FAIL, 0)
+
+
+def Start():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    server = BatchServer()
+    server.Init()
+    server.Start(False, 4)
+    client = BatchClient()
+    client.Init()
+    client.SetTimeout(2.0)
+    assert client.WaitReady(2.0)
+    return server, client
+
+"""
+" the calls of a batch are in flight together, the batch takes one round trip, not one per call
+"""
+def test_batch_waits_once():
+    server, client = Start()
+
+    start = time.monotonic()
+    results = client._CallBatch([(BATCH_API_ID_ECHO, "c{}:0.1".format(i)) for i in range(4)])
+    elapsed = time.monotonic() - start
+
+    assert results == [(0, "c{}:0.1".format(i)) for i in range(4)]
+    assert elapsed < 0.3
+    client.Close()
+
+"""
+" results come back in call order with their own codes, parsers apply per call, and the
+" calls still pending at the shared deadline time out while the others keep their results
+"""
+def test_batch_codes_and_partial_timeout():
+    server, client = Start()
+
+    calls = [
+        (BATCH_API_ID_ECHO, "slow:0.5"),
+        (BATCH_API_ID_FAIL, "{}"),
+        (BATCH_API_ID_ECHO, "fast:0", lambda code, data: data.upper()),
+        (BATCH_API_ID_UNKNOWN, "{}"),
+        (BATCH_API_ID_ECHO, "slower:0.8"),
+    ]
+    start = time.monotonic()
+    results = client._CallBatch(calls, 0.2)
+    elapsed = time.monotonic() - start
+
+    assert results == [
+        (RPC_ERR_CLIENT_API_TIMEOUT, None),
+        (RPC_ERR_SERVER_API_PARAMETER, ""),
+        "FAST:0",
+        (RPC_ERR_CLIENT_API_NOT_REG, None),
+        (RPC_ERR_CLIENT_API_TIMEOUT, None),
+    ]
+    # one deadline for the batch, the second slow call does not wait another 0.2s
+    assert 0.18 < elapsed < 0.35
+    client.Close()
+
+if __name__ == "__main__":
+    test_batch_waits_once()
+    test_batch_codes_and_partial_timeout()
+    print("call batch: ok")
@@ -0,0 +1,92 @@
+import array
+import struct
+
+import pytest
+
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import Request_ as Request
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import RequestHeader_ as RequestHeader
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import RequestIdentity_ as RequestIdentity
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import RequestLease_ as RequestLease
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import RequestPolicy_ as RequestPolicy
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import Response_ as Response
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import ResponseHeader_ as ResponseHeader
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import ResponseStatus_ as ResponseStatus
+from unitree_sdk2py.rpc.cdr_codec import EncodeRequest, DecodeRequest, EncodeResponse, DecodeResponse
+
+# string lengths and binary sizes that walk the padding through every alignment
+TEXTS = ["", "a", "ab", "abc", '{"x": 0.3}', "é中"]
+BINARIES = [b"", b"\x01", b"\x01\x02\x03", bytes(range(256))]
+
+
+def MakeRequest(parameter: str, binary, noreply: bool = False):
+    header = RequestHeader(RequestIdentity(-5, 1001), RequestLease(7), RequestPolicy(2, noreply))
+    return Request(header, parameter, binary)
+
+
+def MakeResponse(data: str, binary, code: int = 0):
+    return Response(ResponseHeader(RequestIdentity(1 << 40, 1002), ResponseStatus(code)), data, binary)
+
+"""
+" the request is xcdr1 little endian: the final header, then the string and the sequence aligned to 4,
+" the frame padded to 4 bytes
+"""
+def test_request_layout():
+    data = EncodeRequest(MakeRequest("ab", [1, 2, 3], True))
+    assert data == (b"\x00\x01\x00\x00" + struct.pack("<qqqi?", -5, 1001, 7, 2, True) + b"\x00" * 3
+                    + struct.pack("<I", 3) + b"ab\x00" + b"\x00"
+                    + struct.pack("<I", 3) + b"\x01\x02\x03" + b"\x00")
+
+def test_response_layout():
+    data = EncodeResponse(MakeResponse("", b"", 3104))
+    assert data == (b"\x00\x01\x00\x00" + struct.pack("<qqi", 1 << 40, 1002, 3104)
+                    + struct.pack("<I", 1) + b"\x00" + b"\x00" * 3 + struct.pack("<I", 0))
+
+# what DataWriter.write sends for the sample
+def StockFrame(sample):
+    data = sample.serialize()
+    return data + b"\x00" * (-len(data) & 3)
+
+"""
+" the codec writes the same frames as the stock writer
+"""
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("binary", BINARIES)
+def test_matches_stock_writer(text, binary):
+    request = MakeRequest(text, list(binary), True)
+    assert EncodeRequest(request) == StockFrame(request)
+    response = MakeResponse(text, list(binary), 3102)
+    assert EncodeResponse(response) == StockFrame(response)
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("binary", BINARIES)
+def test_request_round_trip(text, binary):
+    request = DecodeRequest(EncodeRequest(MakeRequest(text, binary, True)))
+    header = request.header
+    assert (header.identity.id, header.identity.api_id, header.lease.id) == (-5, 1001, 7)
+    assert (header.policy.priority, header.policy.noreply) == (2, True)
+    assert request.parameter == text
+    assert request.binary == binary
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("binary", BINARIES)
+def test_response_round_trip(text, binary):
+    response = DecodeResponse(EncodeResponse(MakeResponse(text, binary, 3102)))
+    header = response.header
+    assert (header.identity.id, header.identity.api_id, header.status.code) == (1 << 40, 1002, 3102)
+    assert response.data == text
+    assert response.binary == binary
+
+"""
+" a binary payload may be given as any buffer or a list of ints, it is decoded as bytes
+"""
+@pytest.mark.parametrize("binary", [[1, 2, 255], bytearray(b"\x01\x02\xff"), memoryview(b"\x01\x02\xff"),
+                                    array.array("B", [1, 2, 255])])
+def test_binary_types(binary):
+    response = DecodeResponse(EncodeResponse(MakeResponse("x", binary)))
+    assert type(response.binary) is bytes
+    assert response.binary == b"\x01\x02\xff"
+
+def test_wider_buffer_is_sent_as_bytes():
+    binary = array.array("H", [1, 0x0201])
+    response = DecodeResponse(EncodeResponse(MakeResponse("", binary)))
+    assert response.binary == binary.tobytes()
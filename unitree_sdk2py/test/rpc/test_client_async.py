@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.server import Server
+from unitree_sdk2py.rpc.internal import RPC_ERR_CLIENT_API_TIMEOUT
+
+ASYNC_SERVICE_NAME = "test_client_async"
+ASYNC_API_ID_ECHO = 1001
+
+"""
+" class AsyncServer
+" echo answers with the parameter after sleeping the seconds it names
+"""
+class AsyncServer(Server):
+    def __init__(self):
+        super().__init__(ASYNC_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistHandler(ASYNC_API_ID_ECHO, self.Echo, False)
+
+    def Echo(self, parameter: str):
+        time.sleep(float(parameter.split(":")[1]))
+        return 0, parameter
+
+class AsyncClient(Client):
+    def __init__(self):
+        super().__init__(ASYNC_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistApi(ASYNC_API_ID_ECHO, 0)
+
+
+def Start():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    server = AsyncServer()
+    server.Init()
+    server.Start(False, 4)
+    client = AsyncClient()
+    client.Init()
+    client.SetTimeout(2.0)
+    assert client.WaitReady(2.0)
+    return server, client
+
+"""
+" 'await future' and AsyncResult both give (code, data), or the parsed value with a parser
+"""
+def test_await_future():
+    server, client = Start()
+
+    async def Main():
+        plain = await client._CallAsync(ASYNC_API_ID_ECHO, "a:0")
+        parsed = await client._CallAsync(ASYNC_API_ID_ECHO, "b:0", lambda code, data: (code, data.upper()))
+        explicit = await client._CallAsync(ASYNC_API_ID_ECHO, "c:0").AsyncResult(1.0)
+        return plain, parsed, explicit
+
+    assert asyncio.run(Main()) == ((0, "a:0"), (0, "B:0"), (0, "c:0"))
+    client.Close()
+
+"""
+" several calls outstanding on one client are pipelined: each resolves to its own response,
+" and together they take one round trip, not one per call
+"""
+def test_pipelined_calls():
+    server, client = Start()
+
+    async def Main():
+        futures = [client._CallAsync(ASYNC_API_ID_ECHO, "p{}:0.1".format(i)) for i in range(4)]
+        start = time.monotonic()
+        results = await asyncio.gather(*[future.AsyncResult() for future in reversed(futures)])
+        return results, time.monotonic() - start
+
+    results, elapsed = asyncio.run(Main())
+    assert results == [(0, "p{}:0.1".format(i)) for i in reversed(range(4))]
+    assert elapsed < 0.3
+    client.Close()
+
+"""
+" a wait shorter than the handler ends with the timeout code, without blocking the loop
+"""
+def test_async_result_timeout():
+    server, client = Start()
+
+    async def Main():
+        future = client._CallAsync(ASYNC_API_ID_ECHO, "slow:0.5")
+        ticks = 0
+
+        async def Tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(Tick())
+        start = time.monotonic()
+        result = await future.AsyncResult(0.1)
+        elapsed = time.monotonic() - start
+        ticker.cancel()
+        return result, elapsed, ticks
+
+    result, elapsed, ticks = asyncio.run(Main())
+    assert result == (RPC_ERR_CLIENT_API_TIMEOUT, None)
+    assert 0.09 < elapsed < 0.3
+    assert ticks >= 5
+    client.Close()
+
+if __name__ == "__main__":
+    test_await_future()
+    test_pipelined_calls()
+    test_async_result_timeout()
+    print("client async: ok")
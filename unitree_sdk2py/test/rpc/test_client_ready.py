@@ -0,0 +1,75 @@
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client, WaitClientsReady
+from unitree_sdk2py.rpc.server import Server
+
+READY_API_ID_ECHO = 1001
+
+"""
+" class ReadyServer
+"""
+class ReadyServer(Server):
+    def Init(self):
+        self._RegistHandler(READY_API_ID_ECHO, self.Echo, False)
+
+    def Echo(self, parameter: str):
+        return 0, parameter
+
+class ReadyClient(Client):
+    def Init(self):
+        self._RegistApi(READY_API_ID_ECHO, 0)
+
+
+def StartServer(serviceName: str):
+    server = ReadyServer(serviceName)
+    server.Init()
+    server.Start(False)
+    return server
+
+"""
+" with a server missing, WaitClientsReady gives False once the shared timeout is spent,
+" not one timeout per client
+"""
+def test_missing_server_times_out():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    StartServer("test_ready_present")
+
+    clients = [ReadyClient("test_ready_missing_a"), ReadyClient("test_ready_present"), ReadyClient("test_ready_missing_b")]
+    for client in clients:
+        client.Init()
+
+    start = time.monotonic()
+    assert not WaitClientsReady(clients, 0.3)
+    elapsed = time.monotonic() - start
+
+    assert 0.25 < elapsed < 0.5
+    assert [client.IsReady() for client in clients] == [False, True, False]
+    for client in clients:
+        client.Close()
+
+"""
+" IsReady flips once the server endpoints match, and then every client is ready
+"""
+def test_ready_after_server_start():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    clients = [ReadyClient("test_ready_late_a"), ReadyClient("test_ready_late_b")]
+    for client in clients:
+        client.Init()
+    assert not any(client.IsReady() for client in clients)
+
+    StartServer("test_ready_late_a")
+    StartServer("test_ready_late_b")
+
+    assert WaitClientsReady(clients, 2.0)
+    assert all(client.IsReady() for client in clients)
+    assert clients[0]._Call(READY_API_ID_ECHO, "ping") == (0, "ping")
+    for client in clients:
+        client.Close()
+
+if __name__ == "__main__":
+    test_missing_server_times_out()
+    test_ready_after_server_start()
+    print("client ready: ok")
@@ -0,0 +1,102 @@
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.server import Server
+from unitree_sdk2py.rpc.client_retry import RetryPolicy
+from unitree_sdk2py.rpc.internal import RPC_ERR_CLIENT_API_TIMEOUT
+
+RETRY_API_ID_GET = 1001
+
+"""
+" class LossyServer
+" the first request after Lose() stands for a lost packet, it is answered after its client gave up
+"""
+class LossyServer(Server):
+    def __init__(self, serviceName: str):
+        super().__init__(serviceName)
+        self.lose = False
+
+    def Init(self):
+        self._RegistHandler(RETRY_API_ID_GET, self.Get, False)
+
+    def Get(self, parameter: str):
+        if self.lose:
+            self.lose = False
+            time.sleep(1.0)
+        return 0, "v"
+
+class RetryClient(Client):
+    def __init__(self, serviceName: str):
+        super().__init__(serviceName)
+
+    def Init(self):
+        self._RegistApi(RETRY_API_ID_GET, 0)
+
+
+# a service per test, servers keep running once started
+def Start(serviceName: str):
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    server = LossyServer(serviceName)
+    server.Init()
+    server.Start(False, 4)
+    client = RetryClient(serviceName)
+    client.Init()
+    assert client.WaitReady(2.0)
+    return server, client
+
+"""
+" the hedge delay is the exact percentile of the recent latencies, not a power of two bucket bound
+"""
+def test_hedge_delay_is_exact_percentile():
+    policy = RetryPolicy(1, hedge=True)
+    assert policy.GetHedgeDelay() is None
+
+    # refreshed at 20, 52, 84 and 116 samples
+    for i in range(1, 117):
+        policy.AddLatency(i / 1000.0)
+    assert abs(policy.GetHedgeDelay() - 0.111) < 1e-9
+
+def test_schedule_splits_budget():
+    policy = RetryPolicy(3)
+    assert [(round(delay, 6), hedge) for delay, hedge in policy.GetSchedule(0.6)] == [(0.2, False), (0.4, False)]
+
+"""
+" a lost attempt is sent again after its share of the budget, the retry answers the call
+"""
+def test_retry_recovers_lost_request():
+    server, client = Start("test_retry")
+
+    server.lose = True
+    start = time.monotonic()
+    assert client._Call(RETRY_API_ID_GET, "{}", timeout=0.6)[0] == RPC_ERR_CLIENT_API_TIMEOUT
+
+    client.SetApiRetry(RETRY_API_ID_GET, attempts=3)
+    server.lose = True
+    start = time.monotonic()
+    assert client._Call(RETRY_API_ID_GET, "{}", timeout=0.6) == (0, "v")
+    assert 0.15 < time.monotonic() - start < 0.4
+    assert client.GetApiRetryStats(RETRY_API_ID_GET)["retries"] >= 1
+
+    client.Close()
+
+"""
+" with hedging a slow call gets a second attempt after the api's p95 latency
+"""
+def test_hedge_answers_slow_call():
+    server, client = Start("test_hedge")
+
+    client.SetApiRetry(RETRY_API_ID_GET, attempts=1, hedge=True)
+    for i in range(40):
+        assert client._Call(RETRY_API_ID_GET, "{}") == (0, "v")
+
+    # a warm up call slower than the p95 may have been hedged already
+    hedges = client.GetApiRetryStats(RETRY_API_ID_GET)["hedges"]
+    server.lose = True
+    start = time.monotonic()
+    assert client._Call(RETRY_API_ID_GET, "{}", timeout=1.0) == (0, "v")
+    assert time.monotonic() - start < 0.2
+    assert client.GetApiRetryStats(RETRY_API_ID_GET)["hedges"] == hedges + 1
+
+    client.Close()
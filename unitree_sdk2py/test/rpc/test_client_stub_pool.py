@@ -0,0 +1,162 @@
+import time
+import threading
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.client_stub import ClientStubPool
+from unitree_sdk2py.rpc.lease_client import LeaseClient
+from unitree_sdk2py.rpc.server import Server
+
+POOL_API_ID_ECHO = 1001
+
+"""
+" class EchoServer
+" answers with the parameter, after sleeping the seconds it names
+"""
+class EchoServer(Server):
+    def __init__(self, serviceName: str):
+        super().__init__(serviceName)
+
+    def Init(self):
+        self._RegistHandler(POOL_API_ID_ECHO, self.Echo, False)
+
+    def Echo(self, parameter: str):
+        time.sleep(float(parameter.split(":")[1]))
+        return 0, parameter
+
+class EchoClient(Client):
+    def __init__(self, serviceName: str):
+        super().__init__(serviceName)
+
+    def Init(self):
+        self._RegistApi(POOL_API_ID_ECHO, 0)
+
+
+def ReaderThreadCount():
+    return sum(1 for thread in threading.enumerate() if thread.name == "ch_reader")
+
+"""
+" clients of one service share one stub and its response thread
+"""
+def test_clients_share_stub():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    pool = ClientStubPool()
+
+    threads = ReaderThreadCount()
+    first = EchoClient("test_pool_share")
+    assert ReaderThreadCount() == threads + 1
+    second = EchoClient("test_pool_share")
+    assert ReaderThreadCount() == threads + 1
+    assert pool.GetRefCount("test_pool_share") == 2
+
+    stub = pool.Acquire("test_pool_share")
+    assert pool.Acquire("test_pool_share") is stub
+    pool.Release("test_pool_share")
+    pool.Release("test_pool_share")
+
+    first.Close()
+    second.Close()
+    assert pool.GetRefCount("test_pool_share") == 0
+
+"""
+" lease clients of one service share the stub of its lease service
+"""
+def test_lease_clients_share_stub():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    pool = ClientStubPool()
+
+    first = LeaseClient("test_pool_lease")
+    second = LeaseClient("test_pool_lease")
+    assert pool.GetRefCount("test_pool_lease_lease") == 2
+    assert pool.GetRefCount("test_pool_lease") == 0
+
+    first.Close()
+    second.Close()
+    assert pool.GetRefCount("test_pool_lease_lease") == 0
+
+"""
+" request ids of a shared stub never collide, whatever the thread asking
+"""
+def test_request_ids_unique():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+    pool = ClientStubPool()
+    stub = pool.Acquire("test_pool_ids")
+
+    ids = [[] for i in range(4)]
+    def Take(out: list):
+        for i in range(1000):
+            out.append(stub.NextRequestId())
+
+    threads = [threading.Thread(target=Take, args=(out,)) for out in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.Release("test_pool_ids")
+
+    assert len(set(sum(ids, []))) == 4000
+    assert all(out == sorted(out) for out in ids)
+
+"""
+" responses on the shared stub reach the client that sent the request, even out of order
+"""
+def test_responses_routed_by_request_id():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    server = EchoServer("test_pool_route")
+    server.Init()
+    server.Start(False, 4)
+
+    clients = [EchoClient("test_pool_route") for i in range(2)]
+    for client in clients:
+        client.Init()
+        client.SetTimeout(2.0)
+        assert client.WaitReady(2.0)
+
+    # the slow calls are answered after the fast ones sent later
+    futures = []
+    for i in range(4):
+        client = clients[i % 2]
+        parameter = "c{}-{}:{}".format(i % 2, i, 0.2 if i < 2 else 0.0)
+        futures.append((parameter, client._CallAsync(POOL_API_ID_ECHO, parameter)))
+
+    for parameter, future in futures:
+        assert future.GetResult() == (0, parameter)
+
+    for client in clients:
+        client.Close()
+
+"""
+" only the last Release closes the stub's writer and reader
+"""
+def test_last_release_closes_stub():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    server = EchoServer("test_pool_close")
+    server.Init()
+    server.Start(False)
+
+    first = EchoClient("test_pool_close")
+    second = EchoClient("test_pool_close")
+    first.Init()
+    second.Init()
+    assert first.WaitReady(2.0)
+    assert server.GetClientCount() == 1
+
+    first.Close()
+    assert server.GetClientCount() == 1
+    assert second.IsReady()
+    assert second._Call(POOL_API_ID_ECHO, "x:0")[0] == 0
+
+    second.Close()
+    assert server.GetClientCount() == 0
+    assert ClientStubPool().GetRefCount("test_pool_close") == 0
+
+if __name__ == "__main__":
+    test_clients_share_stub()
+    test_lease_clients_share_stub()
+    test_request_ids_unique()
+    test_responses_routed_by_request_id()
+    test_last_release_closes_stub()
+    print("client stub pool: ok")
@@ -0,0 +1,155 @@
+import time
+
+from unitree_sdk2py.rpc.command_stream import CommandStream
+
+STOP = (0.0, 0.0, 0.0)
+MOVE = (0.3, 0.0, 0.0)
+
+"""
+" class FakeSend
+" records every sent command with its send time
+"""
+class FakeSend:
+    def __init__(self, code: int = 0):
+        self.code = code
+        self.sent = []
+
+    def __call__(self, *values):
+        self.sent.append((time.monotonic(), values))
+        return self.code
+
+    def Values(self):
+        return [values for _, values in self.sent]
+
+
+def Stream(send: FakeSend, timeout: float = 5.0, keepalive: float = None, stopRepeat: int = 3):
+    stream = CommandStream(send, 100.0, STOP, timeout, keepalive, stopRepeat)
+    stream.Start()
+    return stream
+
+"""
+" a burst of Sets between two ticks is sent as its newest value only
+"""
+def test_latest_wins():
+    send = FakeSend()
+    stream = Stream(send)
+    for i in range(1000):
+        stream.Set(i / 1000.0, 0.0, 0.0)
+    time.sleep(0.1)
+    stream.Close()
+
+    assert send.Values()[-2] == (0.999, 0.0, 0.0)
+    assert send.Values()[-1] == STOP
+    assert len(send.sent) < 50
+    assert stream.GetStats()["set"] == 1000
+
+"""
+" an unchanged command is sent once when keepalive is off
+"""
+def test_duplicates_suppressed():
+    send = FakeSend()
+    stream = Stream(send)
+    stream.Set(*MOVE)
+    time.sleep(0.15)
+
+    assert send.Values() == [MOVE]
+    assert stream.GetStats()["suppressed"] > 5
+    stream.Close()
+
+"""
+" an unchanged command is sent again every keepalive seconds
+"""
+def test_keepalive_resend():
+    send = FakeSend()
+    stream = Stream(send, keepalive=0.1)
+    stream.Set(*MOVE)
+    time.sleep(0.45)
+    stream.Close()
+
+    moves = [t for t, values in send.sent if values == MOVE]
+    assert 3 <= len(moves) <= 6
+    assert all(b - a >= 0.09 for a, b in zip(moves, moves[1:]))
+
+"""
+" a silent producer gets the stop values sent stopRepeat times, then nothing until the next Set
+"""
+def test_stop_on_silence():
+    send = FakeSend()
+    stream = Stream(send, timeout=0.1, keepalive=0.03, stopRepeat=3)
+    stream.Set(*MOVE)
+    time.sleep(0.4)
+
+    values = send.Values()
+    assert values[0] == MOVE
+    assert values[-3:] == [STOP] * 3
+    assert STOP not in values[:-3]
+    assert stream.GetStats()["stops"] == 3
+
+    count = len(send.sent)
+    time.sleep(0.1)
+    assert len(send.sent) == count
+
+    stream.Set(*MOVE)
+    time.sleep(0.05)
+    assert send.Values()[count] == MOVE
+    stream.Close()
+
+"""
+" with keepalive off a silent producer still gets the stop repeated on consecutive ticks
+"""
+def test_stop_repeated_without_keepalive():
+    send = FakeSend()
+    stream = Stream(send, timeout=0.1, keepalive=None, stopRepeat=3)
+    stream.Set(*MOVE)
+    time.sleep(0.3)
+
+    assert send.Values() == [MOVE, STOP, STOP, STOP]
+    stops = [t for t, values in send.sent if values == STOP]
+    assert stops[-1] - stops[0] < 0.1
+    stream.Close()
+    assert send.Values() == [MOVE, STOP, STOP, STOP]
+
+"""
+" Close sends one final stop while the robot may be moving, none once it was stopped
+"""
+def test_close_sends_stop():
+    send = FakeSend()
+    stream = Stream(send)
+    stream.Set(*MOVE)
+    time.sleep(0.05)
+    stream.Close()
+
+    assert send.Values() == [MOVE, STOP]
+    time.sleep(0.05)
+    assert len(send.sent) == 2
+
+    send = FakeSend()
+    stream = Stream(send)
+    stream.Set(*MOVE)
+    time.sleep(0.05)
+    stream.Stop()
+    time.sleep(0.1)
+    stream.Close()
+
+    assert send.Values() == [MOVE, STOP, STOP, STOP]
+
+"""
+" send failures are counted, not raised
+"""
+def test_send_errors_counted():
+    send = FakeSend(3104)
+    stream = Stream(send)
+    stream.Set(*MOVE)
+    time.sleep(0.05)
+    stream.Close()
+
+    assert stream.GetStats()["errors"] == 2
+
+if __name__ == "__main__":
+    test_latest_wins()
+    test_duplicates_suppressed()
+    test_keepalive_resend()
+    test_stop_on_silence()
+    test_close_sends_stop()
+    test_send_errors_counted()
+    print("command stream: ok")
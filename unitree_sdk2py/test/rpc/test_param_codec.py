@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from unitree_sdk2py.rpc.param_codec import ParamTemplate, SetJsonBackend, GetJsonBackend, JsonLoads, orjson, ujson
+from unitree_sdk2py.rpc.param_codec import JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON, JSON_BACKEND_UJSON
+
+MOVE = ParamTemplate(("x", float), ("y", float), ("z", float))
+VELOCITY = ParamTemplate(("velocity", [float, float, float]), ("duration", float))
+MIXED = ParamTemplate(("x", float), ("mode", int), ("on", bool), ("name", str))
+
+VALUES = [
+    (MOVE, (0.3, 0.0, -1e-7), {"x": 0.3, "y": 0.0, "z": -1e-7}),
+    (MOVE, (2, True, 1), {"x": 2, "y": True, "z": 1}),
+    (VELOCITY, (1, 2, 3, 1.0), {"velocity": [1, 2, 3], "duration": 1.0}),
+    (MIXED, (0.5, 3, False, 'a "b"'), {"x": 0.5, "mode": 3, "on": False, "name": 'a "b"'}),
+]
+
+BACKENDS = [JSON_BACKEND_STDLIB] + ([JSON_BACKEND_ORJSON] if orjson else []) + ([JSON_BACKEND_UJSON] if ujson else [])
+
+
+def test_default_backend_is_stdlib():
+    assert GetJsonBackend() == JSON_BACKEND_STDLIB
+
+"""
+" the stdlib backend writes the very text json.dumps writes, values are not coerced
+"""
+def test_stdlib_text_matches_json_dumps():
+    for template, values, obj in VALUES:
+        assert template.Encode(*values) == json.dumps(obj)
+
+"""
+" every backend writes the same values
+"""
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_agree(backend):
+    assert SetJsonBackend(backend)
+    try:
+        for template, values, obj in VALUES:
+            text = template.Encode(*values)
+            assert json.loads(text) == obj
+            assert [type(v) for v in json.loads(text).values()] == [type(v) for v in obj.values()]
+            assert JsonLoads(text) == obj
+    finally:
+        SetJsonBackend(JSON_BACKEND_STDLIB)
+
+def test_unsupported_field_type():
+    with pytest.raises(TypeError):
+        ParamTemplate(("x", dict))
@@ -0,0 +1,66 @@
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.server import Server
+from unitree_sdk2py.rpc.internal import RPC_ERR_SERVER_BUSY
+
+EXPIRY_SERVICE_NAME = "test_expiry"
+EXPIRY_API_ID_SLOW = 1001
+
+"""
+" class SlowServer
+"""
+class SlowServer(Server):
+    def __init__(self):
+        super().__init__(EXPIRY_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistHandler(EXPIRY_API_ID_SLOW, self.Slow, False)
+
+    def Slow(self, parameter: str):
+        time.sleep(0.3)
+        return 0, parameter
+
+"""
+" class SlowClient
+"""
+class SlowClient(Client):
+    def __init__(self):
+        super().__init__(EXPIRY_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistApi(EXPIRY_API_ID_SLOW, 0)
+
+"""
+" a request that waits in the queue past the request timeout is answered with
+" RPC_ERR_SERVER_BUSY, so a client with a longer timeout fails fast
+"""
+def test_expired_request_gets_response():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    server = SlowServer()
+    server.Init()
+    server.SetRequestTimeout(0.1)
+    server.Start(False)
+
+    client = SlowClient()
+    client.Init()
+    client.SetTimeout(5.0)
+    assert client.WaitReady(2.0)
+
+    start = time.monotonic()
+    first = client._CallAsync(EXPIRY_API_ID_SLOW, "{}")
+    second = client._CallAsync(EXPIRY_API_ID_SLOW, "{}")
+
+    assert first.GetResult()[0] == 0
+    assert second.GetResult()[0] == RPC_ERR_SERVER_BUSY
+    assert time.monotonic() - start < 1.0
+    assert server.GetQueueStats()["expired"] == 1
+
+    client.Close()
+
+if __name__ == "__main__":
+    test_expired_request_gets_response()
+    print("request expiry: ok")
@@ -0,0 +1,57 @@
+from unitree_sdk2py.rpc.request_scheduler import RequestScheduler, SchedulePolicy
+
+
+def Fill(scheduler: RequestScheduler, count: int):
+    for level in range(scheduler.GetLevels()):
+        for i in range(count):
+            assert scheduler.Put(level, (level, i))
+
+
+def Levels(scheduler: RequestScheduler, count: int):
+    return [scheduler.Get(timeout=0)[0] for i in range(count)]
+
+"""
+" strict serves the highest non-empty level first, each level in arrival order
+"""
+def test_strict_order():
+    scheduler = RequestScheduler(3, [10, 10, 10], SchedulePolicy.STRICT)
+    Fill(scheduler, 2)
+    assert [scheduler.Get(timeout=0) for i in range(6)] == [(2, 0), (2, 1), (1, 0), (1, 1), (0, 0), (0, 1)]
+    assert scheduler.Get(timeout=0) is None
+
+"""
+" weighted interleaves the levels by smooth weighted round robin, 1:2:4 by default
+"""
+def test_weighted_order():
+    scheduler = RequestScheduler(3, [10, 10, 10], SchedulePolicy.WEIGHTED)
+    Fill(scheduler, 8)
+    assert Levels(scheduler, 7) == [2, 1, 2, 0, 2, 1, 2]
+    assert Levels(scheduler, 7) == [2, 1, 2, 0, 2, 1, 2]
+
+def test_weighted_skips_empty_levels():
+    scheduler = RequestScheduler(3, [10, 10, 10], SchedulePolicy.WEIGHTED, [1, 1, 2])
+    for i in range(3):
+        scheduler.Put(0, (0, i))
+        scheduler.Put(2, (2, i))
+    assert sorted(Levels(scheduler, 6)) == [0, 0, 0, 2, 2, 2]
+    assert scheduler.Sizes() == [0, 0, 0]
+
+def test_queue_len_per_level():
+    scheduler = RequestScheduler(2, [1, 2])
+    assert scheduler.Put(0, "a")
+    assert not scheduler.Put(0, "b")
+    assert scheduler.Put(1, "c") and scheduler.Put(1, "d")
+    assert not scheduler.Put(1, "e")
+    assert scheduler.Sizes() == [1, 2]
+
+def test_min_level():
+    scheduler = RequestScheduler(2, policy=SchedulePolicy.WEIGHTED)
+    scheduler.Put(0, "low")
+    assert scheduler.Get(1, timeout=0.05) is None
+    scheduler.Put(1, "high")
+    assert scheduler.Get(1, timeout=0) == "high"
+    assert scheduler.Get(0, timeout=0) == "low"
+
+def test_priority_clamped_to_levels():
+    scheduler = RequestScheduler(3)
+    assert [scheduler.GetLevel(p) for p in (-1, 0, 2, 9)] == [0, 0, 2, 2]
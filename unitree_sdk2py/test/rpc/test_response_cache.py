@@ -0,0 +1,130 @@
+import time
+import threading
+
+import pytest
+
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import Response_ as Response
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import ResponseHeader_ as ResponseHeader
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import RequestIdentity_ as RequestIdentity
+from unitree_sdk2py.idl.unitree_api.msg.dds_ import ResponseStatus_ as ResponseStatus
+from unitree_sdk2py.rpc.response_cache import ResponseCache
+from unitree_sdk2py.rpc.request_future import RequestFuture
+from unitree_sdk2py.rpc.client_future import ClientFuture
+from unitree_sdk2py.rpc.internal import RPC_ERR_CLIENT_API_TIMEOUT
+
+API_ID_GET = 1001
+API_ID_SET = 1002
+
+
+"""
+" class Sender
+" stands in for the client's send, counts the requests and returns a future answered later
+"""
+class Sender:
+    def __init__(self):
+        self.sent = 0
+        self.futures = []
+
+    def __call__(self):
+        self.sent += 1
+        future = RequestFuture()
+        future.SetRequestId(self.sent)
+        self.futures.append(future)
+        return ClientFuture(API_ID_GET, future, timeout=1.0)
+
+    def Answer(self, code: int = 0, data: str = "v"):
+        for id, future in enumerate(self.futures, 1):
+            future.Ready(Response(ResponseHeader(RequestIdentity(id, API_ID_GET), ResponseStatus(code)), data, b""))
+
+
+def MakeCache(ttl: float = 5.0):
+    cache = ResponseCache()
+    cache.SetTtl(API_ID_GET, ttl)
+    return cache
+
+"""
+" concurrent identical calls share the request in flight, one send answers all of them
+"""
+def test_single_flight():
+    cache = MakeCache()
+    send = Sender()
+    results = []
+
+    def Call():
+        results.append(cache.Call(API_ID_GET, "{}", 1.0, send).GetResult())
+
+    threads = [threading.Thread(target=Call) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    send.Answer()
+    for thread in threads:
+        thread.join(1.0)
+
+    assert send.sent == 1
+    assert results == [(0, "v")] * 8
+    stats = cache.GetStats()
+    assert (stats["misses"], stats["coalesced"]) == (1, 7)
+
+def test_hit_after_fill():
+    cache = MakeCache()
+    send = Sender()
+    future = cache.Call(API_ID_GET, "{}", 1.0, send)
+    send.Answer()
+    assert future.GetResult() == (0, "v")
+
+    assert cache.Call(API_ID_GET, "{}", 1.0, send).GetResult() == (0, "v")
+    assert cache.Call(API_ID_GET, "{}", 1.0, send, lambda code, data: data).GetResult() == "v"
+    assert send.sent == 1
+    assert cache.GetStats()["hits"] == 2
+
+    # another parameter is another entry
+    cache.Call(API_ID_GET, '{"a": 1}', 1.0, send)
+    assert send.sent == 2
+
+def test_ttl_expiry():
+    cache = MakeCache(0.05)
+    send = Sender()
+    cache.Call(API_ID_GET, "{}", 1.0, send)
+    send.Answer()
+    time.sleep(0.1)
+    cache.Call(API_ID_GET, "{}", 1.0, send)
+    assert send.sent == 2
+
+def test_errors_are_not_cached():
+    cache = MakeCache()
+    send = Sender()
+    future = cache.Call(API_ID_GET, "{}", 1.0, send)
+    send.Answer(RPC_ERR_CLIENT_API_TIMEOUT)
+    assert future.GetResult()[0] == RPC_ERR_CLIENT_API_TIMEOUT
+    assert cache.GetStats()["size"] == 0
+
+def test_setter_invalidates():
+    cache = MakeCache()
+    cache.AddInvalidation(API_ID_GET, [API_ID_SET])
+    send = Sender()
+    cache.Call(API_ID_GET, "{}", 1.0, send)
+    send.Answer()
+    assert cache.GetStats()["size"] == 1
+
+    cache.OnSetter(API_ID_SET)
+    assert cache.GetStats()["size"] == 0
+    cache.Call(API_ID_GET, "{}", 1.0, send)
+    assert send.sent == 2
+
+"""
+" a failed send drops the placeholder, the next call sends again
+"""
+def test_failed_send_drops_placeholder():
+    cache = MakeCache()
+
+    def Fail():
+        raise ConnectionError("send failed")
+
+    with pytest.raises(ConnectionError):
+        cache.Call(API_ID_GET, "{}", 1.0, Fail)
+    assert cache.GetStats()["size"] == 0
+
+    send = Sender()
+    cache.Call(API_ID_GET, "{}", 1.0, send)
+    assert send.sent == 1
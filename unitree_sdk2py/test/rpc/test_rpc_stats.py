@@ -0,0 +1,115 @@
+import time
+
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.server import Server
+from unitree_sdk2py.rpc.internal import RPC_ERR_CLIENT_API_TIMEOUT, RPC_ERR_SERVER_API_PARAMETER
+from unitree_sdk2py.utils.histogram import Histogram
+
+STATS_SERVICE_NAME = "test_rpc_stats"
+STATS_API_ID_SLOW = 1001
+STATS_API_ID_FAIL = 1002
+STATS_SLOW_TIME = 0.1
+
+"""
+" class StatsServer
+"""
+class StatsServer(Server):
+    def __init__(self):
+        super().__init__(STATS_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistHandler(STATS_API_ID_SLOW, self.Slow, False)
+        self._RegistHandler(STATS_API_ID_FAIL, self.Fail, False)
+
+    def Slow(self, parameter: str):
+        time.sleep(STATS_SLOW_TIME)
+        return 0, parameter
+
+    def Fail(self, parameter: str):
+        return RPC_ERR_SERVER_API_PARAMETER, ""
+
+class StatsClient(Client):
+    def __init__(self):
+        super().__init__(STATS_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistApi(STATS_API_ID_SLOW, 0)
+        self._RegistApi(STATS_API_ID_FAIL, 0)
+
+"""
+" bucket i holds [2^(i-1), 2^i), bucket 0 everything below 1
+"""
+def test_histogram_buckets():
+    histogram = Histogram(16)
+    for x in [0.5, 1, 3, 3.9, 4, 1024, 1 << 20]:
+        histogram.Add(x)
+
+    buckets = histogram.Snapshot()["buckets"]
+    assert buckets[0] == 1
+    assert buckets[1] == 1
+    assert buckets[2] == 2
+    assert buckets[3] == 1
+    assert buckets[11] == 1
+    assert buckets[15] == 1
+    assert sum(buckets) == 7
+    assert histogram.Percentile(50) == 4.0
+    assert histogram.Percentile(100) == 1 << 20
+
+"""
+" errors and timeouts are counted per api and code, the server reports queue wait apart from handler time
+"""
+def test_api_stats():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    server = StatsServer()
+    server.Init()
+    server.Start(False, 1)
+
+    client = StatsClient()
+    client.Init()
+    client.SetTimeout(2.0)
+    assert client.WaitReady(2.0)
+
+    # one worker, the second slow call waits in the queue for the first
+    futures = [client._CallAsync(STATS_API_ID_SLOW, "{}") for i in range(2)]
+    assert [future.GetResult()[0] for future in futures] == [0, 0]
+    assert client._Call(STATS_API_ID_FAIL, "{}")[0] == RPC_ERR_SERVER_API_PARAMETER
+    assert client._Call(STATS_API_ID_SLOW, "{}", timeout=0.02)[0] == RPC_ERR_CLIENT_API_TIMEOUT
+    time.sleep(STATS_SLOW_TIME * 1.5)
+
+    slow = client.GetApiStats()["apis"][STATS_API_ID_SLOW]
+    assert (slow["calls"], slow["errors"], slow["timeouts"]) == (3, 1, 1)
+    assert slow["codes"] == {RPC_ERR_CLIENT_API_TIMEOUT: 1}
+    assert slow["latency"]["count"] == 3
+    assert slow["latency"]["max"] >= 2 * STATS_SLOW_TIME * 1e6 * 0.9
+    assert "queueWait" not in slow
+
+    fail = client.GetApiStats()["apis"][STATS_API_ID_FAIL]
+    assert (fail["calls"], fail["errors"], fail["timeouts"]) == (1, 1, 0)
+    assert fail["codes"] == {RPC_ERR_SERVER_API_PARAMETER: 1}
+
+    slow = server.GetApiStats()["apis"][STATS_API_ID_SLOW]
+    assert (slow["calls"], slow["errors"]) == (3, 0)
+    assert slow["handlerTime"]["count"] == 3
+    assert slow["handlerTime"]["min"] >= STATS_SLOW_TIME * 1e6 * 0.9
+    assert slow["queueWait"]["count"] == 3
+    # the second call waited for the first, the others found the worker idle
+    assert slow["queueWait"]["max"] >= STATS_SLOW_TIME * 1e6 * 0.8
+    assert slow["queueWait"]["min"] < STATS_SLOW_TIME * 1e6 * 0.5
+    assert slow["latency"]["max"] >= slow["queueWait"]["max"] + slow["handlerTime"]["min"] * 0.9
+    assert sum(slow["handlerTime"]["buckets"]) == 3
+
+    fail = server.GetApiStats()["apis"][STATS_API_ID_FAIL]
+    assert (fail["calls"], fail["errors"]) == (1, 1)
+    assert fail["codes"] == {RPC_ERR_SERVER_API_PARAMETER: 1}
+
+    server.ResetApiStats()
+    assert server.GetApiStats()["apis"] == {}
+    client.Close()
+
+if __name__ == "__main__":
+    test_histogram_buckets()
+    test_api_stats()
+    print("rpc stats: ok")
@@ -0,0 +1,63 @@
+from unitree_sdk2py.core.channel import ChannelFactoryInitialize
+from unitree_sdk2py.core.channel_inproc import CHANNEL_TRANSPORT_INPROC
+from unitree_sdk2py.rpc.client import Client
+from unitree_sdk2py.rpc.server_base import ServerBase
+from unitree_sdk2py.rpc.internal import RPC_ERR_SERVER_INTERNAL
+
+ERROR_SERVICE_NAME = "test_handler_error"
+ERROR_API_ID_RAISE = 1001
+
+"""
+" class RaisingServer
+" a request handler that raises before answering, like a failing lease check
+"""
+class RaisingServer(ServerBase):
+    def __init__(self):
+        super().__init__(ERROR_SERVICE_NAME)
+        self.calls = 0
+
+    def Start(self):
+        self._SetApiConcurrency(ERROR_API_ID_RAISE, 1)
+        self._SetServerRequestHandler(self.Handle)
+        self._Start(False, 1)
+
+    def Handle(self, request):
+        self.calls += 1
+        raise RuntimeError("handler failure")
+
+class ErrorClient(Client):
+    def __init__(self):
+        super().__init__(ERROR_SERVICE_NAME)
+
+    def Init(self):
+        self._RegistApi(ERROR_API_ID_RAISE, 0)
+
+"""
+" a raising handler is answered with RPC_ERR_SERVER_INTERNAL, and neither the worker nor the
+" serial lane of the api is lost, so later calls are still dispatched
+"""
+def test_raising_handler_keeps_worker_and_lane():
+    ChannelFactoryInitialize(0, transport=CHANNEL_TRANSPORT_INPROC)
+
+    server = RaisingServer()
+    server.Start()
+
+    client = ErrorClient()
+    client.Init()
+    client.SetTimeout(2.0)
+    assert client.WaitReady(2.0)
+
+    for i in range(3):
+        assert client._Call(ERROR_API_ID_RAISE, "{}")[0] == RPC_ERR_SERVER_INTERNAL
+
+    assert server.calls == 3
+    assert server.GetQueueStats()["handled"] == 3
+    stats = server.GetApiStats()["apis"][ERROR_API_ID_RAISE]
+    assert stats["errors"] == 3
+    assert stats["codes"] == {RPC_ERR_SERVER_INTERNAL: 3}
+
+    client.Close()
+
+if __name__ == "__main__":
+    test_raising_handler_keeps_worker_and_lane()
+    print("server handler error: ok")
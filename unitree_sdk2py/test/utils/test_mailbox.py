@@ -0,0 +1,50 @@
+import time
+import threading
+
+from unitree_sdk2py.utils.mailbox import Mailbox
+
+
+"""
+" Close wakes a thread blocked in WaitNewer, which returns None at once
+"""
+def test_close_wakes_waiter():
+    mailbox = Mailbox()
+    result = {}
+
+    def Wait():
+        start = time.monotonic()
+        result["item"] = mailbox.WaitNewer(0, 2.0)
+        result["elapsed"] = time.monotonic() - start
+
+    thread = threading.Thread(target=Wait, daemon=True)
+    thread.start()
+    time.sleep(0.1)
+
+    mailbox.Close()
+    thread.join(1.0)
+
+    assert not thread.is_alive()
+    assert result["item"] is None
+    assert result["elapsed"] < 0.5
+    assert mailbox.WaitNewer(0, 1.0) is None
+
+"""
+" Put wakes a thread blocked in WaitNewer with the new item
+"""
+def test_put_wakes_waiter():
+    mailbox = Mailbox()
+    result = {}
+
+    thread = threading.Thread(target=lambda: result.update(item=mailbox.WaitNewer(0, 2.0)), daemon=True)
+    thread.start()
+    time.sleep(0.1)
+
+    mailbox.Put("x")
+    thread.join(1.0)
+
+    assert result["item"][0] == 1 and result["item"][2] == "x"
+
+if __name__ == "__main__":
+    test_close_wakes_waiter()
+    test_put_wakes_waiter()
+    print("mailbox: ok")
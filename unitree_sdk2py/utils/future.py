@@ -32,6 +32,7 @@ class Future:
         self.__state = FutureState.DEFER
         self.__msg = None
         self.__condition = Condition()
+        self.__callbacks = []
     
     def GetResult(self, timeout: float = None):
         with self.__condition:
@@ -44,14 +45,40 @@ class Future:
     def Ready(self, value):
         with self.__condition:
             ready = self.__Ready(value)
-            self.__condition.notify()
-            return ready
+            self.__condition.notify_all()
+        if ready:
+            self.__RunCallbacks()
+        return ready
 
     def Fail(self, reason: str):
         with self.__condition:
             fail = self.__Fail(reason)
-            self.__condition.notify()
-            return fail
+            self.__condition.notify_all()
+        if fail:
+            self.__RunCallbacks()
+        return fail
+
+    def Done(self):
+        with self.__condition:
+            return not self.__IsDeferred()
+
+    # callback(future) runs on the thread that completes the future, or at once if already done
+    def AddDoneCallback(self, callback):
+        with self.__condition:
+            if self.__IsDeferred():
+                self.__callbacks.append(callback)
+                return
+        callback(self)
+
+    def __RunCallbacks(self):
+        with self.__condition:
+            callbacks = self.__callbacks
+            self.__callbacks = []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print("[Future] done callback error. msg:", e)
 
     def __Wait(self, timeout: float = None):
         if not self.__IsDeferred():
@@ -0,0 +1,82 @@
+import math
+
+"""
+" class RunningStat
+" running mean and standard deviation (welford).
+"""
+class RunningStat:
+    def __init__(self):
+        self.Reset()
+
+    def Reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def Add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    def Std(self):
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def Snapshot(self):
+        return {"count": self.count, "mean": self.mean, "std": self.Std(), "min": self.min, "max": self.max}
+
+
+"""
+" class Histogram
+" log2 buckets, bucket i counts values in [2^(i-1), 2^i), bucket 0 counts values below 1.
+"""
+class Histogram:
+    def __init__(self, bucketCount: int = 32):
+        self.__bucketCount = bucketCount
+        self.Reset()
+
+    def Reset(self):
+        self.buckets = [0] * self.__bucketCount
+        self.stat = RunningStat()
+
+    def Add(self, x: float):
+        index = 0 if x < 1.0 else min(self.__bucketCount - 1, int(x).bit_length())
+        self.buckets[index] += 1
+        self.stat.Add(x)
+
+    def Count(self):
+        return self.stat.count
+
+    # upper bound of the bucket holding the p-th percentile, clamped to the observed max. the last
+    # bucket also holds everything above its range, so it reports the observed max.
+    def Percentile(self, p: float):
+        count = self.stat.count
+        if count == 0:
+            return 0.0
+
+        rank = max(1, int(math.ceil(p / 100.0 * count)))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                if index == self.__bucketCount - 1:
+                    return self.stat.max
+                return min(float(1 << index), self.stat.max)
+
+        return self.stat.max
+
+    def Snapshot(self):
+        snapshot = self.stat.Snapshot()
+        snapshot["p50"] = self.Percentile(50)
+        snapshot["p95"] = self.Percentile(95)
+        snapshot["p99"] = self.Percentile(99)
+        snapshot["buckets"] = list(self.buckets)
+        return snapshot
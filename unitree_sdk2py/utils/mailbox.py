@@ -0,0 +1,52 @@
+import time
+from typing import Any
+from threading import Condition
+
+"""
+" class Mailbox
+" keeps only the latest value with its sequence number and arrival time (time.monotonic).
+"""
+class Mailbox:
+    def __init__(self):
+        self.__item = (0, 0.0, None)
+        self.__condition = Condition()
+        self.__closed = False
+
+    def Put(self, x: Any):
+        with self.__condition:
+            seq = self.__item[0] + 1
+            self.__item = (seq, time.monotonic(), x)
+            self.__condition.notify_all()
+            return seq
+
+    # return (seq, stamp, value). seq is 0 if nothing arrived yet.
+    def Latest(self):
+        return self.__item
+
+    # wait until an item newer than seq arrives. return (seq, stamp, value) or None on timeout or close.
+    def WaitNewer(self, seq: int = 0, timeout: float = None):
+        item = self.__item
+        if item[0] > seq and not self.__closed:
+            return item
+
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__closed or self.__item[0] > seq, timeout):
+                return None
+            return None if self.__closed else self.__item
+
+    def Clear(self):
+        with self.__condition:
+            self.__item = (self.__item[0], 0.0, None)
+
+    def Interrupt(self):
+        with self.__condition:
+            self.__condition.notify_all()
+
+    # wake every waiter for good, WaitNewer returns None from now on
+    def Close(self):
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def IsClosed(self):
+        return self.__closed